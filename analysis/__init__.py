@@ -0,0 +1,66 @@
+"""
+Analysis helpers promoted from the pick_level notebooks.
+
+- calibration: vectorized percentile calibration of a normal line model (one norm.cdf
+  call for all picks, np.histogram bins, broadcasted std sweeps per segment).
+- bench_calibration: benchmark of the vectorized engine against the notebook loop.
+- pick_level: local Parquet cache of the notebooks' RankedPicks query, refreshed
+  incrementally from the created_at_est watermark.
+- segmentation: threshold specs per stat type, searchsorted segment assignment and
+  one-pass segment statistics / quantile thresholds.
+- pricing: de-vig OpticOdds over/under pairs and fit implied Normal(mean, std) and
+  fair lines per (fixture, market, player) over the whole odds table.
+"""
+
+from analysis.calibration import (
+    calibration_histogram,
+    calibration_metrics,
+    compute_calibration,
+    evaluate_segmentation,
+    pick_percentiles,
+    segment_std_sweep,
+    std_sweep,
+)
+from analysis.pick_level import PickLevelCache, load_picks
+from analysis.segmentation import (
+    SEGMENT_SPECS,
+    SegmentSpec,
+    SegmentStd,
+    quantile_spec,
+    segment_stats,
+    spec_for,
+)
+from analysis.pricing import (
+    american_to_probability,
+    devig_over_under,
+    fit_distributions,
+    odds_frame,
+    price_line,
+    price_odds,
+    probability_to_american,
+)
+
+__all__ = [
+    "PickLevelCache",
+    "SEGMENT_SPECS",
+    "SegmentSpec",
+    "SegmentStd",
+    "american_to_probability",
+    "calibration_histogram",
+    "calibration_metrics",
+    "compute_calibration",
+    "devig_over_under",
+    "evaluate_segmentation",
+    "fit_distributions",
+    "load_picks",
+    "odds_frame",
+    "pick_percentiles",
+    "price_line",
+    "price_odds",
+    "probability_to_american",
+    "quantile_spec",
+    "segment_stats",
+    "segment_std_sweep",
+    "spec_for",
+    "std_sweep",
+]
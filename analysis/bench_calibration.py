@@ -0,0 +1,116 @@
+"""
+Benchmark the vectorized calibration engine against the notebooks' iterrows loop.
+
+Generates synthetic picks shaped like TENNIS pick_level rows (pred_line_score on the
+half-point grid, integer scores), then times:
+1. percentiles for one segment: iterrows + stats.norm per pick vs one norm.cdf;
+2. a std sweep for one segment: the loop once per candidate std vs std_sweep;
+3. evaluate_segmentation over quartile segments: loop vs vectorized.
+The loop is run on at most --loop-rows picks and extrapolated linearly above that.
+
+Run from project root:
+  uv run python -m analysis.bench_calibration --rows 500000 --stds 40
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from analysis.calibration import (
+    DECILE_BINS,
+    calibration_histogram,
+    compute_calibration,
+    evaluate_segmentation,
+    std_sweep,
+)
+
+
+def legacy_compute_calibration(df_segment, segment_name, std_override=None):
+    """The notebooks' implementation, kept verbatim as the baseline."""
+    if len(df_segment) < 10:
+        return None
+    segment_std = std_override if std_override else df_segment["score"].std()
+    percentiles = []
+    for _, row in df_segment.iterrows():
+        dist = stats.norm(loc=row["pred_line_score"], scale=segment_std)
+        percentiles.append(dist.cdf(row["score"]))
+    return np.array(percentiles)
+
+
+def legacy_mace(percentiles):
+    bins = np.linspace(0, 1, 11)
+    observed_freq = []
+    for i in range(len(bins) - 1):
+        in_bin = (percentiles >= bins[i]) & (percentiles < bins[i + 1])
+        observed_freq.append(in_bin.mean())
+    return np.mean(np.abs(np.array(observed_freq) - 0.1))
+
+
+def synthetic_picks(rows: int, seed: int = 7) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    lines = np.round(rng.uniform(6, 26, rows) * 2) / 2
+    scores = np.maximum(0, np.round(rng.normal(lines, 0.22 * lines + 1.5)))
+    return pd.DataFrame({"pred_line_score": lines, "score": scores})
+
+
+def timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark vectorized calibration vs the iterrows loop")
+    parser.add_argument("--rows", type=int, default=200_000, help="Synthetic picks (default: 200000)")
+    parser.add_argument("--stds", type=int, default=30, help="Candidate stds in the sweep (default: 30)")
+    parser.add_argument(
+        "--loop-rows",
+        type=int,
+        default=20_000,
+        help="Max picks the legacy loop runs on before extrapolating (default: 20000)",
+    )
+    args = parser.parse_args()
+
+    df = synthetic_picks(args.rows)
+    sample = df.iloc[: min(args.rows, args.loop_rows)]
+    scale = len(df) / len(sample)
+    candidates = np.linspace(2.0, 8.0, args.stds)
+
+    print(f"{len(df):,} picks, loop measured on {len(sample):,} and scaled x{scale:.1f}")
+    print(f"{'step':<28} {'loop':>12} {'vectorized':>12} {'speedup':>10}")
+
+    old, old_s = timed(legacy_compute_calibration, sample, "all")
+    new, _ = timed(compute_calibration, sample, "all")
+    assert np.allclose(old, new), "vectorized percentiles differ from the loop"
+    _, new_s = timed(compute_calibration, df, "all")
+    old_s *= scale
+    print(f"{'percentiles':<28} {old_s:>11.2f}s {new_s:>11.3f}s {old_s / new_s:>9.0f}x")
+
+    loop_one = old_s / scale
+    sweep, new_s = timed(std_sweep, df["pred_line_score"], df["score"], candidates, DECILE_BINS)
+    # Compare on the loop's percentiles binned with a closed last bin (see calibration_histogram).
+    legacy = legacy_compute_calibration(sample, "all", std_override=candidates[0])
+    check = np.mean(np.abs(calibration_histogram(legacy) - 0.1))
+    expected = std_sweep(sample["pred_line_score"], sample["score"], candidates[:1])["mace"].iloc[0]
+    assert np.isclose(check, expected), "std_sweep MACE differs from the loop"
+    old_s = loop_one * scale * len(candidates)
+    print(f"{f'std sweep ({len(candidates)} stds)':<28} {old_s:>11.2f}s {new_s:>11.3f}s {old_s / new_s:>9.0f}x")
+    best = sweep.loc[sweep["mace"].idxmin()]
+    print(f"  best std {best['std']:.2f} (MACE {best['mace']:.4f}, empirical {df['score'].std():.2f})")
+
+    df["line_quartile"] = pd.qcut(df["pred_line_score"], q=4, labels=["Q1", "Q2", "Q3", "Q4"])
+    sample = df.iloc[: len(sample)]
+    start = time.perf_counter()
+    for segment in ["Q1", "Q2", "Q3", "Q4"]:
+        legacy_mace(legacy_compute_calibration(sample[sample["line_quartile"] == segment], segment))
+    old_s = (time.perf_counter() - start) * scale
+    (_, weighted), new_s = timed(evaluate_segmentation, df, "line_quartile", ["Q1", "Q2", "Q3", "Q4"])
+    print(f"{'evaluate_segmentation':<28} {old_s:>11.2f}s {new_s:>11.3f}s {old_s / new_s:>9.0f}x")
+    print(f"  weighted MACE {weighted:.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""
+Vectorized calibration of the normal line model used in the odds interpreter notebooks.
+
+Each pick is modelled as score ~ Normal(pred_line_score, segment std); its percentile
+is the CDF of the actual score under that distribution. A well-calibrated std gives
+uniform percentiles, so calibration is judged on decile frequencies (MACE), interval
+coverage and the median percentile.
+
+The notebooks' compute_calibration built a scipy.stats.norm object per row inside
+df.iterrows(). Here all percentiles come from a single norm.cdf call, bins are
+counted with np.histogram / np.bincount, and candidate std overrides are evaluated
+for every pick at once by broadcasting a (stds x picks) matrix.
+
+    from analysis.calibration import compute_calibration, calibration_metrics, segment_std_sweep
+
+    percentiles = compute_calibration(df_seg, "Q1")
+    calibration_metrics(percentiles)
+    segment_std_sweep(df, "segment", np.arange(2.0, 8.0, 0.1))
+"""
+
+from typing import Any, Iterable
+
+import numpy as np
+import pandas as pd
+from scipy.stats import norm
+
+DECILE_BINS = np.linspace(0, 1, 11)
+MIN_PICKS = 10
+# Cap on stds x picks cells evaluated per broadcasted block (~160 MB of float64).
+MAX_SWEEP_CELLS = 20_000_000
+
+
+def pick_percentiles(lines: Any, scores: Any, std: Any) -> np.ndarray:
+    """Percentile of each actual score under Normal(line, std); std may be a scalar or per-pick array."""
+    return norm.cdf(np.asarray(scores, dtype=float), loc=np.asarray(lines, dtype=float), scale=std)
+
+
+def compute_calibration(
+    df_segment: pd.DataFrame,
+    segment_name: str | None = None,
+    std_override: float | None = None,
+    line_col: str = "pred_line_score",
+    score_col: str = "score",
+) -> np.ndarray | None:
+    """
+    Drop-in replacement for the notebooks' compute_calibration: the percentile of every
+    pick's score under Normal(pred_line_score, segment std), using the segment's
+    empirical score std unless std_override is given. None for segments under 10 picks.
+    """
+    if len(df_segment) < MIN_PICKS:
+        return None
+    std = std_override if std_override else df_segment[score_col].std()
+    return pick_percentiles(df_segment[line_col].to_numpy(), df_segment[score_col].to_numpy(), std)
+
+
+def calibration_histogram(percentiles: np.ndarray, bins: np.ndarray = DECILE_BINS) -> np.ndarray:
+    """
+    Fraction of percentiles in each bin. Like the notebooks' per-bin masks except that
+    the last bin is closed, so a percentile of exactly 1.0 is counted instead of dropped.
+    """
+    counts, _ = np.histogram(percentiles, bins=bins)
+    return counts / len(percentiles) if len(percentiles) else counts.astype(float)
+
+
+def calibration_metrics(percentiles: np.ndarray, bins: np.ndarray = DECILE_BINS) -> dict[str, float]:
+    """Coverage of the 50/80/95% intervals, MACE over `bins` and the median percentile."""
+    expected = np.diff(bins)
+    return {
+        "n": len(percentiles),
+        "coverage_50": float(((percentiles >= 0.25) & (percentiles <= 0.75)).mean()),
+        "coverage_80": float(((percentiles >= 0.10) & (percentiles <= 0.90)).mean()),
+        "coverage_95": float(((percentiles >= 0.025) & (percentiles <= 0.975)).mean()),
+        "mace": float(np.mean(np.abs(calibration_histogram(percentiles, bins) - expected))),
+        "median_percentile": float(np.median(percentiles)),
+    }
+
+
+def _bin_index(percentiles: np.ndarray, bins: np.ndarray) -> np.ndarray:
+    """Bin of each percentile (last bin closed), same shape as the input."""
+    return np.clip(np.searchsorted(bins, percentiles, side="right") - 1, 0, len(bins) - 2)
+
+
+def std_sweep(
+    lines: Any,
+    scores: Any,
+    stds: Iterable[float],
+    bins: np.ndarray = DECILE_BINS,
+) -> pd.DataFrame:
+    """
+    Calibration of every candidate std for one set of picks. Percentiles for all
+    (std, pick) pairs are computed as one broadcasted norm.cdf, in blocks of stds so
+    at most MAX_SWEEP_CELLS are held at once. One row per std: mace, coverage_80,
+    median_percentile.
+    """
+    lines = np.asarray(lines, dtype=float)
+    scores = np.asarray(scores, dtype=float)
+    stds = np.asarray(list(stds), dtype=float)
+    n, n_bins = len(lines), len(bins) - 1
+    expected = np.diff(bins)
+    block = max(1, MAX_SWEEP_CELLS // max(n, 1))
+    mace, coverage_80, median = [], [], []
+    for start in range(0, len(stds), block):
+        scale = stds[start : start + block, None]
+        p = norm.cdf(scores[None, :], loc=lines[None, :], scale=scale)
+        rows = np.arange(p.shape[0])[:, None]
+        counts = np.bincount((rows * n_bins + _bin_index(p, bins)).ravel(), minlength=p.shape[0] * n_bins)
+        freq = counts.reshape(p.shape[0], n_bins) / n
+        mace.append(np.abs(freq - expected).mean(axis=1))
+        coverage_80.append(((p >= 0.10) & (p <= 0.90)).mean(axis=1))
+        median.append(np.median(p, axis=1))
+    return pd.DataFrame(
+        {
+            "std": stds,
+            "mace": np.concatenate(mace) if mace else [],
+            "coverage_80": np.concatenate(coverage_80) if coverage_80 else [],
+            "median_percentile": np.concatenate(median) if median else [],
+        }
+    )
+
+
+def segment_std_sweep(
+    df: pd.DataFrame,
+    segment_col: str,
+    stds: Iterable[float],
+    line_col: str = "pred_line_score",
+    score_col: str = "score",
+    bins: np.ndarray = DECILE_BINS,
+) -> pd.DataFrame:
+    """
+    Sweep candidate stds for every segment with at least 10 picks. Returns one row per
+    (segment, std) with the empirical std alongside; pick the best per segment with
+    result.loc[result.groupby("segment")["mace"].idxmin()].
+    """
+    stds = list(stds)
+    frames = []
+    for segment, group in df.groupby(segment_col, observed=True, sort=True):
+        if len(group) < MIN_PICKS:
+            continue
+        sweep = std_sweep(group[line_col].to_numpy(), group[score_col].to_numpy(), stds, bins)
+        sweep.insert(0, "segment", segment)
+        sweep.insert(1, "n", len(group))
+        sweep.insert(2, "empirical_std", group[score_col].std())
+        frames.append(sweep)
+    if not frames:
+        return pd.DataFrame(columns=["segment", "n", "empirical_std", "std", "mace", "coverage_80", "median_percentile"])
+    return pd.concat(frames, ignore_index=True)
+
+
+def evaluate_segmentation(
+    df: pd.DataFrame,
+    segment_col: str,
+    segment_order: Iterable[Any] | None = None,
+    line_col: str = "pred_line_score",
+    score_col: str = "score",
+    bins: np.ndarray = DECILE_BINS,
+) -> tuple[list[dict], float]:
+    """
+    Vectorized version of match_exp.ipynb's evaluate_segmentation: each segment's
+    picks use that segment's empirical std; returns per-segment {segment, n, std, mace}
+    and the n-weighted MACE. Percentiles for all picks come from one norm.cdf call and
+    the per-segment decile counts from one bincount.
+    """
+    data = df[[segment_col, line_col, score_col]].dropna(subset=[segment_col])
+    sizes = data.groupby(segment_col, observed=True)[score_col].transform("size")
+    data = data[sizes >= MIN_PICKS]
+    if data.empty:
+        return [], float("inf")
+    codes, segments = pd.factorize(data[segment_col], sort=True)
+    std = data.groupby(segment_col, observed=True)[score_col].transform("std").to_numpy()
+    p = pick_percentiles(data[line_col].to_numpy(), data[score_col].to_numpy(), std)
+
+    n_bins = len(bins) - 1
+    counts = np.bincount(codes * n_bins + _bin_index(p, bins), minlength=len(segments) * n_bins)
+    counts = counts.reshape(len(segments), n_bins)
+    n = counts.sum(axis=1)
+    mace = np.abs(counts / n[:, None] - np.diff(bins)).mean(axis=1)
+    stds = np.bincount(codes, weights=std) / n
+
+    order = list(segment_order) if segment_order is not None else list(segments)
+    position = {segment: i for i, segment in enumerate(segments)}
+    results = [
+        {"segment": s, "n": int(n[position[s]]), "std": float(stds[position[s]]), "mace": float(mace[position[s]])}
+        for s in order
+        if s in position
+    ]
+    total = sum(r["n"] for r in results)
+    weighted = sum(r["mace"] * r["n"] for r in results) / total if total else float("inf")
+    return results, weighted
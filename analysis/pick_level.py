@@ -0,0 +1,329 @@
+"""
+Local Parquet cache of the notebooks' RankedPicks query against pick_level.
+
+Every interpreter notebook ran the same window-function query (latest row per
+duplicate pick, ROW_NUMBER() ... ORDER BY created_at_est DESC) differing only in the
+stat type filter, and pulled the full result with .to_dataframe() each session. Here
+each query is stored as <cache dir>/<fingerprint>.parquet, where the fingerprint is a
+hash of the query text without the watermark filter. The max created_at_est and the
+query itself are kept in the Parquet schema metadata.
+
+On refresh only rows with created_at_est >= watermark - lookback are queried (the
+lookback re-reads late-arriving rows), fetched as Arrow through the BigQuery Storage
+read API when google-cloud-bigquery-storage is installed (REST otherwise), and merged
+locally: new and cached rows are de-duplicated on the query's PARTITION BY keys,
+keeping the latest created_at_est, which is what the full query would return.
+
+    from analysis.pick_level import load_picks
+
+    df = load_picks(stat_type_ids=[14])                # fantasy score
+    df = load_picks(stat_type_names=["Games Won"])     # match_exp.ipynb
+
+Cache directory: PICK_CACHE_DIR (default .pick_cache). Project: PICK_LEVEL_PROJECT
+(default prizepicksanalytics), using Application Default Credentials.
+
+Run from project root:
+  uv run python -m analysis.pick_level --stat-type-id 14 --stat-type-id 63
+  uv run python -m analysis.pick_level --stat-type-name "Games Won" --refresh full
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Iterable
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+PICK_LEVEL_TABLE = "prizepicksanalytics.pick_level.pick_level"
+DEFAULT_PROJECT = "prizepicksanalytics"
+DEFAULT_CACHE_DIR = ".pick_cache"
+DEFAULT_LOOKBACK = timedelta(days=2)
+REFRESH_MODES = ("incremental", "full", "never")
+WATERMARK_COLUMN = "created_at_est"
+
+PICK_COLUMNS = [
+    "overall_league",
+    "created_at_est",
+    "description",
+    "stat_type_id",
+    "league_name",
+    "player_name",
+    "pred_line_score",
+    "stat_type_name",
+    "outcome_was_over",
+    "outcome_was_under",
+    "score",
+]
+# The RankedPicks PARTITION BY keys; the latest created_at_est per key is kept.
+DEDUP_COLUMNS = [
+    "overall_league",
+    "description",
+    "stat_type_id",
+    "league_name",
+    "player_name",
+    "pred_line_score",
+    "stat_type_name",
+    "outcome_was_over",
+    "outcome_was_under",
+    "score",
+]
+
+RANKED_PICKS_SQL = """
+WITH RankedPicks AS (
+  SELECT
+    *,
+    ROW_NUMBER() OVER(
+      PARTITION BY
+        overall_league,
+        description,
+        stat_type_id,
+        league_name,
+        player_name,
+        CAST(pred_line_score AS STRING),
+        stat_type_name,
+        outcome_was_over,
+        outcome_was_under,
+        CAST(score AS STRING)
+      ORDER BY
+        created_at_est DESC
+    ) as rn
+  FROM
+    `{table}`
+  WHERE
+    {filters}
+    AND NOT demon_pick
+    AND NOT goblin_pick
+    AND NOT is_off_the_board
+    AND was_refunded_cancelled = 0{since}
+)
+SELECT
+  {columns}
+FROM
+  RankedPicks
+WHERE
+  rn = 1
+"""
+
+
+def _sql_list(values: Iterable[Any]) -> str:
+    return ", ".join(str(int(v)) if isinstance(v, int) else "'" + str(v).replace("'", "\\'") + "'" for v in values)
+
+
+def ranked_picks_query(
+    stat_type_ids: Iterable[int] | None = None,
+    stat_type_names: Iterable[str] | None = None,
+    league: str = "TENNIS",
+    incremental: bool = False,
+) -> str:
+    """
+    The notebooks' RankedPicks query for one league and stat type filter. With
+    incremental=True the source rows are restricted to created_at_est >= @since.
+    """
+    filters = [f"overall_league IN ({_sql_list([league])})"]
+    if stat_type_ids:
+        filters.append(f"league_name IN ({_sql_list([league])})")
+        filters.append(f"stat_type_id IN ({_sql_list(stat_type_ids)})")
+    if stat_type_names:
+        filters.append(f"stat_type_name IN ({_sql_list(stat_type_names)})")
+    return RANKED_PICKS_SQL.format(
+        table=PICK_LEVEL_TABLE,
+        filters="\n    AND ".join(filters),
+        since=f"\n    AND {WATERMARK_COLUMN} >= @since" if incremental else "",
+        columns=",\n  ".join(PICK_COLUMNS),
+    )
+
+
+def query_fingerprint(sql: str) -> str:
+    """Stable key of a query: sha256 of its whitespace-normalized text."""
+    return hashlib.sha256(re.sub(r"\s+", " ", sql).strip().encode()).hexdigest()[:16]
+
+
+def merge_picks(cached: pd.DataFrame, fresh: pd.DataFrame) -> pd.DataFrame:
+    """Union of cached and fresh rows, keeping the latest created_at_est per dedup key."""
+    if cached.empty:
+        combined = fresh
+    elif fresh.empty:
+        return cached
+    else:
+        combined = pd.concat([cached, fresh], ignore_index=True)
+    combined = combined.sort_values(WATERMARK_COLUMN, kind="stable")
+    return combined.drop_duplicates(DEDUP_COLUMNS, keep="last").sort_index().reset_index(drop=True)
+
+
+class PickLevelCache:
+    """
+    Parquet cache of pick_level query results keyed by query fingerprint. The
+    BigQuery client is created on the first fetch, so cache reads work offline.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path | None = None,
+        client: Any = None,
+        project: str | None = None,
+        lookback: timedelta = DEFAULT_LOOKBACK,
+    ) -> None:
+        self.directory = Path(directory or os.getenv("PICK_CACHE_DIR", DEFAULT_CACHE_DIR))
+        self.project = project or os.getenv("PICK_LEVEL_PROJECT", DEFAULT_PROJECT)
+        self.lookback = lookback
+        self._client = client
+        self.hits = 0
+        self.incremental_fetches = 0
+        self.full_fetches = 0
+        self.rows_fetched = 0
+        self.bytes_processed = 0
+
+    @property
+    def client(self) -> Any:
+        if self._client is None:
+            from google.cloud import bigquery
+
+            self._client = bigquery.Client(project=self.project)
+        return self._client
+
+    def path(self, sql: str) -> Path:
+        return self.directory / f"{query_fingerprint(sql)}.parquet"
+
+    def read(self, sql: str) -> tuple[pd.DataFrame, dict] | None:
+        """Cached rows and metadata for `sql`, or None if not cached."""
+        path = self.path(sql)
+        if not path.exists():
+            return None
+        table = pq.read_table(path)
+        meta = json.loads((table.schema.metadata or {}).get(b"pick_cache", b"{}"))
+        return table.to_pandas(), meta
+
+    def _write(self, sql: str, df: pd.DataFrame) -> dict:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        watermark = df[WATERMARK_COLUMN].max() if len(df) else None
+        meta = {
+            "sql": sql,
+            "rows": len(df),
+            "watermark": None if watermark is None or pd.isna(watermark) else pd.Timestamp(watermark).isoformat(),
+            "refreshed_at": datetime.now(timezone.utc).isoformat(),
+        }
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), b"pick_cache": json.dumps(meta).encode()})
+        path = self.path(sql)
+        tmp = path.with_suffix(".parquet.tmp")
+        pq.write_table(table, tmp)
+        os.replace(tmp, path)
+        return meta
+
+    def _fetch(self, sql: str, since: pd.Timestamp | None = None) -> pd.DataFrame:
+        from google.cloud import bigquery
+
+        params = []
+        if since is not None:
+            # created_at_est is a DATETIME in pick_level; tz-aware watermarks mean TIMESTAMP.
+            kind = "TIMESTAMP" if since.tzinfo is not None else "DATETIME"
+            params.append(bigquery.ScalarQueryParameter("since", kind, since.to_pydatetime()))
+        job = self.client.query(sql, job_config=bigquery.QueryJobConfig(query_parameters=params))
+        # Arrow via the Storage read API (falls back to REST without google-cloud-bigquery-storage).
+        arrow = job.to_arrow(create_bqstorage_client=True)
+        self.bytes_processed += job.total_bytes_processed or 0
+        self.rows_fetched += arrow.num_rows
+        return arrow.to_pandas()
+
+    def query(
+        self,
+        stat_type_ids: Iterable[int] | None = None,
+        stat_type_names: Iterable[str] | None = None,
+        league: str = "TENNIS",
+        refresh: str = "incremental",
+    ) -> pd.DataFrame:
+        """
+        Picks for the stat type filter. refresh="incremental" fetches rows since the
+        cached watermark (everything if uncached), "full" re-runs the whole query and
+        "never" serves the cache as is (fetching only if uncached).
+        """
+        if refresh not in REFRESH_MODES:
+            raise ValueError(f"refresh must be one of {REFRESH_MODES}, got {refresh!r}")
+        stat_type_ids = list(stat_type_ids or [])
+        stat_type_names = list(stat_type_names or [])
+        sql = ranked_picks_query(stat_type_ids, stat_type_names, league)
+        cached = None if refresh == "full" else self.read(sql)
+
+        if cached is not None:
+            self.hits += 1
+            if refresh == "never":
+                return cached[0]
+        watermark = cached[1].get("watermark") if cached is not None else None
+        if watermark is None:
+            self.full_fetches += 1
+            df = merge_picks(pd.DataFrame(columns=PICK_COLUMNS), self._fetch(sql))
+        else:
+            self.incremental_fetches += 1
+            since = pd.Timestamp(watermark) - self.lookback
+            fresh = self._fetch(ranked_picks_query(stat_type_ids, stat_type_names, league, incremental=True), since)
+            df = merge_picks(cached[0], fresh)
+        self._write(sql, df)
+        return df
+
+    def entries(self) -> list[dict]:
+        """Metadata of every cached query."""
+        if not self.directory.exists():
+            return []
+        entries = []
+        for path in sorted(self.directory.glob("*.parquet")):
+            meta = json.loads((pq.read_schema(path).metadata or {}).get(b"pick_cache", b"{}"))
+            entries.append({"fingerprint": path.stem, "bytes": path.stat().st_size, **meta})
+        return entries
+
+    def summary(self) -> str:
+        return (
+            f"{self.hits} cache hits, {self.incremental_fetches} incremental / {self.full_fetches} full fetches, "
+            f"{self.rows_fetched:,} rows fetched, {self.bytes_processed / 1e9:.2f} GB processed"
+        )
+
+
+_default_cache: PickLevelCache | None = None
+
+
+def load_picks(
+    stat_type_ids: Iterable[int] | None = None,
+    stat_type_names: Iterable[str] | None = None,
+    league: str = "TENNIS",
+    refresh: str = "incremental",
+) -> pd.DataFrame:
+    """Cached replacement for bq_client.query(tennis_games_won).to_dataframe() in the notebooks."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = PickLevelCache()
+    return _default_cache.query(stat_type_ids, stat_type_names, league, refresh)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Refresh the local Parquet cache of pick_level queries")
+    parser.add_argument("--stat-type-id", type=int, action="append", default=[], help="Repeatable, e.g. 14 or 63")
+    parser.add_argument("--stat-type-name", action="append", default=[], help='Repeatable, e.g. "Games Won"')
+    parser.add_argument("--league", default="TENNIS")
+    parser.add_argument("--refresh", choices=REFRESH_MODES, default="incremental")
+    parser.add_argument("--cache-dir", type=Path, default=None, help=f"Default: PICK_CACHE_DIR or {DEFAULT_CACHE_DIR}")
+    parser.add_argument("--list", action="store_true", help="List cached queries and exit")
+    args = parser.parse_args()
+
+    cache = PickLevelCache(args.cache_dir)
+    if args.list:
+        for entry in cache.entries():
+            print(f"{entry['fingerprint']}  {entry.get('rows', 0):>9,} rows  watermark {entry.get('watermark')}  "
+                  f"refreshed {entry.get('refreshed_at')}  {entry['bytes'] / 1e6:.1f} MB")
+        return
+    if not args.stat_type_id and not args.stat_type_name:
+        parser.error("pass --stat-type-id and/or --stat-type-name")
+    start = time.perf_counter()
+    df = cache.query(args.stat_type_id, args.stat_type_name, args.league, args.refresh)
+    path = cache.path(ranked_picks_query(args.stat_type_id, args.stat_type_name, args.league))
+    print(f"{len(df):,} picks in {time.perf_counter() - start:.1f}s -> {path}")
+    print(cache.summary())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+"""
+Bulk line-to-distribution pricing of OpticOdds over/under markets.
+
+1. devig_over_under pairs every over with its under per (fixture, sportsbook,
+   market_id, grouping_key). The grouping_key already carries the player and line,
+   e.g. "lorenzo_musetti:18.5" or "default:40.5". The vig is removed proportionally,
+   giving a fair P(stat > line) per book and line.
+2. fit_distributions fits Normal(mean, std) per (fixture, market, player) to every
+   fair probability across books and alternate lines. Each pair gives
+   line = mean + std * z with z = Phi^-1(1 - P(over)), so mean and std are the
+   least-squares intercept and slope over the pairs. Groups quoting one distinct line
+   cannot identify std, so they use a prior (per-market `default_std`, a float or a
+   per-line lookup such as analysis.segmentation.SegmentStd, else std_ratio * line)
+   and solve for the mean.
+3. The consensus fair line is the fitted mean (P(over) = P(under) = 0.5); price_line
+   prices any other line from the fit.
+
+Everything is NumPy over the whole odds table: group codes from pd.factorize and
+sums from np.bincount, with no Python loop per group.
+
+    from analysis.pricing import odds_frame, devig_over_under, fit_distributions
+
+    pairs = devig_over_under(odds_frame(odds))
+    fits = fit_distributions(pairs)
+
+Run from project root (reads australian_open_odds.json or .ndjson):
+  uv run python -m analysis.pricing australian_open_odds.json --out fair_lines.csv
+"""
+
+import argparse
+import json
+import time
+from pathlib import Path
+from typing import Any, Callable, Iterable, Mapping
+
+import numpy as np
+import pandas as pd
+from scipy.stats import norm
+
+from opticodds.records import OddsBatch
+
+ODDS_COLUMNS = [
+    "fixture_id",
+    "sportsbook",
+    "market_id",
+    "normalized_selection",
+    "selection_line",
+    "grouping_key",
+    "points",
+    "price",
+]
+DEFAULT_STD_RATIO = 0.25
+# Fair probabilities are clipped before Phi^-1 so a lopsided alt line cannot dominate the fit.
+PROBABILITY_CLIP = (0.02, 0.98)
+
+
+def american_to_probability(price: Any) -> np.ndarray:
+    """Implied probability (with vig) of American prices."""
+    price = np.asarray(price, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(price > 0, 100.0 / (price + 100.0), -price / (100.0 - price))
+
+
+def probability_to_american(probability: Any) -> np.ndarray:
+    """American price of a probability (no rounding)."""
+    p = np.asarray(probability, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(p >= 0.5, -100.0 * p / (1.0 - p), 100.0 * (1.0 - p) / p)
+
+
+def odds_frame(odds: Iterable[dict] | OddsBatch) -> pd.DataFrame:
+    """
+    DataFrame of the pricing columns from odds dicts (e.g. australian_open_odds.json)
+    or an opticodds.records.OddsBatch.
+    """
+    if isinstance(odds, OddsBatch):
+        return odds.to_frame(ODDS_COLUMNS)
+    frame = pd.DataFrame.from_records(list(odds), columns=ODDS_COLUMNS)
+    frame["points"] = pd.to_numeric(frame["points"], errors="coerce")
+    frame["price"] = pd.to_numeric(frame["price"], errors="coerce")
+    return frame
+
+
+def _codes(frame: pd.DataFrame, columns: list[str]) -> tuple[np.ndarray, pd.DataFrame]:
+    """Dense group codes over `columns` and the first row of each group."""
+    codes = np.zeros(len(frame), dtype=np.int64)
+    for column in columns:
+        column_codes, uniques = pd.factorize(frame[column].fillna(""), sort=False)
+        codes = pd.factorize(codes * len(uniques) + column_codes, sort=False)[0]
+    _, first = np.unique(codes, return_index=True)
+    return codes, frame.iloc[first][columns].reset_index(drop=True)
+
+
+def devig_over_under(frame: pd.DataFrame) -> pd.DataFrame:
+    """
+    One row per complete over/under pair: fixture_id, sportsbook, market_id, player,
+    grouping_key, line, over_price, under_price, over_prob and under_prob (vig removed
+    proportionally) and margin (overround). Keys without exactly one over and one
+    under are dropped.
+    """
+    f = frame[
+        frame["selection_line"].isin(("over", "under")) & frame["points"].notna() & frame["price"].notna()
+    ].reset_index(drop=True)
+    keys = ["fixture_id", "sportsbook", "market_id", "grouping_key"]
+    if f.empty:
+        return pd.DataFrame(
+            columns=keys[:3] + ["player", "grouping_key", "line", "over_price", "under_price", "over_prob", "under_prob", "margin"]
+        )
+    codes, groups = _codes(f, keys)
+    n = len(groups)
+    is_over = (f["selection_line"] == "over").to_numpy()
+    price = f["price"].to_numpy(dtype=float)
+    implied = american_to_probability(price)
+    over_count = np.bincount(codes, weights=is_over, minlength=n)
+    under_count = np.bincount(codes, weights=~is_over, minlength=n)
+    over_implied = np.bincount(codes, weights=implied * is_over, minlength=n)
+    under_implied = np.bincount(codes, weights=implied * ~is_over, minlength=n)
+    over_price = np.bincount(codes, weights=price * is_over, minlength=n)
+    under_price = np.bincount(codes, weights=price * ~is_over, minlength=n)
+    line = np.bincount(codes, weights=f["points"].to_numpy(dtype=float), minlength=n) / np.maximum(
+        over_count + under_count, 1
+    )
+    player = np.empty(n, dtype=object)
+    player[codes] = f["normalized_selection"].fillna("").to_numpy()
+
+    total = over_implied + under_implied
+    valid = (over_count == 1) & (under_count == 1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        over_prob = over_implied / total
+    pairs = groups.assign(
+        player=player,
+        line=line,
+        over_price=over_price,
+        under_price=under_price,
+        over_prob=over_prob,
+        under_prob=1.0 - over_prob,
+        margin=total - 1.0,
+    )[valid]
+    return pairs[
+        ["fixture_id", "sportsbook", "market_id", "player", "grouping_key", "line", "over_price", "under_price", "over_prob", "under_prob", "margin"]
+    ].reset_index(drop=True)
+
+
+def fit_distributions(
+    pairs: pd.DataFrame,
+    default_std: Mapping[str, float | Callable[[np.ndarray], np.ndarray]] | None = None,
+    std_ratio: float = DEFAULT_STD_RATIO,
+) -> pd.DataFrame:
+    """
+    Fit Normal(mean, std) per (fixture_id, market_id, player) to de-vigged pairs.
+    Columns: fixture_id, market_id, player, books, pairs, lines, mean, std, std_source
+    ("fit" or "prior"), fair_line (= mean), main_line (most quoted line),
+    main_over_prob (fitted P(over main_line)) and mean_margin.
+    """
+    keys = ["fixture_id", "market_id", "player"]
+    if pairs.empty:
+        return pd.DataFrame(
+            columns=keys + ["books", "pairs", "lines", "mean", "std", "std_source", "fair_line", "main_line", "main_over_prob", "mean_margin"]
+        )
+    codes, groups = _codes(pairs, keys)
+    n_groups = len(groups)
+    line = pairs["line"].to_numpy(dtype=float)
+    q = np.clip(pairs["over_prob"].to_numpy(dtype=float), *PROBABILITY_CLIP)
+    z = norm.ppf(1.0 - q)
+
+    count = np.bincount(codes, minlength=n_groups).astype(float)
+    mean_z = np.bincount(codes, weights=z, minlength=n_groups) / count
+    mean_line = np.bincount(codes, weights=line, minlength=n_groups) / count
+    var_z = np.bincount(codes, weights=z * z, minlength=n_groups) / count - mean_z**2
+    cov = np.bincount(codes, weights=z * line, minlength=n_groups) / count - mean_z * mean_line
+
+    # Distinct lines, distinct books and the most quoted line per group.
+    line_codes = pd.factorize(codes * len(np.unique(line)) + pd.factorize(line)[0])[0]
+    line_counts = np.bincount(line_codes)
+    _, first_line = np.unique(line_codes, return_index=True)
+    lines = np.bincount(codes[first_line], minlength=n_groups)
+    order = np.lexsort((-line_counts, codes[first_line]))
+    main_line = line[first_line[order][np.unique(codes[first_line][order], return_index=True)[1]]]
+    book_ids, books_seen = pd.factorize(pairs["sportsbook"])
+    _, first_book = np.unique(codes * len(books_seen) + book_ids, return_index=True)
+    books = np.bincount(codes[first_book], minlength=n_groups)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        fitted = cov / var_z
+    use_fit = (lines >= 2) & (var_z > 1e-9) & (fitted > 0)
+    prior = np.abs(mean_line) * std_ratio
+    if default_std:
+        market_ids = groups["market_id"].to_numpy()
+        by_market = np.full(n_groups, np.nan)
+        for market_id, value in default_std.items():
+            rows = market_ids == market_id
+            if rows.any():
+                by_market[rows] = value(mean_line[rows]) if callable(value) else value
+        prior = np.where(np.isnan(by_market), prior, by_market)
+    std = np.where(use_fit, fitted, prior)
+    mean = mean_line - std * mean_z
+
+    return groups.assign(
+        books=books,
+        pairs=count.astype(int),
+        lines=lines,
+        mean=mean,
+        std=std,
+        std_source=np.where(use_fit, "fit", "prior"),
+        fair_line=mean,
+        main_line=main_line,
+        main_over_prob=price_line(mean, std, main_line),
+        mean_margin=np.bincount(codes, weights=pairs["margin"].to_numpy(dtype=float), minlength=n_groups) / count,
+    )
+
+
+def price_line(mean: Any, std: Any, line: Any) -> np.ndarray:
+    """Fair P(stat > line) under Normal(mean, std), broadcast over arrays."""
+    return norm.sf(np.asarray(line, dtype=float), loc=mean, scale=std)
+
+
+def price_odds(
+    odds: Iterable[dict],
+    default_std: Mapping[str, float | Callable[[np.ndarray], np.ndarray]] | None = None,
+    std_ratio: float = DEFAULT_STD_RATIO,
+) -> pd.DataFrame:
+    """odds records -> fitted distributions per (fixture, market, player)."""
+    return fit_distributions(devig_over_under(odds_frame(odds)), default_std=default_std, std_ratio=std_ratio)
+
+
+def load_odds(path: Path) -> list[dict]:
+    """Odds records from a JSON list (main.py) or NDJSON (--ndjson) file."""
+    with open(path) as f:
+        if path.suffix == ".ndjson":
+            return [json.loads(line) for line in f if line.strip()]
+        return json.load(f)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="De-vig over/under odds and fit fair lines")
+    parser.add_argument("odds", type=Path, nargs="?", default=Path("australian_open_odds.json"))
+    parser.add_argument("--out", type=Path, default=None, help="Write the fitted lines as CSV")
+    parser.add_argument(
+        "--std-ratio",
+        type=float,
+        default=DEFAULT_STD_RATIO,
+        help=f"Prior std as a fraction of the line for single-line groups (default: {DEFAULT_STD_RATIO})",
+    )
+    args = parser.parse_args()
+
+    odds = load_odds(args.odds)
+    start = time.perf_counter()
+    pairs = devig_over_under(odds_frame(odds))
+    fits = fit_distributions(pairs, std_ratio=args.std_ratio)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{len(odds):,} odds -> {len(pairs):,} over/under pairs -> {len(fits):,} lines "
+        f"({(fits['std_source'] == 'fit').sum():,} with fitted std) in {elapsed * 1000:.0f} ms"
+    )
+    print(fits.sort_values(["fixture_id", "market_id", "player"]).head(20).to_string(index=False))
+    if args.out:
+        fits.to_csv(args.out, index=False)
+        print(f"Wrote {args.out}")
+
+
+if __name__ == "__main__":
+    main()
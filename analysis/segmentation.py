@@ -0,0 +1,206 @@
+"""
+Line segmentation for the normal line model: threshold specs per stat type, vectorized
+segment assignment and per-segment statistics.
+
+The notebooks assigned segments with if/elif ladders in df["pred_line_score"].apply()
+and recomputed groupby().agg per notebook. A SegmentSpec holds the same ladder as
+sorted edges, each with its own inclusive/exclusive upper bound, and assigns every
+line with one np.searchsorted. segment_stats computes the notebook's statistics table
+plus per-segment line quantiles from a single sort, and quantile_spec derives
+thresholds from line quantiles (the notebooks' pd.qcut starting point).
+
+SEGMENT_SPECS holds the notebook ladders; spec_for() maps stat types and OpticOdds
+market ids to them. SegmentStd turns a spec and per-segment stds into a per-line std
+lookup that analysis.pricing accepts as a default_std value.
+
+    from analysis.segmentation import spec_for, segment_stats, SegmentStd
+
+    spec = spec_for(14)
+    df["segment"] = spec.categorical(df["pred_line_score"])
+    stats = segment_stats(df, spec)
+    std = SegmentStd.from_stats(spec, stats)        # std(lines) -> per-line std
+"""
+
+from typing import Any, Iterable, Mapping
+
+import numpy as np
+import pandas as pd
+
+STAT_COLUMNS = [
+    "count",
+    "mean_line",
+    "mean_actual",
+    "std_actual",
+    "min_line",
+    "max_line",
+    "min_actual",
+    "max_actual",
+]
+
+
+class SegmentSpec:
+    """
+    Ordered segments over a line. edges are the upper bounds of every segment but the
+    last; a line equal to edges[i] falls in segment i when inclusive[i] (line <= edge,
+    the default) and in segment i + 1 otherwise (line < edge).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        edges: Iterable[float],
+        labels: Iterable[str],
+        inclusive: bool | Iterable[bool] = True,
+    ) -> None:
+        self.name = name
+        self.edges = np.asarray(list(edges), dtype=float)
+        self.labels = list(labels)
+        if isinstance(inclusive, bool):
+            inclusive = [inclusive] * len(self.edges)
+        self.inclusive = np.asarray(list(inclusive), dtype=bool)
+        if len(self.labels) != len(self.edges) + 1 or len(self.inclusive) != len(self.edges):
+            raise ValueError(f"{name}: need len(edges) + 1 labels and one inclusive flag per edge")
+        if np.any(np.diff(self.edges) <= 0):
+            raise ValueError(f"{name}: edges must be strictly increasing")
+
+    def __repr__(self) -> str:
+        bounds = ", ".join(f"{'<=' if inc else '<'}{e:g}" for e, inc in zip(self.edges, self.inclusive))
+        return f"SegmentSpec({self.name!r}, [{bounds}], {self.labels})"
+
+    def codes(self, lines: Any) -> np.ndarray:
+        """Segment index of every line (NaN lines get -1)."""
+        x = np.asarray(lines, dtype=float)
+        codes = np.searchsorted(self.edges, x, side="left")
+        if len(self.edges) and not self.inclusive.all():
+            at = np.minimum(codes, len(self.edges) - 1)
+            codes = codes + ((self.edges[at] == x) & ~self.inclusive[at])
+        return np.where(np.isnan(x), -1, codes)
+
+    def categorical(self, lines: Any) -> pd.Categorical:
+        """Ordered segment labels, a drop-in for df["pred_line_score"].apply(assign_segment)."""
+        return pd.Categorical.from_codes(self.codes(lines), categories=self.labels, ordered=True)
+
+
+SEGMENT_SPECS = {
+    # fs_odds_interpreter_std.ipynb assign_segment
+    "fantasy_score": SegmentSpec("fantasy_score", [10.0, 13.5, 19.0, 23.0], ["Q1", "Q2", "Q3", "Q4", "Q5"]),
+    # games_won_odds_interpreter_std.ipynb assign_segment
+    "games_won": SegmentSpec(
+        "games_won",
+        [7.5, 12.0, 13.0, 18.5],
+        [
+            "Bo3_lopsided (pregame: ≤7.5)",
+            "Bo3_underdog (pregame: 8-12)",
+            "Bo3_competitive (pregame: 12.5-13)",
+            "Ambiguous (pregame: 13.5-18.5)",
+            "Bo5_likely (pregame: ≥19)",
+        ],
+    ),
+    # match_exp.ipynb assign_format_segment: < 13.5, <= 19.5
+    "games_won_format": SegmentSpec(
+        "games_won_format", [13.5, 19.5], ["BO3_likely", "Ambiguous", "BO5_likely"], inclusive=[False, True]
+    ),
+}
+# pick_level stat_type_id / stat_type_name and OpticOdds market_id -> spec name
+STAT_TYPE_SPECS: dict[Any, str] = {
+    14: "fantasy_score",
+    63: "games_won",
+    "Games Won": "games_won",
+    "player_games_won": "games_won",
+}
+
+
+def spec_for(stat_type: Any) -> SegmentSpec:
+    """Spec for a stat_type_id, stat_type_name, OpticOdds market_id or spec name."""
+    name = STAT_TYPE_SPECS.get(stat_type, stat_type)
+    if name not in SEGMENT_SPECS:
+        raise KeyError(f"No segment spec for {stat_type!r}; known: {sorted(SEGMENT_SPECS)}")
+    return SEGMENT_SPECS[name]
+
+
+def quantile_spec(
+    lines: Any,
+    q: int | Iterable[float] = 4,
+    name: str = "quantile",
+    labels: Iterable[str] | None = None,
+) -> SegmentSpec:
+    """
+    Spec with edges at line quantiles (like pd.qcut, whose bins are right-inclusive);
+    duplicate edges from heavily repeated lines are dropped.
+    """
+    x = np.asarray(lines, dtype=float)
+    x = x[~np.isnan(x)]
+    probs = np.linspace(0, 1, q + 1)[1:-1] if isinstance(q, int) else np.asarray(list(q), dtype=float)
+    edges = np.unique(np.quantile(x, probs)) if len(x) else np.array([])
+    labels = list(labels) if labels is not None else [f"Q{i + 1}" for i in range(len(edges) + 1)]
+    return SegmentSpec(name, edges, labels[: len(edges) + 1])
+
+
+def segment_stats(
+    df: pd.DataFrame,
+    spec: SegmentSpec,
+    line_col: str = "pred_line_score",
+    score_col: str = "score",
+    line_quantiles: Iterable[float] = (0.25, 0.5, 0.75),
+) -> pd.DataFrame:
+    """
+    The notebooks' segment_stats table (count, mean/std/min/max of line and score) plus
+    line quantiles per segment, indexed by label in spec order. Computed from one sort
+    of (segment, line) and np.bincount / reduceat; empty segments are dropped.
+    """
+    lines = df[line_col].to_numpy(dtype=float)
+    scores = df[score_col].to_numpy(dtype=float)
+    keep = ~(np.isnan(lines) | np.isnan(scores))
+    lines, scores = lines[keep], scores[keep]
+    codes = spec.codes(lines)
+    n_segments = len(spec.labels)
+    line_quantiles = list(line_quantiles)
+    columns = STAT_COLUMNS + [f"line_p{round(p * 100)}" for p in line_quantiles]
+    if not len(lines):
+        return pd.DataFrame(columns=columns, index=pd.Index([], name="segment"))
+
+    order = np.lexsort((lines, codes))
+    codes, lines, scores = codes[order], lines[order], scores[order]
+    count = np.bincount(codes, minlength=n_segments)
+    present = np.flatnonzero(count)
+    starts = np.searchsorted(codes, present)
+    n = count[present].astype(float)
+
+    score_sum = np.bincount(codes, weights=scores, minlength=n_segments)[present]
+    score_sq = np.bincount(codes, weights=scores * scores, minlength=n_segments)[present]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        std = np.sqrt(np.maximum(score_sq - score_sum**2 / n, 0) / (n - 1))
+    stats = {
+        "count": count[present],
+        "mean_line": np.bincount(codes, weights=lines, minlength=n_segments)[present] / n,
+        "mean_actual": score_sum / n,
+        "std_actual": np.where(n > 1, std, np.nan),
+        "min_line": lines[starts],
+        "max_line": lines[starts + count[present] - 1],
+        "min_actual": np.minimum.reduceat(scores, starts),
+        "max_actual": np.maximum.reduceat(scores, starts),
+    }
+    # Linear-interpolated quantiles within each sorted segment (np.quantile's default).
+    for p in line_quantiles:
+        pos = starts + p * (n - 1)
+        lo = np.floor(pos).astype(int)
+        hi = np.minimum(lo + 1, starts + count[present] - 1)
+        stats[f"line_p{round(p * 100)}"] = lines[lo] + (lines[hi] - lines[lo]) * (pos - lo)
+    return pd.DataFrame(stats, index=pd.Index([spec.labels[i] for i in present], name="segment"))[columns]
+
+
+class SegmentStd:
+    """Per-segment std as a per-line lookup, e.g. a calibrated std per segment for pricing priors."""
+
+    def __init__(self, spec: SegmentSpec, stds: Mapping[str, float], fallback: float = np.nan) -> None:
+        self.spec = spec
+        self.stds = dict(stds)
+        self._table = np.array([self.stds.get(label, fallback) for label in spec.labels], dtype=float)
+
+    @classmethod
+    def from_stats(cls, spec: SegmentSpec, stats: pd.DataFrame, column: str = "std_actual") -> "SegmentStd":
+        return cls(spec, stats[column].to_dict())
+
+    def __call__(self, lines: Any) -> np.ndarray:
+        codes = self.spec.codes(lines)
+        return np.where(codes >= 0, self._table[np.maximum(codes, 0)], np.nan)
@@ -0,0 +1,8 @@
+"""
+End-to-end benchmarks for tennis-origination.
+
+- e2e: stage-by-stage collection benchmark (OpticOdds and Sportradar stub servers,
+  fake BigQuery sink) with fetches/s, rows/s, p50/p99 latency, peak RSS and saved baselines.
+- fake_bigquery: in-memory google.cloud.bigquery.Client stand-in installed behind
+  bigquery.client.get_client().
+"""
@@ -0,0 +1,367 @@
+"""
+End-to-end collection benchmark: recorded payloads replayed through local stub servers
+into an in-memory BigQuery fake, stage by stage.
+
+Stages (each timed on its own, in this order):
+- opticodds.fixtures: fetch_fixtures over every season week (OpticOddsClient + FetchEngine
+  against opticodds.stub_server serving australian_open_fixtures.json);
+- opticodds.odds: fetch_odds_historical for those fixtures (djokovic_musetti.json odds,
+  cloned per sportsbook), as dicts;
+- opticodds.odds_records: the same as compact OddsRecords (records=True);
+- bigquery.odds_rows: odds_row_to_bq over every odds row;
+- bigquery.stream: ParallelWriter streaming inserts into FakeBigQueryClient;
+- bigquery.batch: load_rows staging gzip NDJSON into one fake load job;
+- sportradar.summaries: ingest_season_stats (AsyncSportradarClient against
+  sportradar.stub_server serving sr_season_summaries.json, cloned per season), writing
+  per-player rows through ParallelWriter into the fake.
+
+Each stage reports fetches/s (HTTP requests or BigQuery calls), rows/s, p50/p99
+latency per request, and the process's peak RSS after the stage (a high-water mark:
+run one stage with --stage to isolate it, though the data it consumes is still built
+first). --repeat N runs every stage N times and reports the median run. Server
+latency, 503 rate and rate limit are configurable, so retries and 429 handling are
+part of what is measured.
+
+--save NAME writes the results to benchmarks/baselines/NAME.json; --compare NAME
+prints every metric against that baseline and exits non-zero when one regressed by
+more than --tolerance (throughput down, latency or RSS up).
+
+Run from project root:
+  uv run python -m benchmarks.e2e --repeat 3 --save before
+  uv run python -m benchmarks.e2e --repeat 3 --compare before
+  uv run python -m benchmarks.e2e --stage opticodds.odds --books 10 --latency 0.05 --error-rate 0.02
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import platform
+import resource
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+import numpy as np
+
+from benchmarks.fake_bigquery import FakeBigQueryClient, install
+from bigquery.load_job import load_rows
+from bigquery.parallel_writer import ParallelWriter
+from bigquery.schema import odds_row_to_bq
+from opticodds.backfill import fetch_fixtures, fetch_odds_historical
+from opticodds.fetch import FetchEngine
+from opticodds.stub_server import StubOpticOddsServer, _book_id
+from sportradar.client import AsyncSportradarClient
+from sportradar.season_summaries import SeasonCheckpoint, ingest_season_stats
+from sportradar.stub_server import StubSportradarServer
+
+BASELINE_DIR = Path(__file__).resolve().parent / "baselines"
+BOOKS = ["DraftKings", "FanDuel", "BetMGM", "Caesars", "Pinnacle", "bet365", "Bovada", "Hard Rock", "ESPN BET", "Fanatics"]
+ODDS_TABLE = "bench.bench.odds"
+STATS_TABLE = "bench.bench.player_stats"
+STAGES = (
+    "opticodds.fixtures",
+    "opticodds.odds",
+    "opticodds.odds_records",
+    "bigquery.odds_rows",
+    "bigquery.stream",
+    "bigquery.batch",
+    "sportradar.summaries",
+)
+# Metric -> +1 if higher is better, -1 if lower is better.
+METRICS = {"fetches_per_s": 1, "rows_per_s": 1, "p50_ms": -1, "p99_ms": -1, "peak_rss_mb": -1}
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process so far (ru_maxrss: KiB on Linux, bytes on macOS)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+class LatencyRecorder:
+    """Wall time of every call made through wrap()ped functions."""
+
+    def __init__(self) -> None:
+        self.latencies: list[float] = []
+
+    def wrap(self, fn: Callable[..., Any]) -> Callable[..., Any]:
+        if asyncio.iscoroutinefunction(fn):
+
+            async def timed_async(*args: Any, **kwargs: Any) -> Any:
+                start = time.perf_counter()
+                try:
+                    return await fn(*args, **kwargs)
+                finally:
+                    self.latencies.append(time.perf_counter() - start)
+
+            return timed_async
+
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.latencies.append(time.perf_counter() - start)
+
+        return timed
+
+
+class StageResult:
+    """Throughput, latency and memory of one stage."""
+
+    def __init__(self, name: str, seconds: float, fetches: int, rows: int, latencies: list[float]) -> None:
+        self.name = name
+        self.seconds = seconds
+        self.fetches = fetches
+        self.rows = rows
+        lat = np.asarray(latencies, dtype=float) * 1000
+        self.p50_ms = float(np.percentile(lat, 50)) if len(lat) else None
+        self.p99_ms = float(np.percentile(lat, 99)) if len(lat) else None
+        self.peak_rss_mb = peak_rss_mb()
+
+    @property
+    def fetches_per_s(self) -> float:
+        return self.fetches / self.seconds if self.seconds else 0.0
+
+    @property
+    def rows_per_s(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "seconds": round(self.seconds, 4),
+            "fetches": self.fetches,
+            "rows": self.rows,
+            "fetches_per_s": round(self.fetches_per_s, 1),
+            "rows_per_s": round(self.rows_per_s, 1),
+            "p50_ms": None if self.p50_ms is None else round(self.p50_ms, 3),
+            "p99_ms": None if self.p99_ms is None else round(self.p99_ms, 3),
+            "peak_rss_mb": round(self.peak_rss_mb, 1),
+        }
+
+
+def _fmt(value: float | None, spec: str) -> str:
+    return "-" if value is None else format(value, spec)
+
+
+def print_results(results: list[StageResult]) -> None:
+    print(f"{'stage':<24} {'seconds':>8} {'fetches':>8} {'fetches/s':>10} {'rows':>9} {'rows/s':>11} {'p50 ms':>8} {'p99 ms':>8} {'peak RSS MB':>12}")
+    for r in results:
+        print(
+            f"{r.name:<24} {r.seconds:>8.3f} {r.fetches:>8} {r.fetches_per_s:>10,.1f} {r.rows:>9,} {r.rows_per_s:>11,.0f} "
+            f"{_fmt(r.p50_ms, '8.2f'):>8} {_fmt(r.p99_ms, '8.2f'):>8} {r.peak_rss_mb:>12.1f}"
+        )
+
+
+class Bench:
+    """Shared state for the stages: stub servers, fake BigQuery and intermediate data."""
+
+    def __init__(self, args: argparse.Namespace) -> None:
+        self.args = args
+        self.books = BOOKS[: args.books]
+        self.fixtures: list[dict] = []
+        self.odds: list[dict] = []
+        self.bq_rows: list[dict] = []
+        self.fake = FakeBigQueryClient(latency=args.bq_latency)
+        self.ingested_at = datetime.now(timezone.utc).isoformat()
+
+    def server_options(self) -> dict[str, Any]:
+        return dict(latency=self.args.latency, rate_limit=self.args.rate_limit, error_rate=self.args.error_rate)
+
+    def engine(self) -> FetchEngine:
+        return FetchEngine(concurrency=self.args.concurrency, rate=self.args.rate, backoff_base=0.05, backoff_max=1.0)
+
+    def opticodds_client(self, server: StubOpticOddsServer, recorder: LatencyRecorder) -> Any:
+        from main import OpticOddsClient
+
+        client = OpticOddsClient("bench", cache=False, http2=False)
+        client.BASE_URL = server.base_url
+        client.sportsbooks = [_book_id(book) for book in self.books]
+        client.markets = sorted({o["market_id"] for odds in server.odds_by_fixture.values() for o in odds})
+        client._get = recorder.wrap(client._get)
+        return client
+
+    async def _opticodds(self, run: Callable[[Any, FetchEngine], Awaitable[int]]) -> tuple[int, int, list[float], float]:
+        recorder = LatencyRecorder()
+        with StubOpticOddsServer.from_recorded(sportsbooks=self.books, **self.server_options()) as server:
+            async with self.opticodds_client(server, recorder) as client:
+                engine = self.engine()
+                start = time.perf_counter()
+                rows = await run(client, engine)
+                seconds = time.perf_counter() - start
+        return engine.calls, rows, recorder.latencies, seconds
+
+    async def stage_opticodds_fixtures(self) -> tuple[int, int, list[float], float]:
+        async def run(client: Any, engine: FetchEngine) -> int:
+            self.fixtures = [f async for f in fetch_fixtures(client, engine, client.season_week)]
+            if self.args.fixtures:
+                self.fixtures = self.fixtures[: self.args.fixtures]
+            return len(self.fixtures)
+
+        return await self._opticodds(run)
+
+    async def _odds(self, records: bool) -> tuple[int, int, list[float], float]:
+        if not self.fixtures:
+            await self.stage_opticodds_fixtures()
+
+        async def run(client: Any, engine: FetchEngine) -> int:
+            odds = []
+            async for _, batch in fetch_odds_historical(client, engine, [f["id"] for f in self.fixtures], records=records):
+                odds.extend(batch)
+            if not records:
+                self.odds = odds
+            return len(odds)
+
+        return await self._opticodds(run)
+
+    async def stage_opticodds_odds(self) -> tuple[int, int, list[float], float]:
+        return await self._odds(records=False)
+
+    async def stage_opticodds_odds_records(self) -> tuple[int, int, list[float], float]:
+        return await self._odds(records=True)
+
+    async def stage_bigquery_odds_rows(self) -> tuple[int, int, list[float], float]:
+        if not self.odds:
+            await self.stage_opticodds_odds()
+        start = time.perf_counter()
+        self.bq_rows = [odds_row_to_bq(o, self.ingested_at) for o in self.odds]
+        return 0, len(self.bq_rows), [], time.perf_counter() - start
+
+    async def _bq_rows(self) -> list[dict]:
+        if not self.bq_rows:
+            await self.stage_bigquery_odds_rows()
+        return self.bq_rows
+
+    def _traced_fake(self, recorder: LatencyRecorder, *methods: str) -> None:
+        for method in methods:
+            setattr(self.fake, method, recorder.wrap(getattr(FakeBigQueryClient, method).__get__(self.fake)))
+
+    async def stage_bigquery_stream(self) -> tuple[int, int, list[float], float]:
+        rows = await self._bq_rows()
+        recorder = LatencyRecorder()
+        self._traced_fake(recorder, "insert_rows_json")
+        with install(self.fake):
+            start = time.perf_counter()
+            report = await asyncio.to_thread(ParallelWriter(ODDS_TABLE, max_workers=self.args.bq_workers).write, rows)
+            seconds = time.perf_counter() - start
+        return len(recorder.latencies), report.rows, recorder.latencies, seconds
+
+    async def stage_bigquery_batch(self) -> tuple[int, int, list[float], float]:
+        rows = await self._bq_rows()
+        recorder = LatencyRecorder()
+        self._traced_fake(recorder, "load_table_from_file")
+        start = time.perf_counter()
+        stats = await asyncio.to_thread(load_rows, self.fake, rows, ODDS_TABLE)
+        return len(recorder.latencies), stats.rows, recorder.latencies, time.perf_counter() - start
+
+    async def stage_sportradar_summaries(self) -> tuple[int, int, list[float], float]:
+        recorder = LatencyRecorder()
+        server = StubSportradarServer.from_recorded(seasons=self.args.sr_seasons, **self.server_options())
+        with server, install(self.fake), SeasonCheckpoint(":memory:") as checkpoint:
+            writer = ParallelWriter(STATS_TABLE, max_workers=self.args.bq_workers)
+            async with AsyncSportradarClient(
+                api_key="bench",
+                base_url=server.base_url,
+                qps=self.args.rate,
+                concurrency=self.args.concurrency,
+                cache=False,
+            ) as client:
+                client.engine.backoff_base, client.engine.backoff_max = 0.05, 1.0
+                client._get_once = recorder.wrap(client._get_once)
+                start = time.perf_counter()
+                counts = await ingest_season_stats(client, checkpoint, server.seasons, writer.write)
+                seconds = time.perf_counter() - start
+                fetches = client.engine.calls
+        return fetches, counts["rows"], recorder.latencies, seconds
+
+    async def run(self, stages: list[str]) -> list[StageResult]:
+        results = []
+        for name in stages:
+            stage = getattr(self, "stage_" + name.replace(".", "_"))
+            runs = []
+            for _ in range(self.args.repeat):
+                with contextlib.redirect_stdout(io.StringIO()) if not self.args.verbose else contextlib.nullcontext():
+                    runs.append(await stage())
+            # Keep the median run by wall time, so one noisy run does not set (or fail) a baseline.
+            fetches, rows, latencies, seconds = sorted(runs, key=lambda run: run[3])[len(runs) // 2]
+            results.append(StageResult(name, seconds, fetches, rows, latencies))
+        return results
+
+
+def save_baseline(path: Path, results: list[StageResult], args: argparse.Namespace) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    baseline = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "config": {k: v for k, v in vars(args).items() if k not in ("save", "compare", "stage", "verbose", "tolerance")},
+        "stages": {r.name: r.to_dict() for r in results},
+    }
+    path.write_text(json.dumps(baseline, indent=2) + "\n")
+    print(f"Saved baseline to {path}")
+
+
+def compare_baseline(path: Path, results: list[StageResult], tolerance: float) -> list[str]:
+    """Print each metric against the baseline; return the regressions beyond tolerance."""
+    baseline = json.loads(path.read_text())
+    print(f"\nvs {path.name} ({baseline['created_at']}, tolerance {tolerance:.0%})")
+    regressions = []
+    for r in results:
+        before = baseline["stages"].get(r.name)
+        if before is None:
+            print(f"{r.name:<24} not in baseline")
+            continue
+        now = r.to_dict()
+        cells = []
+        for metric, direction in METRICS.items():
+            old, new = before.get(metric), now.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            worse = -change * direction
+            flag = ""
+            if worse > tolerance:
+                flag = " !"
+                regressions.append(f"{r.name} {metric}: {old:g} -> {new:g} ({change:+.0%})")
+            cells.append(f"{metric} {change:+.0%}{flag}")
+        print(f"{r.name:<24} " + ", ".join(cells))
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="End-to-end benchmark against local stub servers and a fake BigQuery")
+    parser.add_argument("--stage", action="append", choices=STAGES, help="Run only these stages (repeatable)")
+    parser.add_argument("--books", type=int, default=5, help=f"Sportsbooks per fixture, max {len(BOOKS)} (default: 5)")
+    parser.add_argument("--fixtures", type=int, default=None, help="Limit the fixtures whose odds are fetched")
+    parser.add_argument("--sr-seasons", type=int, default=10, help="Copies of the recorded Sportradar season (default: 10)")
+    parser.add_argument("--latency", type=float, default=0.01, help="Stub server latency per response, seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of stub responses answered 503")
+    parser.add_argument("--rate-limit", type=float, default=None, help="Stub server requests/s before 429")
+    parser.add_argument("--concurrency", type=int, default=16, help="Client requests in flight (default: 16)")
+    parser.add_argument("--rate", type=float, default=500.0, help="Client requests started per second (default: 500)")
+    parser.add_argument("--bq-latency", type=float, default=0.005, help="Fake BigQuery latency per request, seconds")
+    parser.add_argument("--bq-workers", type=int, default=4, help="ParallelWriter workers (default: 4)")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per stage; the median run is reported (default: 1)")
+    parser.add_argument("--save", metavar="NAME", default=None, help="Save results as benchmarks/baselines/NAME.json")
+    parser.add_argument("--compare", metavar="NAME", default=None, help="Compare with benchmarks/baselines/NAME.json")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="Allowed relative regression (default: 0.15)")
+    parser.add_argument("--verbose", action="store_true", help="Show the stages' own progress output")
+    args = parser.parse_args()
+    args.books = min(args.books, len(BOOKS))
+
+    results = asyncio.run(Bench(args).run(args.stage or list(STAGES)))
+    print_results(results)
+    if args.save:
+        save_baseline(BASELINE_DIR / f"{args.save}.json", results, args)
+    if args.compare:
+        regressions = compare_baseline(BASELINE_DIR / f"{args.compare}.json", results, args.tolerance)
+        if regressions:
+            print("\nRegressions:\n  " + "\n  ".join(regressions))
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
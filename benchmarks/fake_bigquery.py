@@ -0,0 +1,148 @@
+"""
+In-memory stand-in for google.cloud.bigquery.Client, so the loaders' write paths
+(ParallelWriter streaming inserts, load_rows load jobs, upsert staging + MERGE) can be
+timed end to end without a project, credentials or network.
+
+FakeBigQueryClient implements the calls those paths make: insert_rows_json,
+load_table_from_file (gzip NDJSON or Parquet), get_table, create_table, delete_table
+and query. Rows are counted per table (kept with keep_rows=True) and `latency`
+seconds are slept per request to stand in for the round trip. install() swaps it in
+as the process-wide client that bigquery.client.get_client() returns:
+
+    with install(FakeBigQueryClient(latency=0.02)) as fake:
+        ParallelWriter("p.d.odds").write(rows)
+    fake.rows["p.d.odds"]
+"""
+
+import gzip
+import io
+import json
+import threading
+import time
+import uuid
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+from google.cloud import bigquery
+from google.cloud.exceptions import NotFound
+
+import bigquery.client as bq_client
+
+
+class FakeJob:
+    """Finished load or query job with the attributes the loaders read."""
+
+    def __init__(self, input_file_bytes: int | None = None, output_bytes: int | None = None, affected: int = 0) -> None:
+        self.job_id = f"fake_{uuid.uuid4().hex[:12]}"
+        self.input_file_bytes = input_file_bytes
+        self.output_bytes = output_bytes
+        self.num_dml_affected_rows = affected
+
+    def result(self) -> list:
+        return []
+
+
+class FakeBigQueryClient:
+    """See the module docstring. requests counts calls by method name."""
+
+    def __init__(self, latency: float = 0.0, keep_rows: bool = False, schemas: dict[str, list] | None = None) -> None:
+        self.latency = latency
+        self.keep_rows = keep_rows
+        self.schemas: dict[str, list] = dict(schemas or {})
+        self.rows: Counter = Counter()  # table id -> rows written
+        self.data: dict[str, list[dict]] = defaultdict(list)  # table id -> rows, when keep_rows
+        self.bytes: Counter = Counter()
+        self.requests: Counter = Counter()
+        self.queries: list[str] = []
+        self._lock = threading.Lock()
+
+    def _request(self, method: str) -> None:
+        with self._lock:
+            self.requests[method] += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def insert_rows_json(self, table: Any, json_rows: list[dict], row_ids: list[str] | None = None, **kwargs: Any) -> list:
+        self._request("insert_rows_json")
+        table_id = str(table)
+        with self._lock:
+            self.rows[table_id] += len(json_rows)
+            if self.keep_rows:
+                self.data[table_id].extend(json_rows)
+        return []
+
+    def load_table_from_file(self, file_obj: Any, destination: Any, job_config: Any = None, **kwargs: Any) -> FakeJob:
+        self._request("load_table_from_file")
+        table_id = str(destination)
+        payload = file_obj.read()
+        if job_config is not None and job_config.source_format == bigquery.SourceFormat.PARQUET:
+            import pyarrow.parquet as pq
+
+            table = pq.read_table(io.BytesIO(payload))
+            count, rows = table.num_rows, table.to_pylist() if self.keep_rows else []
+        else:
+            lines = gzip.decompress(payload).splitlines()
+            count = len(lines)
+            rows = []
+            if self.keep_rows:
+                rows = [json.loads(line) for line in lines]
+        with self._lock:
+            self.rows[table_id] += count
+            self.bytes[table_id] += len(payload)
+            if self.keep_rows:
+                self.data[table_id].extend(rows)
+        return FakeJob(input_file_bytes=len(payload), output_bytes=len(payload))
+
+    def get_table(self, table: Any) -> bigquery.Table:
+        self._request("get_table")
+        table_id = str(table)
+        if table_id not in self.schemas:
+            raise NotFound(f"Table {table_id} not found")
+        return bigquery.Table(table_id, schema=self.schemas[table_id])
+
+    def create_table(self, table: Any, exists_ok: bool = False, **kwargs: Any) -> Any:
+        self._request("create_table")
+        table_id = str(table)
+        self.schemas.setdefault(table_id, list(getattr(table, "schema", [])))
+        return table
+
+    def delete_table(self, table: Any, not_found_ok: bool = False, **kwargs: Any) -> None:
+        self._request("delete_table")
+        table_id = str(table)
+        self.schemas.pop(table_id, None)
+        self.rows.pop(table_id, None)
+        self.data.pop(table_id, None)
+
+    def query(self, sql: str, **kwargs: Any) -> FakeJob:
+        self._request("query")
+        self.queries.append(sql)
+        return FakeJob()
+
+    def update_table(self, table: Any, fields: list[str]) -> Any:
+        self._request("update_table")
+        return table
+
+    def close(self) -> None:
+        pass
+
+    def summary(self) -> str:
+        requests = ", ".join(f"{method} {n}" for method, n in sorted(self.requests.items())) or "no requests"
+        return f"{sum(self.rows.values()):,} rows in {len(self.rows)} tables; {requests}"
+
+
+@contextmanager
+def install(fake: FakeBigQueryClient | None = None) -> Iterator[FakeBigQueryClient]:
+    """Make `fake` the client bigquery.client.get_client() returns, restoring the previous one after."""
+    fake = fake or FakeBigQueryClient()
+    with bq_client._cache_lock:
+        previous, previous_tables = bq_client._client, dict(bq_client._tables)
+        bq_client._client = fake
+        bq_client._tables.clear()
+    try:
+        yield fake
+    finally:
+        with bq_client._cache_lock:
+            bq_client._client = previous
+            bq_client._tables.clear()
+            bq_client._tables.update(previous_tables)
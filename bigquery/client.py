@@ -9,31 +9,110 @@ Credentials (choose one):
 Tables (in .env):
 - BIGQUERY_TABLE_ID = odds table (project_id.dataset_id.table_id)
 - BIGQUERY_FIXTURES_TABLE_ID = fixtures table
+- BIGQUERY_TICKS_TABLE_ID = odds tick table (optional; for opticodds.ticks captures)
+- BIGQUERY_SR_PLAYER_STATS_TABLE_ID = Sportradar per-player-per-match stats table (optional)
+
+The client and table metadata are cached per process (see cache_stats for counts);
+clear_client_cache() / invalidate_table_cache() drop them.
 """
 
 import os
-from typing import Any
+import threading
+from typing import Any, Iterable
 
 from dotenv import load_dotenv
 from google.cloud import bigquery
 from google.cloud.exceptions import NotFound
 
+from bigquery.schema import DEFAULT_PARTITION_TYPE
+
 load_dotenv()
 
 BIGQUERY_TABLE_ID = os.getenv("BIGQUERY_TABLE_ID")
 BIGQUERY_FIXTURES_TABLE_ID = os.getenv("BIGQUERY_FIXTURES_TABLE_ID")
+BIGQUERY_TICKS_TABLE_ID = os.getenv("BIGQUERY_TICKS_TABLE_ID")
+BIGQUERY_SR_PLAYER_STATS_TABLE_ID = os.getenv("BIGQUERY_SR_PLAYER_STATS_TABLE_ID")
 GOOGLE_APPLICATION_CREDENTIALS = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
 
+WRITE_MODES = ("stream", "batch", "upsert")
+
+
+class CacheStats:
+    """Counters for the process-wide client and table-metadata caches."""
+
+    def __init__(self) -> None:
+        self.client_constructions = 0
+        self.metadata_requests = 0
+        self.metadata_hits = 0
+
+    def summary(self) -> str:
+        return (
+            f"{self.client_constructions} client constructions, "
+            f"{self.metadata_requests} table metadata requests, {self.metadata_hits} cache hits"
+        )
+
+
+cache_stats = CacheStats()
+_client: bigquery.Client | None = None
+_tables: dict[str, bigquery.Table] = {}
+_cache_lock = threading.Lock()
+
 
 def get_client() -> bigquery.Client:
     """
-    Return a BigQuery client.
+    Return the process-wide BigQuery client, constructing it on first use.
     Uses GOOGLE_APPLICATION_CREDENTIALS if set in .env; otherwise uses Application
     Default Credentials (e.g. from `gcloud auth application-default login`).
+    Call clear_client_cache() to force a new client (e.g. after changing credentials).
+    """
+    global _client
+    with _cache_lock:
+        if _client is None:
+            if GOOGLE_APPLICATION_CREDENTIALS:
+                os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = GOOGLE_APPLICATION_CREDENTIALS
+            _client = bigquery.Client()
+            cache_stats.client_constructions += 1
+        return _client
+
+
+def clear_client_cache() -> None:
+    """Drop the cached client and all cached table metadata."""
+    global _client
+    with _cache_lock:
+        if _client is not None:
+            _client.close()
+        _client = None
+        _tables.clear()
+
+
+def get_table(table_id: str, client: bigquery.Client | None = None) -> bigquery.Table:
+    """
+    Return table metadata, fetched at most once per table per process.
+    Raises NotFound if the table does not exist (absence is not cached).
+    The cache belongs to the process-wide client; any other `client` (e.g. a fake
+    in tests) is asked directly and its answer is not cached.
     """
-    if GOOGLE_APPLICATION_CREDENTIALS:
-        os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = GOOGLE_APPLICATION_CREDENTIALS
-    return bigquery.Client()
+    if client is not None and client is not _client:
+        return client.get_table(table_id)
+    with _cache_lock:
+        table = _tables.get(table_id)
+        if table is not None:
+            cache_stats.metadata_hits += 1
+            return table
+        cache_stats.metadata_requests += 1
+    table = get_client().get_table(table_id)
+    with _cache_lock:
+        _tables[table_id] = table
+    return table
+
+
+def invalidate_table_cache(table_id: str | None = None) -> None:
+    """Forget cached metadata for one table, or for all tables if table_id is None."""
+    with _cache_lock:
+        if table_id is None:
+            _tables.clear()
+        else:
+            _tables.pop(table_id, None)
 
 
 def get_table_id() -> str:
@@ -54,48 +133,186 @@ def get_fixtures_table_id() -> str:
     return BIGQUERY_FIXTURES_TABLE_ID
 
 
-def create_table_if_not_exists(table_id: str | None = None) -> bool:
+def get_ticks_table_id() -> str:
+    """Return the odds tick table ID. Raises if BIGQUERY_TICKS_TABLE_ID is not set."""
+    if not BIGQUERY_TICKS_TABLE_ID:
+        raise ValueError(
+            "BIGQUERY_TICKS_TABLE_ID is not set. Add it to .env."
+        )
+    return BIGQUERY_TICKS_TABLE_ID
+
+
+def get_player_stats_table_id() -> str:
+    """Return the Sportradar player stats table ID. Raises if BIGQUERY_SR_PLAYER_STATS_TABLE_ID is not set."""
+    if not BIGQUERY_SR_PLAYER_STATS_TABLE_ID:
+        raise ValueError(
+            "BIGQUERY_SR_PLAYER_STATS_TABLE_ID is not set. Add it to .env."
+        )
+    return BIGQUERY_SR_PLAYER_STATS_TABLE_ID
+
+
+def apply_table_layout(
+    table: bigquery.Table,
+    partition_field: str,
+    clustering_fields: list[str],
+    partition_type: str | None = DEFAULT_PARTITION_TYPE,
+) -> bigquery.Table:
+    """Set time partitioning on partition_field (unless partition_type is None) and clustering."""
+    if partition_type is not None:
+        table.time_partitioning = bigquery.TimePartitioning(type_=partition_type, field=partition_field)
+    table.clustering_fields = clustering_fields
+    return table
+
+
+def create_table_if_not_exists(
+    table_id: str | None = None,
+    partition_type: str | None = DEFAULT_PARTITION_TYPE,
+) -> bool:
     """
     Create the tennis OddsJam odds table only if it does not exist.
     The dataset must already exist. Returns True if created, False if already existed.
+    New tables are partitioned on fixture_start_date by partition_type (DAY/MONTH/YEAR;
+    None for unpartitioned) and clustered; existing tables are left as they are
+    (see bigquery.migrate_partitioning).
     """
-    from bigquery.schema import get_odds_table_schema
+    from bigquery.schema import ODDS_CLUSTERING_FIELDS, ODDS_PARTITION_FIELD, get_odds_table_schema
 
     target = table_id or get_table_id()
-    client = get_client()
     try:
-        client.get_table(target)
+        get_table(target)
         return False
     except NotFound:
         pass
     table = bigquery.Table(target, schema=get_odds_table_schema())
-    client.create_table(table)
+    apply_table_layout(table, ODDS_PARTITION_FIELD, ODDS_CLUSTERING_FIELDS, partition_type)
+    created = get_client().create_table(table)
+    with _cache_lock:
+        _tables[target] = created
     return True
 
 
-def create_fixtures_table_if_not_exists(table_id: str | None = None) -> bool:
+def create_fixtures_table_if_not_exists(
+    table_id: str | None = None,
+    partition_type: str | None = DEFAULT_PARTITION_TYPE,
+) -> bool:
     """
     Create the tennis fixtures table only if it does not exist.
     The dataset must already exist. Returns True if created, False if already existed.
+    New tables are partitioned on start_date by partition_type (DAY/MONTH/YEAR;
+    None for unpartitioned) and clustered; existing tables are left as they are
+    (see bigquery.migrate_partitioning).
     """
-    from bigquery.schema import get_fixtures_table_schema
+    from bigquery.schema import FIXTURES_CLUSTERING_FIELDS, FIXTURES_PARTITION_FIELD, get_fixtures_table_schema
 
     target = table_id or get_fixtures_table_id()
-    client = get_client()
     try:
-        client.get_table(target)
+        get_table(target)
         return False
     except NotFound:
         pass
     table = bigquery.Table(target, schema=get_fixtures_table_schema())
-    client.create_table(table)
+    apply_table_layout(table, FIXTURES_PARTITION_FIELD, FIXTURES_CLUSTERING_FIELDS, partition_type)
+    created = get_client().create_table(table)
+    with _cache_lock:
+        _tables[target] = created
+    return True
+
+
+def create_ticks_table_if_not_exists(
+    table_id: str | None = None,
+    partition_type: str | None = "DAY",
+) -> bool:
+    """
+    Create the odds tick table only if it does not exist, partitioned on observed_at
+    and clustered like the odds table. Returns True if created, False if already existed.
+    """
+    from bigquery.schema import TICKS_CLUSTERING_FIELDS, TICKS_PARTITION_FIELD, get_odds_ticks_table_schema
+
+    target = table_id or get_ticks_table_id()
+    try:
+        get_table(target)
+        return False
+    except NotFound:
+        pass
+    table = bigquery.Table(target, schema=get_odds_ticks_table_schema())
+    apply_table_layout(table, TICKS_PARTITION_FIELD, TICKS_CLUSTERING_FIELDS, partition_type)
+    created = get_client().create_table(table)
+    with _cache_lock:
+        _tables[target] = created
+    return True
+
+
+def create_player_stats_table_if_not_exists(
+    table_id: str | None = None,
+    partition_type: str | None = DEFAULT_PARTITION_TYPE,
+) -> bool:
+    """
+    Create the Sportradar per-player-per-match stats table only if it does not exist,
+    partitioned on start_time and clustered on competition_id, competitor_id.
+    Returns True if created, False if already existed.
+    """
+    from sportradar.reference_schema import (
+        PLAYER_STATS_CLUSTERING_FIELDS,
+        PLAYER_STATS_PARTITION_FIELD,
+        get_match_player_stats_table_schema,
+    )
+
+    target = table_id or get_player_stats_table_id()
+    try:
+        get_table(target)
+        return False
+    except NotFound:
+        pass
+    table = bigquery.Table(target, schema=get_match_player_stats_table_schema())
+    apply_table_layout(table, PLAYER_STATS_PARTITION_FIELD, PLAYER_STATS_CLUSTERING_FIELDS, partition_type)
+    created = get_client().create_table(table)
+    with _cache_lock:
+        _tables[target] = created
     return True
 
 
-def write_rows(rows: list[dict[str, Any]], table_id: str | None = None) -> int:
-    """Insert rows into the configured BigQuery table via streaming insert."""
+def write_rows(
+    rows: Iterable[dict[str, Any]],
+    table_id: str | None = None,
+    mode: str = "stream",
+    source_format: str = "ndjson",
+    write_disposition: str = "WRITE_APPEND",
+    schema: list[bigquery.SchemaField] | None = None,
+) -> int:
+    """
+    Write rows into the configured BigQuery table. Returns the number of rows written.
+
+    mode="stream" (default) uses insert_rows_json streaming inserts.
+    mode="batch" stages the rows as gzip NDJSON or Parquet (source_format) and runs one
+    load job with the given write_disposition; rows may then be any iterable, staged
+    without being held in memory. See bigquery.load_job.
+    mode="upsert" dedupes rows by id, stages them and MERGEs on id, so re-running a
+    load does not duplicate rows. See bigquery.upsert.
+    """
+    if mode not in WRITE_MODES:
+        raise ValueError(f"mode must be one of {WRITE_MODES}, got {mode!r}")
     target = table_id or get_table_id()
     client = get_client()
+    if mode == "upsert":
+        from bigquery.upsert import upsert_rows
+
+        stats = upsert_rows(rows, target, schema=schema, source_format=source_format)
+        print(stats.summary())
+        return stats.unique_rows
+    if mode == "batch":
+        from bigquery.load_job import load_rows
+
+        stats = load_rows(
+            client,
+            rows,
+            target,
+            source_format=source_format,
+            write_disposition=write_disposition,
+            schema=schema,
+        )
+        print(stats.summary())
+        return stats.rows
+    rows = list(rows)
     errors = client.insert_rows_json(target, rows)
     if errors:
         raise RuntimeError(f"BigQuery insert_rows_json failed: {errors}")
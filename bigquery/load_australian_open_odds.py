@@ -6,14 +6,27 @@ Run from project root:
   uv run python -m bigquery.load_australian_open_odds
   # or with explicit path to JSON:
   uv run python -m bigquery.load_australian_open_odds --input path/to/odds.json
+  # NDJSON from `main.py --ndjson` is streamed in constant memory:
+  uv run python -m bigquery.load_australian_open_odds --input australian_open_odds.ndjson
+  # Historical backfill through a staged load job instead of streaming inserts:
+  uv run python -m bigquery.load_australian_open_odds --mode batch --format parquet
+  # Idempotent re-load (MERGE on id):
+  uv run python -m bigquery.load_australian_open_odds --mode upsert
+  # Also write a local Parquet dataset partitioned by tournament/season_week/market_id:
+  uv run python -m bigquery.load_australian_open_odds --parquet data
 """
 
 import argparse
 import json
+from datetime import datetime, timezone
 from pathlib import Path
 
-from bigquery.client import write_rows
-from bigquery.schema import odds_row_to_bq
+from bigquery.client import WRITE_MODES, cache_stats, get_table_id, write_rows
+from bigquery.load_job import SOURCE_FORMATS, WRITE_DISPOSITIONS
+from bigquery.parallel_writer import DEFAULT_MAX_BATCH_BYTES, ParallelWriter
+from bigquery.parquet_dataset import write_odds_dataset
+from bigquery.records import iter_json_records
+from bigquery.schema import get_odds_table_schema, odds_row_to_bq
 
 
 def load_odds_json(path: Path) -> list[dict]:
@@ -27,29 +40,94 @@ def main() -> None:
         "--input",
         type=Path,
         default=Path(__file__).resolve().parent.parent / "australian_open_odds.json",
-        help="Path to australian_open_odds.json",
+        help="Path to australian_open_odds.json or a streamed .ndjson file",
     )
     parser.add_argument(
         "--batch-size",
         type=int,
         default=10_000,
-        help="Rows per streaming insert batch (default: 10000)",
+        help="Max rows per streaming insert batch, --mode stream only (default: 10000)",
+    )
+    parser.add_argument(
+        "--max-batch-bytes",
+        type=int,
+        default=DEFAULT_MAX_BATCH_BYTES,
+        help="Max serialized bytes per streaming insert batch (default: 5 MiB)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Concurrent streaming insert requests (default: 4)",
+    )
+    parser.add_argument(
+        "--mode",
+        choices=WRITE_MODES,
+        default="stream",
+        help="stream: insert_rows_json batches; batch: one staged load job; "
+        "upsert: stage and MERGE on id, safe to re-run (default: stream)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=SOURCE_FORMATS,
+        default="ndjson",
+        help="Staging format for --mode batch/upsert (default: ndjson)",
+    )
+    parser.add_argument(
+        "--write-disposition",
+        choices=WRITE_DISPOSITIONS,
+        default="WRITE_APPEND",
+        help="Load job write disposition for --mode batch (default: WRITE_APPEND)",
+    )
+    parser.add_argument(
+        "--parquet",
+        type=Path,
+        default=None,
+        metavar="DIR",
+        help="Also write the odds as a partitioned Parquet dataset under DIR (see bigquery.parquet_dataset)",
+    )
+    parser.add_argument(
+        "--fixtures",
+        type=Path,
+        default=Path(__file__).resolve().parent.parent / "australian_open_fixtures.json",
+        help="Fixtures file supplying tournament/season_week partitions for --parquet",
     )
     args = parser.parse_args()
 
     if not args.input.exists():
         raise FileNotFoundError(f"Input file not found: {args.input}")
 
-    rows_raw = load_odds_json(args.input)
-    rows_bq = [odds_row_to_bq(r) for r in rows_raw]
+    # Generators end to end: with NDJSON input only the in-flight batches are in memory.
+    ingested_at = datetime.now(timezone.utc).isoformat()
+    if args.parquet:
+        fixtures = list(iter_json_records(args.fixtures))
+        count = write_odds_dataset(iter_json_records(args.input), fixtures, args.parquet, ingested_at)
+        print(f"Wrote {count} odds as Parquet under {args.parquet}")
+    rows_bq = (odds_row_to_bq(r, ingested_at) for r in iter_json_records(args.input))
 
-    total = 0
-    for i in range(0, len(rows_bq), args.batch_size):
-        batch = rows_bq[i : i + args.batch_size]
-        write_rows(batch)
-        total += len(batch)
+    if args.mode in ("batch", "upsert"):
+        total = write_rows(
+            rows_bq,
+            mode=args.mode,
+            source_format=args.format,
+            write_disposition=args.write_disposition,
+            schema=get_odds_table_schema(),
+        )
+    else:
+        writer = ParallelWriter(
+            get_table_id(),
+            max_workers=args.workers,
+            max_batch_bytes=args.max_batch_bytes,
+            max_batch_rows=args.batch_size,
+        )
+        report = writer.write(rows_bq)
+        total = report.rows
+        print(f"Streaming inserts: {report.summary()}")
+        if report.failed_rows:
+            raise RuntimeError(f"{len(report.failed_rows)} rows failed, e.g. {report.failed_rows[0][1]}")
 
     print(f"Loaded {total} odds rows into BigQuery.")
+    print(f"BigQuery client cache: {cache_stats.summary()}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,70 @@
+"""
+Load odds tick Parquet files (written by opticodds.ticks.TickStore) into the tick table.
+Set BIGQUERY_TICKS_TABLE_ID in .env. The table is created if it does not exist.
+
+All part files in --input are combined into one Parquet load job; on success they are
+moved to <input>/loaded/ so the next run only loads new ticks (TickStore still reads
+them there, so a restarted recorder keeps its history).
+
+Run from project root:
+  uv run python -m bigquery.load_odds_ticks
+  uv run python -m bigquery.load_odds_ticks --input path/to/ticks
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from google.cloud import bigquery
+
+from bigquery.client import create_ticks_table_if_not_exists, get_client, get_ticks_table_id
+from bigquery.schema import get_odds_ticks_table_schema
+from opticodds.ticks import LOADED_DIR, TickStore
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load odds tick Parquet files into BigQuery")
+    parser.add_argument(
+        "--input",
+        type=Path,
+        default=Path(__file__).resolve().parent.parent / "odds_ticks",
+        help="Directory of ticks-*.parquet part files (default: odds_ticks/)",
+    )
+    args = parser.parse_args()
+
+    files = TickStore(args.input).part_files(include_loaded=False)
+    if not files:
+        print(f"No tick files in {args.input}.")
+        return
+
+    table_id = get_ticks_table_id()
+    create_ticks_table_if_not_exists(table_id)
+    ticks = pa.concat_tables(pq.read_table(f) for f in files)
+
+    start = time.perf_counter()
+    with tempfile.TemporaryFile() as buffer:
+        pq.write_table(ticks, buffer, compression="zstd")
+        buffer.seek(0)
+        job_config = bigquery.LoadJobConfig(
+            source_format=bigquery.SourceFormat.PARQUET,
+            write_disposition="WRITE_APPEND",
+            schema=get_odds_ticks_table_schema(),
+        )
+        job = get_client().load_table_from_file(buffer, table_id, job_config=job_config)
+        job.result()
+
+    loaded_dir = args.input / LOADED_DIR
+    loaded_dir.mkdir(exist_ok=True)
+    for f in files:
+        f.rename(loaded_dir / f.name)
+    print(
+        f"Loaded {ticks.num_rows} ticks from {len(files)} files into BigQuery ({table_id}) "
+        f"in {time.perf_counter() - start:.2f}s."
+    )
+
+
+if __name__ == "__main__":
+    main()
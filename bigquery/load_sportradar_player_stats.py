@@ -0,0 +1,112 @@
+"""
+Load Sportradar per-player-per-match statistics for the target categories into BigQuery.
+Set SPORTRADAR_API_KEY and BIGQUERY_SR_PLAYER_STATS_TABLE_ID in .env. The table is
+created if it does not exist.
+
+Fetches competitions and seasons (served from the response cache when fresh), keeps
+seasons of competitions in the chosen categories (default: ATP, WTA, Davis Cup, Billie
+Jean King Cup; see category_filter_guide.md), then fetches every pending season's
+summaries concurrently and writes one row per competitor per closed match from
+statistics.totals.competitors. Progress is checkpointed per season in --state-db, so
+a re-run only fetches new or unfinished seasons and only writes newly closed matches.
+
+Run from project root:
+  uv run python -m bigquery.load_sportradar_player_stats --min-year 2024
+  uv run python -m bigquery.load_sportradar_player_stats --category sr:category:72 --mode upsert
+"""
+
+import argparse
+import asyncio
+import time
+from pathlib import Path
+
+from bigquery.client import (
+    WRITE_MODES,
+    cache_stats,
+    create_player_stats_table_if_not_exists,
+    get_player_stats_table_id,
+    write_rows,
+)
+from bigquery.parallel_writer import ParallelWriter
+from sportradar.client import AsyncSportradarClient
+from sportradar.reference_schema import get_match_player_stats_table_schema
+from sportradar.season_summaries import (
+    TARGET_CATEGORY_IDS,
+    ReferenceIndex,
+    SeasonCheckpoint,
+    ingest_season_stats,
+)
+
+
+async def run(args: argparse.Namespace) -> None:
+    table_id = get_player_stats_table_id()
+    create_player_stats_table_if_not_exists(table_id)
+    schema = get_match_player_stats_table_schema()
+    writer = ParallelWriter(table_id, max_workers=args.workers)
+
+    def write(rows: list[dict]) -> None:
+        if args.mode != "stream":
+            write_rows(rows, table_id=table_id, mode=args.mode, schema=schema)
+            return
+        report = writer.write(rows)
+        if report.failed_rows:
+            raise RuntimeError(f"{len(report.failed_rows)} rows failed, e.g. {report.failed_rows[0][1]}")
+
+    start = time.perf_counter()
+    async with AsyncSportradarClient(concurrency=args.concurrency) as client:
+        competitions, seasons = await asyncio.gather(client.get_competitions(), client.get_seasons())
+        index = ReferenceIndex(competitions.get("competitions", []), seasons.get("seasons", []))
+        categories = args.category or list(TARGET_CATEGORY_IDS)
+        targets = index.seasons(categories, min_year=args.min_year)
+        print(
+            f"{len(index.competition_ids(categories))} competitions in {len(categories)} categories, "
+            f"{len(targets)} seasons"
+        )
+        with SeasonCheckpoint(args.state_db) as checkpoint:
+            counts = await ingest_season_stats(client, checkpoint, targets, write)
+            print(f"Run: {counts}, state: {checkpoint.summary()}")
+        print(f"Sportradar: {client.summary()}")
+    print(f"Done in {time.perf_counter() - start:.1f}s ({table_id}).")
+    print(f"BigQuery client cache: {cache_stats.summary()}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load Sportradar per-player match stats into BigQuery")
+    parser.add_argument(
+        "--category",
+        action="append",
+        metavar="CATEGORY_ID",
+        help="Sportradar category id to include; repeatable (default: ATP, WTA, Davis Cup, BJK Cup)",
+    )
+    parser.add_argument("--min-year", type=int, default=None, help="Only seasons from this year on")
+    parser.add_argument(
+        "--state-db",
+        type=Path,
+        default=Path("sportradar_state.sqlite"),
+        help="SQLite checkpoint of finished seasons and written matches (default: sportradar_state.sqlite)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Concurrent Sportradar requests, within the SPORTRADAR_QPS limit (default: 4)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Concurrent streaming insert requests (default: 4)",
+    )
+    parser.add_argument(
+        "--mode",
+        choices=WRITE_MODES,
+        default="stream",
+        help="stream: insert_rows_json batches; batch: one load job per season; "
+        "upsert: stage and MERGE on id (default: stream)",
+    )
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
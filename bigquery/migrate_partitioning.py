@@ -0,0 +1,143 @@
+"""
+Migrate an existing unpartitioned odds or fixtures table to the partitioned/clustered layout.
+
+BigQuery cannot add partitioning to an existing table, so the migration:
+1. Adds any missing columns (odds: fixture_start_date, ingested_at).
+2. Copies the table into <table>_partitioned with CREATE TABLE ... PARTITION BY ...
+   CLUSTER BY ... AS SELECT. Odds rows get fixture_start_date backfilled from the
+   fixtures table (BIGQUERY_FIXTURES_TABLE_ID) and ingested_at from the copy time.
+3. With --swap, renames the original to <table>_unpartitioned_<YYYYMMDD> and the copy
+   to the original name. Without it, inspect the copy and swap by hand.
+
+If the table is already partitioned correctly and only the clustering differs, the
+clustering spec is updated in place instead (applies to newly written data).
+
+  uv run python -m bigquery.migrate_partitioning odds
+  uv run python -m bigquery.migrate_partitioning fixtures --swap
+"""
+
+import argparse
+from datetime import datetime, timezone
+
+from bigquery.client import (
+    BIGQUERY_FIXTURES_TABLE_ID,
+    get_client,
+    get_fixtures_table_id,
+    get_table,
+    get_table_id,
+    invalidate_table_cache,
+)
+from bigquery.schema import (
+    DEFAULT_PARTITION_TYPE,
+    FIXTURES_CLUSTERING_FIELDS,
+    FIXTURES_PARTITION_FIELD,
+    ODDS_CLUSTERING_FIELDS,
+    ODDS_PARTITION_FIELD,
+)
+
+
+def odds_copy_sql(source: str, dest: str, partition_type: str, fixtures_table: str | None) -> str:
+    """CTAS for the odds table, backfilling fixture_start_date from fixtures when available."""
+    if fixtures_table:
+        start_date = "COALESCE(o.fixture_start_date, f.start_date)"
+        join = (
+            f"LEFT JOIN (SELECT id, ANY_VALUE(start_date) AS start_date FROM `{fixtures_table}` "
+            "GROUP BY id) f ON o.fixture_id = f.id"
+        )
+    else:
+        start_date, join = "o.fixture_start_date", ""
+    return f"""
+CREATE TABLE `{dest}`
+PARTITION BY TIMESTAMP_TRUNC({ODDS_PARTITION_FIELD}, {partition_type})
+CLUSTER BY {", ".join(ODDS_CLUSTERING_FIELDS)}
+AS
+SELECT
+    o.* EXCEPT (fixture_start_date, ingested_at),
+    {start_date} AS fixture_start_date,
+    COALESCE(o.ingested_at, CURRENT_TIMESTAMP()) AS ingested_at
+FROM `{source}` o
+{join}
+"""
+
+
+def fixtures_copy_sql(source: str, dest: str, partition_type: str) -> str:
+    """CTAS for the fixtures table."""
+    return f"""
+CREATE TABLE `{dest}`
+PARTITION BY TIMESTAMP_TRUNC({FIXTURES_PARTITION_FIELD}, {partition_type})
+CLUSTER BY {", ".join(FIXTURES_CLUSTERING_FIELDS)}
+AS
+SELECT * FROM `{source}`
+"""
+
+
+def migrate(kind: str, partition_type: str = DEFAULT_PARTITION_TYPE, swap: bool = False) -> str:
+    """Migrate the odds or fixtures table; returns the id of the partitioned table."""
+    client = get_client()
+    if kind == "odds":
+        table_id, field, clustering = get_table_id(), ODDS_PARTITION_FIELD, ODDS_CLUSTERING_FIELDS
+    else:
+        table_id, field, clustering = (
+            get_fixtures_table_id(),
+            FIXTURES_PARTITION_FIELD,
+            FIXTURES_CLUSTERING_FIELDS,
+        )
+    table = get_table(table_id)
+
+    partitioning = table.time_partitioning
+    if partitioning is not None and partitioning.field == field:
+        if table.clustering_fields != clustering:
+            table.clustering_fields = clustering
+            client.update_table(table, ["clustering_fields"])
+            invalidate_table_cache(table_id)
+            print(f"Updated clustering on {table_id} to {clustering}")
+        else:
+            print(f"{table_id} is already partitioned on {field} and clustered on {clustering}")
+        return table_id
+
+    dest = f"{table_id}_partitioned"
+    if kind == "odds":
+        client.query(
+            f"ALTER TABLE `{table_id}` "
+            "ADD COLUMN IF NOT EXISTS fixture_start_date TIMESTAMP, "
+            "ADD COLUMN IF NOT EXISTS ingested_at TIMESTAMP"
+        ).result()
+        sql = odds_copy_sql(table_id, dest, partition_type, BIGQUERY_FIXTURES_TABLE_ID)
+    else:
+        sql = fixtures_copy_sql(table_id, dest, partition_type)
+    client.query(sql).result()
+    print(f"Created {dest} partitioned on {field} ({partition_type}), clustered on {clustering}")
+
+    if not swap:
+        print("Re-run with --swap to rename it over the original table.")
+        return dest
+
+    name = table_id.split(".")[-1]
+    backup = f"{name}_unpartitioned_{datetime.now(timezone.utc):%Y%m%d}"
+    client.query(f"ALTER TABLE `{table_id}` RENAME TO `{backup}`").result()
+    client.query(f"ALTER TABLE `{dest}` RENAME TO `{name}`").result()
+    invalidate_table_cache()
+    print(f"Swapped: {table_id} is now partitioned; original kept as {backup}")
+    return table_id
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Migrate odds/fixtures tables to partitioned + clustered")
+    parser.add_argument("table", choices=("odds", "fixtures"), help="Which table to migrate")
+    parser.add_argument(
+        "--partition-type",
+        choices=("DAY", "MONTH", "YEAR"),
+        default=DEFAULT_PARTITION_TYPE,
+        help=f"Time partition granularity (default: {DEFAULT_PARTITION_TYPE})",
+    )
+    parser.add_argument(
+        "--swap",
+        action="store_true",
+        help="Rename the partitioned copy over the original (original kept as a backup)",
+    )
+    args = parser.parse_args()
+    migrate(args.table, partition_type=args.partition_type, swap=args.swap)
+
+
+if __name__ == "__main__":
+    main()
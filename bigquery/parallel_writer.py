@@ -0,0 +1,157 @@
+"""
+Parallel streaming-insert writer with back-pressure for large loads.
+
+Rows are grouped into batches by serialized size (and a row cap) so each
+insert_rows_json request stays under BigQuery's request size limits, then sent
+from a bounded thread pool. At most `max_in_flight` batches are queued or running;
+reading more input blocks until one finishes, so memory stays bounded even for
+an unbounded row iterator.
+
+Failures are handled per batch: a request that raises is retried whole (nothing
+was written), and when BigQuery reports row errors only the rows it rejected are
+retried. Rows with reason "invalid" can never succeed and are collected as
+failures instead. Insert ids are fixed per row before the first attempt, so a
+retried row is deduplicated by BigQuery's best-effort insertId dedup.
+"""
+
+import json
+import random
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Iterable, Iterator
+
+from bigquery.client import get_client, get_table_id
+
+# insert_rows_json requests are limited to 10 MB; stay well under it.
+DEFAULT_MAX_BATCH_BYTES = 5 * 1024 * 1024
+DEFAULT_MAX_BATCH_ROWS = 10_000
+PERMANENT_ERROR_REASONS = frozenset({"invalid"})
+
+
+class WriteReport:
+    """Totals and throughput for one ParallelWriter.write call."""
+
+    def __init__(self) -> None:
+        self.rows = 0
+        self.bytes = 0
+        self.batches = 0
+        self.retries = 0
+        self.seconds = 0.0
+        self.failed_rows: list[tuple[dict[str, Any], list[dict]]] = []
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    @property
+    def mb_per_second(self) -> float:
+        return self.bytes / 1e6 / self.seconds if self.seconds else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"{self.rows} rows in {self.batches} batches, {self.bytes / 1e6:.2f} MB in "
+            f"{self.seconds:.2f}s ({self.rows_per_second:,.0f} rows/s, {self.mb_per_second:.2f} MB/s), "
+            f"{self.retries} retries, {len(self.failed_rows)} failed rows"
+        )
+
+
+class ParallelWriter:
+    """Send byte-sized insert_rows_json batches from a bounded thread pool."""
+
+    def __init__(
+        self,
+        table_id: str | None = None,
+        max_workers: int = 4,
+        max_in_flight: int | None = None,
+        max_batch_bytes: int = DEFAULT_MAX_BATCH_BYTES,
+        max_batch_rows: int = DEFAULT_MAX_BATCH_ROWS,
+        max_retries: int = 3,
+        backoff_base: float = 1.0,
+    ) -> None:
+        self.table_id = table_id or get_table_id()
+        self.max_workers = max_workers
+        self.max_in_flight = max_in_flight or 2 * max_workers
+        self.max_batch_bytes = max_batch_bytes
+        self.max_batch_rows = max_batch_rows
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self._lock = threading.Lock()
+
+    def _batches(self, rows: Iterable[dict[str, Any]]) -> Iterator[tuple[list[dict], int]]:
+        """Group rows into (batch, serialized_bytes), splitting on byte or row limits."""
+        batch: list[dict] = []
+        size = 0
+        for row in rows:
+            row_bytes = len(json.dumps(row, separators=(",", ":"))) + 1
+            if batch and (size + row_bytes > self.max_batch_bytes or len(batch) >= self.max_batch_rows):
+                yield batch, size
+                batch, size = [], 0
+            batch.append(row)
+            size += row_bytes
+        if batch:
+            yield batch, size
+
+    def _send(self, rows: list[dict], report: WriteReport) -> None:
+        """Insert one batch, retrying failed requests and rejected rows only."""
+        client = get_client()
+        row_ids = [str(uuid.uuid4()) for _ in rows]
+        attempt = 0
+        while rows:
+            try:
+                errors = client.insert_rows_json(self.table_id, rows, row_ids=row_ids)
+            except Exception:
+                if attempt >= self.max_retries:
+                    raise
+                errors = None
+            if errors is None:
+                retry = list(range(len(rows)))
+            else:
+                retry = []
+                for error in errors:
+                    reasons = {e.get("reason") for e in error.get("errors", [])}
+                    if reasons & PERMANENT_ERROR_REASONS:
+                        with self._lock:
+                            report.failed_rows.append((rows[error["index"]], error["errors"]))
+                    else:
+                        retry.append(error["index"])
+            if retry and attempt >= self.max_retries:
+                with self._lock:
+                    report.failed_rows.extend((rows[i], errors or []) for i in retry)
+                return
+            rows = [rows[i] for i in retry]
+            row_ids = [row_ids[i] for i in retry]
+            if rows:
+                with self._lock:
+                    report.retries += 1
+                attempt += 1
+                time.sleep(random.uniform(0, self.backoff_base * 2**attempt))
+
+    def write(self, rows: Iterable[dict[str, Any]]) -> WriteReport:
+        """
+        Write every row and return the report. Rows that still fail after retries are
+        listed in report.failed_rows; a request that keeps raising is re-raised.
+        """
+        report = WriteReport()
+        slots = threading.BoundedSemaphore(self.max_in_flight)
+        futures: list[Future] = []
+        start = time.perf_counter()
+
+        def release(_: Future) -> None:
+            slots.release()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            for batch, size in self._batches(rows):
+                slots.acquire()  # back-pressure: wait for a free slot before reading more input
+                report.rows += len(batch)
+                report.bytes += size
+                report.batches += 1
+                future = pool.submit(self._send, batch, report)
+                future.add_done_callback(release)
+                futures.append(future)
+            for future in futures:
+                future.result()
+        report.seconds = time.perf_counter() - start
+        report.rows -= len(report.failed_rows)
+        return report
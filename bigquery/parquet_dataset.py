@@ -0,0 +1,226 @@
+"""
+Partitioned Parquet datasets of fixtures and odds, flattened exactly like the BigQuery
+tables (fixture_row_to_bq / odds_row_to_bq), for analysis without re-parsing the JSON.
+
+Layout (hive partitioning, one directory level per key):
+
+    <root>/fixtures/tournament=australian_open_2026/season_week=quarterfinals/part-*.parquet
+    <root>/odds/tournament=australian_open_2026/season_week=quarterfinals/market_id=player_games_won/part-*.parquet
+
+tournament is derived from the fixture's season_type and season_year
+("Australian Open, Melbourne, Australia, Qualifying" + 2026 ->
+australian_open_qualifying_2026); odds take tournament and season_week from their
+fixture. Writing replaces the partitions being written (delete_matching), so
+re-exporting a tournament is idempotent and other tournaments are left alone.
+
+The readers open files memory-mapped and pass column projection and filters to
+pyarrow.dataset: filters on partition keys skip whole directories, and filters on
+other columns skip row groups by their statistics, so loading the Games Won odds for
+the quarterfinals only touches those files:
+
+    from bigquery.parquet_dataset import read_odds
+
+    table = read_odds("data", columns=["fixture_id", "sportsbook", "closing_line_price"],
+                      filters={"season_week": "quarterfinals", "market_id": "player_games_won"})
+    df = table.to_pandas()
+
+Requires pyarrow. Export from the collector output (main.py can also write it
+directly with --parquet DIR):
+  uv run python -m bigquery.parquet_dataset --out data
+  uv run python -m bigquery.parquet_dataset --fixtures australian_open_fixtures.ndjson \\
+      --odds australian_open_odds.ndjson --out data
+"""
+
+import argparse
+import re
+import time
+import uuid
+from datetime import datetime, timezone
+from itertools import batched
+from pathlib import Path
+from typing import Any, Iterable, Mapping
+
+from bigquery.load_job import _pyarrow, arrow_schema, arrow_table
+from bigquery.records import iter_json_records
+from bigquery.schema import (
+    fixture_row_to_bq,
+    get_fixtures_table_schema,
+    get_odds_table_schema,
+    odds_row_to_bq,
+)
+
+FIXTURE_PARTITIONS = ["tournament", "season_week"]
+ODDS_PARTITIONS = ["tournament", "season_week", "market_id"]
+ROW_GROUP_SIZE = 50_000
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def tournament_key(fixture: Mapping[str, Any]) -> str | None:
+    """Partition key for a fixture's tournament: season_type minus location, plus season_year."""
+    season_type = fixture.get("season_type")
+    if not season_type:
+        return None
+    parts = [p.strip() for p in season_type.split(",")]
+    name = " ".join([parts[0], *parts[3:], str(fixture.get("season_year") or "")])
+    return re.sub(r"[^a-z0-9]+", "_", name.lower()).strip("_")
+
+
+def _dataset_schema(bq_schema: list, partitions: list[str]) -> Any:
+    pa, _ = _pyarrow()
+    schema = arrow_schema(bq_schema)
+    for name in partitions:
+        if schema.get_field_index(name) < 0:
+            schema = schema.append(pa.field(name, pa.string()))
+    return schema
+
+
+def _partitioning(partitions: list[str]) -> Any:
+    pa, _ = _pyarrow()
+    import pyarrow.dataset as ds
+
+    return ds.partitioning(pa.schema([(name, pa.string()) for name in partitions]), flavor="hive")
+
+
+def write_dataset(
+    rows: Iterable[dict[str, Any]],
+    directory: Path | str,
+    schema: Any,
+    partitions: list[str],
+    existing: str = "delete_matching",
+) -> int:
+    """
+    Stream flat rows into a hive-partitioned Parquet dataset (zstd, one row group per
+    ROW_GROUP_SIZE rows). existing="delete_matching" replaces the partitions written,
+    "overwrite_or_ignore" adds files next to existing ones. Returns the row count.
+    """
+    pa, _ = _pyarrow()
+    import pyarrow.dataset as ds
+
+    count = 0
+
+    def batches() -> Iterable[Any]:
+        nonlocal count
+        for chunk in batched(rows, ROW_GROUP_SIZE):
+            count += len(chunk)
+            yield from arrow_table(chunk, schema).to_batches()
+
+    ds.write_dataset(
+        pa.RecordBatchReader.from_batches(schema, batches()),
+        str(directory),
+        format="parquet",
+        partitioning=_partitioning(partitions),
+        basename_template=f"part-{uuid.uuid4().hex[:8]}-{{i}}.parquet",
+        existing_data_behavior=existing,
+        file_options=ds.ParquetFileFormat().make_write_options(compression="zstd"),
+        max_rows_per_group=ROW_GROUP_SIZE,
+        min_rows_per_group=min(ROW_GROUP_SIZE, 10_000),
+    )
+    return count
+
+
+def fixture_dataset_rows(fixtures: Iterable[dict]) -> Iterable[dict[str, Any]]:
+    for fixture in fixtures:
+        yield {**fixture_row_to_bq(fixture), "tournament": tournament_key(fixture)}
+
+
+def odds_dataset_rows(
+    odds: Iterable[dict], fixtures_by_id: Mapping[str, dict], ingested_at: str | None = None
+) -> Iterable[dict[str, Any]]:
+    ingested_at = ingested_at or datetime.now(timezone.utc).isoformat()
+    for o in odds:
+        fixture = fixtures_by_id.get(o.get("fixture_id")) or {}
+        row = odds_row_to_bq(o, ingested_at)
+        row["tournament"] = tournament_key(fixture)
+        row["season_week"] = fixture.get("season_week")
+        yield row
+
+
+def write_fixtures_dataset(fixtures: Iterable[dict], root: Path | str) -> int:
+    """Write fixtures to <root>/fixtures, partitioned by tournament/season_week."""
+    schema = _dataset_schema(get_fixtures_table_schema(), FIXTURE_PARTITIONS)
+    return write_dataset(fixture_dataset_rows(fixtures), Path(root) / "fixtures", schema, FIXTURE_PARTITIONS)
+
+
+def write_odds_dataset(
+    odds: Iterable[dict], fixtures: Iterable[dict], root: Path | str, ingested_at: str | None = None
+) -> int:
+    """
+    Write odds to <root>/odds, partitioned by tournament/season_week/market_id; fixtures
+    supply each odds row's tournament and season_week.
+    """
+    schema = _dataset_schema(get_odds_table_schema(), ODDS_PARTITIONS)
+    fixtures_by_id = {f["id"]: f for f in fixtures}
+    rows = odds_dataset_rows(odds, fixtures_by_id, ingested_at)
+    return write_dataset(rows, Path(root) / "odds", schema, ODDS_PARTITIONS)
+
+
+def _expression(filters: Any) -> Any:
+    """A pyarrow expression, or a {column: value | [values]} mapping ANDed together."""
+    if filters is None or not isinstance(filters, Mapping):
+        return filters
+    import pyarrow.dataset as ds
+
+    expression = None
+    for column, value in filters.items():
+        field = ds.field(column)
+        term = field.isin(list(value)) if isinstance(value, (list, tuple, set)) else field == value
+        expression = term if expression is None else expression & term
+    return expression
+
+
+def open_dataset(directory: Path | str, partitions: list[str]) -> Any:
+    """Memory-mapped pyarrow Dataset over a hive-partitioned directory."""
+    _pyarrow()
+    import pyarrow.dataset as ds
+    from pyarrow import fs
+
+    return ds.dataset(
+        str(directory),
+        format="parquet",
+        partitioning=_partitioning(partitions),
+        filesystem=fs.LocalFileSystem(use_mmap=True),
+    )
+
+
+def read_fixtures(root: Path | str, columns: list[str] | None = None, filters: Any = None) -> Any:
+    """Fixtures as a pyarrow Table, projected to `columns` and filtered by `filters`."""
+    return open_dataset(Path(root) / "fixtures", FIXTURE_PARTITIONS).to_table(
+        columns=columns, filter=_expression(filters)
+    )
+
+
+def read_odds(root: Path | str, columns: list[str] | None = None, filters: Any = None) -> Any:
+    """Odds as a pyarrow Table, projected to `columns` and filtered by `filters`."""
+    return open_dataset(Path(root) / "odds", ODDS_PARTITIONS).to_table(columns=columns, filter=_expression(filters))
+
+
+def export(fixtures_path: Path, odds_path: Path | None, root: Path) -> tuple[int, int]:
+    """Write the fixtures (and odds, if given) collector files as datasets under root."""
+    fixtures = list(iter_json_records(fixtures_path))
+    n_fixtures = write_fixtures_dataset(fixtures, root)
+    n_odds = write_odds_dataset(iter_json_records(odds_path), fixtures, root) if odds_path else 0
+    return n_fixtures, n_odds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Export fixtures/odds JSON to partitioned Parquet datasets")
+    parser.add_argument("--fixtures", type=Path, default=ROOT / "australian_open_fixtures.json")
+    parser.add_argument(
+        "--odds",
+        type=Path,
+        default=ROOT / "australian_open_odds.json",
+        help="Odds .json or .ndjson; skipped if the file does not exist",
+    )
+    parser.add_argument("--out", type=Path, default=Path("data"), help="Dataset root (default: data)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    odds_path = args.odds if args.odds.exists() else None
+    if odds_path is None:
+        print(f"{args.odds} not found; exporting fixtures only")
+    n_fixtures, n_odds = export(args.fixtures, odds_path, args.out)
+    print(f"Wrote {n_fixtures} fixtures and {n_odds} odds under {args.out} in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
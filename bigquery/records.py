@@ -0,0 +1,25 @@
+"""
+Read collector output one record at a time.
+
+.ndjson / .jsonl files are streamed line by line in constant memory. Plain .json
+files (a single JSON array, as written by the non-streaming collector) are still
+supported but have to be parsed in full.
+"""
+
+import json
+from pathlib import Path
+from typing import Iterator
+
+NDJSON_SUFFIXES = (".ndjson", ".jsonl")
+
+
+def iter_json_records(path: Path) -> Iterator[dict]:
+    """Yield records from an NDJSON file (streamed) or a JSON array file (loaded whole)."""
+    if path.suffix in NDJSON_SUFFIXES:
+        with open(path) as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        return
+    with open(path) as f:
+        yield from json.load(f)
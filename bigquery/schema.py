@@ -2,14 +2,27 @@
 Flatten odds and fixture records for BigQuery.
 - Odds: tennis_odds table (OLV/CLV = opening/closing line value).
 - Fixtures: tennis_fixtures table (sport/league flattened; competitors/result as JSON).
+- Odds ticks: tennis_odds_ticks table (every price change per odds id, from opticodds.ticks).
+
+Both tables are time-partitioned and clustered (see *_PARTITION_FIELD / *_CLUSTERING_FIELDS)
+so per-tournament, per-fixture and per-market queries prune instead of scanning everything.
 """
 
 import json
+from datetime import datetime, timezone
 from typing import Any
 
 from google.cloud import bigquery
 
 
+ODDS_PARTITION_FIELD = "fixture_start_date"
+ODDS_CLUSTERING_FIELDS = ["fixture_id", "market_id", "sportsbook"]
+FIXTURES_PARTITION_FIELD = "start_date"
+FIXTURES_CLUSTERING_FIELDS = ["league_id", "season_type", "id"]
+# Tennis volumes are small per day; monthly partitions keep partitions reasonably sized.
+DEFAULT_PARTITION_TYPE = "MONTH"
+
+
 def get_odds_table_schema() -> list[bigquery.SchemaField]:
     """Schema for the shared tennis OddsJam odds table. Used for create-if-not-exists."""
     return [
@@ -29,13 +42,17 @@ def get_odds_table_schema() -> list[bigquery.SchemaField]:
         bigquery.SchemaField("opening_line_points", "FLOAT64", mode="NULLABLE"),
         bigquery.SchemaField("closing_line_price", "FLOAT64", mode="NULLABLE"),
         bigquery.SchemaField("closing_line_points", "FLOAT64", mode="NULLABLE"),
+        bigquery.SchemaField("fixture_start_date", "TIMESTAMP", mode="NULLABLE"),
+        bigquery.SchemaField("ingested_at", "TIMESTAMP", mode="NULLABLE"),
     ]
 
 
-def odds_row_to_bq(row: dict[str, Any]) -> dict[str, Any]:
+def odds_row_to_bq(row: dict[str, Any], ingested_at: str | None = None) -> dict[str, Any]:
     """
     Convert one odds record from australian_open_odds.json into a flat dict for BigQuery.
     Nested olv/clv become olv_price, olv_points, clv_price, clv_points.
+    fixture_start_date is stamped by the collector; ingested_at defaults to now (pass one
+    timestamp for a whole load to avoid a clock read per row).
     """
     olv = row.get("olv") or {}
     clv = row.get("clv") or {}
@@ -56,10 +73,38 @@ def odds_row_to_bq(row: dict[str, Any]) -> dict[str, Any]:
         "opening_line_points": olv.get("points"),
         "closing_line_price": clv.get("price"),
         "closing_line_points": clv.get("points"),
+        "fixture_start_date": row.get("fixture_start_date"),
+        "ingested_at": ingested_at or datetime.now(timezone.utc).isoformat(),
     }
     return out
 
 
+TICKS_PARTITION_FIELD = "observed_at"
+TICKS_CLUSTERING_FIELDS = ["fixture_id", "market_id", "sportsbook"]
+
+
+def get_odds_ticks_table_schema() -> list[bigquery.SchemaField]:
+    """
+    Schema for the odds tick table: one row per observed price/points change of an
+    odds id (see opticodds.ticks). Matches the Parquet files written by TickStore.
+    """
+    return [
+        bigquery.SchemaField("odds_id", "STRING", mode="NULLABLE"),
+        bigquery.SchemaField("fixture_id", "STRING", mode="NULLABLE"),
+        bigquery.SchemaField("sportsbook", "STRING", mode="NULLABLE"),
+        bigquery.SchemaField("market_id", "STRING", mode="NULLABLE"),
+        bigquery.SchemaField("name", "STRING", mode="NULLABLE"),
+        bigquery.SchemaField("selection", "STRING", mode="NULLABLE"),
+        bigquery.SchemaField("normalized_selection", "STRING", mode="NULLABLE"),
+        bigquery.SchemaField("grouping_key", "STRING", mode="NULLABLE"),
+        bigquery.SchemaField("is_main", "BOOLEAN", mode="NULLABLE"),
+        bigquery.SchemaField("price", "FLOAT64", mode="NULLABLE"),
+        bigquery.SchemaField("points", "FLOAT64", mode="NULLABLE"),
+        bigquery.SchemaField("timestamp", "TIMESTAMP", mode="NULLABLE"),
+        bigquery.SchemaField("observed_at", "TIMESTAMP", mode="NULLABLE"),
+    ]
+
+
 def get_fixtures_table_schema() -> list[bigquery.SchemaField]:
     """Schema for the tennis fixtures table (OddsJam fixture payload, flattened)."""
     return [
@@ -0,0 +1,102 @@
+"""
+Idempotent upsert into the odds/fixtures tables, keyed on the OpticOdds id.
+
+Rows are deduped locally by key (last occurrence wins), loaded into a temporary
+staging table with a load job, then MERGEd into the target: matching ids are
+updated, new ids inserted. Re-running a load therefore leaves one row per id and
+downstream queries need no ROW_NUMBER() dedup. The staging table is deleted
+afterwards and expires on its own if the process dies first.
+
+Note: rows still in a table's streaming buffer (recent insert_rows_json writes)
+cannot be updated by MERGE; use upsert/batch mode consistently for a table.
+"""
+
+import datetime
+import time
+import uuid
+from typing import Any, Iterable
+
+from google.cloud import bigquery
+
+from bigquery.client import get_client, get_table
+from bigquery.load_job import load_rows
+
+STAGING_EXPIRATION = datetime.timedelta(hours=6)
+
+
+class UpsertStats:
+    """Row counts and timings for one upsert."""
+
+    def __init__(self, input_rows: int, unique_rows: int) -> None:
+        self.input_rows = input_rows
+        self.unique_rows = unique_rows
+        self.affected_rows: int | None = None
+        self.load_seconds = 0.0
+        self.merge_seconds = 0.0
+
+    def summary(self) -> str:
+        return (
+            f"Upsert: {self.input_rows} input rows, {self.input_rows - self.unique_rows} local "
+            f"duplicates dropped, {self.unique_rows} staged, {self.affected_rows} rows merged "
+            f"(load {self.load_seconds:.2f}s, merge {self.merge_seconds:.2f}s)"
+        )
+
+
+def dedupe_by_key(rows: Iterable[dict[str, Any]], key: str = "id") -> tuple[list[dict], int]:
+    """Return (unique rows in first-seen order with last-seen values, input row count)."""
+    by_key: dict[Any, dict] = {}
+    count = 0
+    for row in rows:
+        by_key[row.get(key)] = row
+        count += 1
+    return list(by_key.values()), count
+
+
+def merge_sql(target: str, staging: str, columns: list[str], key: str = "id") -> str:
+    """MERGE statement updating matched keys and inserting new ones."""
+    updates = ",\n    ".join(f"`{c}` = S.`{c}`" for c in columns if c != key)
+    names = ", ".join(f"`{c}`" for c in columns)
+    values = ", ".join(f"S.`{c}`" for c in columns)
+    return f"""
+MERGE `{target}` T
+USING `{staging}` S
+ON T.`{key}` = S.`{key}`
+WHEN MATCHED THEN UPDATE SET
+    {updates}
+WHEN NOT MATCHED THEN
+    INSERT ({names}) VALUES ({values})
+"""
+
+
+def upsert_rows(
+    rows: Iterable[dict[str, Any]],
+    table_id: str,
+    key: str = "id",
+    schema: list[bigquery.SchemaField] | None = None,
+    source_format: str = "ndjson",
+) -> UpsertStats:
+    """Dedupe rows by key, stage them and MERGE into table_id. The target must exist."""
+    unique, count = dedupe_by_key(rows, key)
+    stats = UpsertStats(count, len(unique))
+    if not unique:
+        return stats
+
+    schema = schema or get_table(table_id).schema
+    client = get_client()
+    staging_id = f"{table_id}_staging_{uuid.uuid4().hex[:12]}"
+    staging = bigquery.Table(staging_id, schema=schema)
+    staging.expires = datetime.datetime.now(datetime.timezone.utc) + STAGING_EXPIRATION
+    client.create_table(staging)
+    try:
+        start = time.perf_counter()
+        load_rows(client, unique, staging_id, source_format=source_format, schema=schema)
+        stats.load_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        job = client.query(merge_sql(table_id, staging_id, [f.name for f in schema], key))
+        job.result()
+        stats.merge_seconds = time.perf_counter() - start
+        stats.affected_rows = job.num_dml_affected_rows
+    finally:
+        client.delete_table(staging_id, not_found_ok=True)
+    return stats
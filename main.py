@@ -1,21 +1,97 @@
+import argparse
 import asyncio
 import httpx
+import importlib.util
 import json
+import time
+from datetime import date
+from pathlib import Path
 from typing import Optional
 from prizepicks_oddsjam.config import OddsJamSettings
+from opticodds import FetchEngine, fetch_fixtures, fetch_odds_historical
+from opticodds.catalog import MarketCatalog, PruneReport
+from opticodds.http_cache import ResponseCache, resolve_cache
+from opticodds.incremental import ingest_incremental
+from opticodds.ndjson import NdjsonWriter
+from opticodds.scheduler import Tournament, TournamentScheduler, load_calendar
+from opticodds.sharding import MAX_SPORTSBOOKS_PER_REQUEST, merge_odds_responses, plan_shards
+from opticodds.state import IngestionState
+from opticodds.stream import OddsBook, OddsStreamConsumer, tick_sink
+from opticodds.ticks import TickRecorder, TickStore, poll_ticks
+
+
+class RequestStats:
+    """
+    Per-client request counters: latency and whether each request reused a pooled
+    connection or had to open a new one (TCP + TLS handshake).
+    """
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.new_connections = 0
+        self.reused_connections = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    def record(self, latency: float, reused: bool) -> None:
+        self.requests += 1
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+        if reused:
+            self.reused_connections += 1
+        else:
+            self.new_connections += 1
+
+    @property
+    def mean_latency(self) -> float:
+        return self.total_latency / self.requests if self.requests else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"{self.requests} requests, {self.new_connections} new connections, "
+            f"{self.reused_connections} reused, mean latency {self.mean_latency * 1000:.0f}ms, "
+            f"max {self.max_latency * 1000:.0f}ms"
+        )
 
 
 class OpticOddsClient:
     """
     Direct client for OpticOdds API v3.
     Provides fixtures and odds endpoints that prizepicks-oddsjam doesn't support.
+
+    Owns one pooled httpx.AsyncClient (HTTP/2 when the h2 package is installed,
+    keep-alive otherwise). Use as an async context manager, or call aclose() when done:
+
+        async with OpticOddsClient(api_key) as client:
+            await client.get_odds(fixture_id)
     """
     
     BASE_URL = "https://api.opticodds.com/api/v3"
     
-    def __init__(self, api_key: str):
+    def __init__(
+        self,
+        api_key: str,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        timeout: float = 30.0,
+        http2: bool = True,
+        cache: ResponseCache | bool = True,
+    ):
         self.api_key = api_key
         self.headers = {"x-api-key": api_key}
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.timeout = timeout
+        # HTTP/2 needs the optional h2 package (httpx[http2]); fall back to HTTP/1.1 keep-alive.
+        self.http2 = http2 and importlib.util.find_spec("h2") is not None
+        self.stats = RequestStats()
+        # Reference endpoints (/markets, /leagues, ...) are served from the on-disk cache.
+        self.cache = resolve_cache(cache)
+        self._session: httpx.AsyncClient | None = None
         self.sport = "tennis"
         self.markets = [
             "moneyline",
@@ -63,69 +139,213 @@ class OpticOddsClient:
             "semifinals",
             "finals",
         ]
+        # The odds endpoints cap sportsbooks per request; markets are uncapped unless set.
+        self.max_sportsbooks_per_request = MAX_SPORTSBOOKS_PER_REQUEST
+        self.max_markets_per_request: int | None = None
         self.season_type = "Australian Open"
         self.league = "atp"
+        # Set by load_catalog(); odds requests are then pruned to offered (book, market) pairs.
+        self.catalog: MarketCatalog | None = None
         self.start_date_before = "2026-02-02T00:00:00Z"
         self.start_date_after = "2026-01-11T00:00:00Z"
     
-    def _odds_params(self, fixture_id: str) -> dict:
-        """Build params for odds endpoints. API allows max 5 sportsbooks per request."""
+    async def __aenter__(self) -> "OpticOddsClient":
+        self.session  # open the pool eagerly
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    @property
+    def session(self) -> httpx.AsyncClient:
+        """The shared pooled session, created on first use."""
+        if self._session is None or self._session.is_closed:
+            self._session = httpx.AsyncClient(
+                base_url=self.BASE_URL,
+                headers=self.headers,
+                http2=self.http2,
+                limits=self.limits,
+                timeout=self.timeout,
+            )
+        return self._session
+
+    async def aclose(self) -> None:
+        """Close the pooled session and its connections."""
+        if self._session is not None:
+            await self._session.aclose()
+            self._session = None
+
+    async def _get(self, path: str, params: dict) -> httpx.Response:
+        """GET on the shared session, recording latency and connection reuse."""
+        opened = False
+
+        async def trace(event_name: str, info: dict) -> None:
+            nonlocal opened
+            if event_name == "connection.connect_tcp.started":
+                opened = True
+
+        url = f"{self.BASE_URL}{path}"
+        cached = self.cache.get(url, params) if self.cache is not None else None
+        if cached is not None and cached.fresh:
+            return self._cached_response(url, params, cached.body)
+
+        start = time.perf_counter()
+        response = await self.session.get(
+            path,
+            params=params,
+            headers=cached.revalidation_headers() if cached is not None else None,
+            extensions={"trace": trace},
+        )
+        self.stats.record(time.perf_counter() - start, reused=not opened)
+        if self.cache is not None and self.cache.ttl(url):
+            body = self.cache.update(url, params, cached, response.status_code, response.content, response.headers)
+            if body is not None and response.status_code == 304:
+                return self._cached_response(url, params, body)
+        return response
+
+    @staticmethod
+    def _cached_response(url: str, params: dict, body: bytes) -> httpx.Response:
+        """A 200 response carrying a cached body."""
+        return httpx.Response(
+            200,
+            content=body,
+            headers={"Content-Type": "application/json"},
+            request=httpx.Request("GET", url, params=params),
+        )
+
+    @staticmethod
+    def _raise_for_status(response: httpx.Response) -> None:
+        """Raise HTTPStatusError with the response body included in the message."""
+        if response.status_code != 200:
+            body = response.text
+            try:
+                body = response.json()
+            except Exception:
+                pass
+            raise httpx.HTTPStatusError(
+                f"API returned {response.status_code}. Response: {body}",
+                request=response.request,
+                response=response,
+            )
+
+    async def load_catalog(self) -> MarketCatalog:
+        """Load the /markets catalog (disk-cached) and prune odds requests against it from now on."""
+        self.catalog = MarketCatalog.from_response(await self.get_markets(sport=self.sport))
+        return self.catalog
+
+    def prune_request(
+        self,
+        sportsbooks: Optional[list[str]] = None,
+        markets: Optional[list[str]] = None,
+        league: Optional[str] = None,
+    ) -> tuple[list[str], list[str], PruneReport]:
+        """
+        The requested sportsbooks/markets (default self.sportsbooks / self.markets) reduced
+        to what the catalog offers in `league` (default self.league); unchanged until
+        load_catalog() is called.
+        """
+        sportsbooks = self.sportsbooks if sportsbooks is None else sportsbooks
+        markets = self.markets if markets is None else markets
+        if self.catalog is None:
+            return list(sportsbooks), list(markets), PruneReport()
+        return self.catalog.prune(self.league if league is None else league, sportsbooks, markets)
+
+    def odds_shards(
+        self,
+        sportsbooks: Optional[list[str]] = None,
+        markets: Optional[list[str]] = None,
+        league: Optional[str] = None,
+    ) -> list[tuple[list[str], list[str]]]:
+        """
+        Plan the API-legal (sportsbooks, markets) shards for an odds request, after pruning
+        combinations the catalog does not offer in `league` (none at all if nothing is left).
+        """
+        sportsbooks, markets, _ = self.prune_request(sportsbooks, markets, league)
+        if not sportsbooks or not markets:
+            return []
+        return plan_shards(
+            sportsbooks,
+            markets,
+            max_sportsbooks=self.max_sportsbooks_per_request,
+            max_markets=self.max_markets_per_request,
+        )
+
+    def _odds_params(self, fixture_id: str, sportsbooks: list[str], markets: list[str]) -> dict:
+        """Build params for one odds shard. API allows max 5 sportsbooks per request."""
         return {
             "fixture_id": fixture_id,
-            "sportsbook": self.sportsbooks[:5],
-            "market": self.markets,
+            "sportsbook": sportsbooks,
+            "market": markets,
             "is_main": True,
         }
 
-    async def get_odds(self, fixture_id: str) -> dict:
+    async def _get_odds_sharded(
+        self,
+        path: str,
+        fixture_id: str,
+        sportsbooks: Optional[list[str]],
+        markets: Optional[list[str]],
+    ) -> dict:
+        """Issue every shard for a fixture concurrently and merge the odds by id."""
+
+        async def fetch_shard(shard_books: list[str], shard_markets: list[str]) -> dict:
+            params = self._odds_params(fixture_id, shard_books, shard_markets)
+            response = await self._get(path, params)
+            self._raise_for_status(response)
+            return response.json()
+
+        shards = self.odds_shards(sportsbooks, markets)
+        if not shards:
+            return {"data": []}
+        if len(shards) == 1:
+            return await fetch_shard(*shards[0])
+        responses = await asyncio.gather(*(fetch_shard(b, m) for b, m in shards))
+        return merge_odds_responses(responses)
+
+    async def get_odds(
+        self,
+        fixture_id: str,
+        sportsbooks: Optional[list[str]] = None,
+        markets: Optional[list[str]] = None,
+    ) -> dict:
         """
         Fetch current odds for a fixture.
-        API allows max 5 sportsbooks per request.
+        API allows max 5 sportsbooks per request, so more books (or markets beyond
+        max_markets_per_request) are split into shards and merged by odds id.
+        Defaults to self.sportsbooks / self.markets.
         """
-        params = self._odds_params(fixture_id)
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.BASE_URL}/fixtures/odds",
-                headers=self.headers,
-                params=params,
-            )
-            if response.status_code != 200:
-                body = response.text
-                try:
-                    body = response.json()
-                except Exception:
-                    pass
-                raise httpx.HTTPStatusError(
-                    f"API returned {response.status_code}. Response: {body}",
-                    request=response.request,
-                    response=response,
-                )
-            return response.json()
+        return await self._get_odds_sharded("/fixtures/odds", fixture_id, sportsbooks, markets)
 
-    async def get_odds_historical(self, fixture_id: str) -> dict:
+    async def get_odds_historical(
+        self,
+        fixture_id: str,
+        sportsbooks: Optional[list[str]] = None,
+        markets: Optional[list[str]] = None,
+    ) -> dict:
         """
         Fetch historical odds for a fixture (e.g. a completed or popular game).
-        Same 5-sportsbook cap as get_odds. Pass a fixture_id that has odds data.
+        Sharded and merged the same way as get_odds. Pass a fixture_id that has odds data.
         """
-        params = self._odds_params(fixture_id)
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.BASE_URL}/fixtures/odds/historical",
-                headers=self.headers,
-                params=params,
-            )
-            if response.status_code != 200:
-                body = response.text
-                try:
-                    body = response.json()
-                except Exception:
-                    pass
-                raise httpx.HTTPStatusError(
-                    f"API returned {response.status_code}. Response: {body}",
-                    request=response.request,
-                    response=response,
-                )
-            return response.json()
+        return await self._get_odds_sharded(
+            "/fixtures/odds/historical", fixture_id, sportsbooks, markets
+        )
+
+    async def _get_odds_body(self, path: str, fixture_id: str, sportsbooks: list[str], markets: list[str]) -> bytes:
+        """One odds request for a single planned shard (see odds_shards), as the raw JSON body."""
+        response = await self._get(path, self._odds_params(fixture_id, sportsbooks, markets))
+        self._raise_for_status(response)
+        return response.content
+
+    async def get_odds_body(self, fixture_id: str, sportsbooks: list[str], markets: list[str]) -> bytes:
+        """
+        Current odds for one shard as response bytes, for opticodds.records.decode_odds_response
+        (which parses them straight into OddsRecords) instead of a parsed dict.
+        """
+        return await self._get_odds_body("/fixtures/odds", fixture_id, sportsbooks, markets)
+
+    async def get_odds_historical_body(self, fixture_id: str, sportsbooks: list[str], markets: list[str]) -> bytes:
+        """Like get_odds_body, for historical odds."""
+        return await self._get_odds_body("/fixtures/odds/historical", fixture_id, sportsbooks, markets)
     
     async def get_fixtures(
         self,
@@ -170,14 +390,9 @@ class OpticOddsClient:
         if season_type:
             params["season_type"] = season_type
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.BASE_URL}/fixtures",
-                headers=self.headers,
-                params=params,
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self._get("/fixtures", params)
+        response.raise_for_status()
+        return response.json()
     
     async def get_active_fixtures(
         self,
@@ -191,15 +406,34 @@ class OpticOddsClient:
         if league:
             params["league"] = league
             
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.BASE_URL}/fixtures/active",
-                headers=self.headers,
-                params=params,
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self._get("/fixtures/active", params)
+        response.raise_for_status()
+        return response.json()
     
+    async def get_markets(self, sport: Optional[str] = None, league: Optional[str] = None) -> dict:
+        """Get the market catalog (cached on disk, see opticodds.http_cache)."""
+        params = {}
+        if sport:
+            params["sport"] = sport
+        if league:
+            params["league"] = league
+        response = await self._get("/markets", params)
+        self._raise_for_status(response)
+        return response.json()
+
+    async def get_leagues(self, sport: Optional[str] = None) -> dict:
+        """Get leagues (cached on disk)."""
+        params = {"sport": sport} if sport else {}
+        response = await self._get("/leagues", params)
+        self._raise_for_status(response)
+        return response.json()
+
+    async def get_sportsbooks(self) -> dict:
+        """Get sportsbooks (cached on disk)."""
+        response = await self._get("/sportsbooks", {})
+        self._raise_for_status(response)
+        return response.json()
+
     async def get_all_fixtures_paginated(
         self,
         max_pages: int = 10,
@@ -238,50 +472,245 @@ class OpticOddsClient:
         return all_fixtures
 
 
-async def main():
+def export_parquet(fixtures_path: Path, odds_path: Path, parquet_dir: Path) -> None:
+    """Write the collector's fixtures/odds files as partitioned Parquet datasets (see bigquery.parquet_dataset)."""
+    from bigquery.parquet_dataset import export
+
+    n_fixtures, n_odds = export(fixtures_path, odds_path, parquet_dir)
+    print(f"Wrote {n_fixtures} fixtures and {n_odds} odds as Parquet under {parquet_dir}")
+
+
+async def main(
+    incremental: bool = False,
+    state_db: Path = Path("ingestion_state.sqlite"),
+    ndjson: bool = False,
+    poll_ticks_dir: Optional[Path] = None,
+    poll_interval: float = 30.0,
+    stream_ticks_dir: Optional[Path] = None,
+    parquet_dir: Optional[Path] = None,
+    calendar: Optional[list[Tournament]] = None,
+    budget: Optional[int] = None,
+):
     settings = OddsJamSettings()
+    fixture_filters = dict(
+        sport="tennis",
+        league="atp",
+        start_date_after="2026-01-11T00:00:00Z",
+        start_date_before="2026-02-02T00:00:00Z",
+        season_type="Australian Open",
+    )
     
-    # Initialize the OpticOdds client
-    client = OpticOddsClient(settings.api_key)
-    
-    # Example 1: Get active tennis fixtures
-    print("=" * 60)
-    print("Fetching active tennis fixtures...")
-    print("=" * 60)
-    all_fixtures = []
-    for season_week in client.season_week:
-        fixtures = await client.get_all_fixtures_paginated(
-            sport="tennis",
-            league="atp",
-            start_date_after="2026-01-11T00:00:00Z",
-            start_date_before="2026-02-02T00:00:00Z",
-            season_week=season_week,
-            season_type="Australian Open",
-        )
+    # Initialize the OpticOdds client (one pooled session for the whole run)
+    async with OpticOddsClient(settings.api_key) as client:
+        engine = FetchEngine(concurrency=8, rate=10.0)
+        try:
+            await client.load_catalog()
+            print(f"Catalog: {client.catalog.summary()}; pruned: {client.prune_request()[2].summary()}")
+        except (httpx.HTTPError, ValueError, KeyError) as e:
+            # Pruning is an optimization; collect unpruned rather than not at all.
+            client.catalog = None
+            print(f"Catalog unavailable ({e!r}); odds requests are not pruned")
+
+        if calendar is not None:
+            # Scheduler mode: every tournament in the calendar, live/near-start fixtures first.
+            fixtures_path, odds_path = Path("tournaments_fixtures.ndjson"), Path("tournaments_odds.ndjson")
+            with NdjsonWriter(fixtures_path) as fixtures_out, NdjsonWriter(odds_path) as odds_out:
+                scheduler = TournamentScheduler(
+                    client,
+                    engine,
+                    calendar,
+                    on_fixture=lambda tournament, fixture: fixtures_out.write(fixture),
+                    on_odds=lambda tournament, fixture, odds: odds_out.write_many(odds),
+                    max_requests=budget,
+                )
+                await scheduler.run()
+            print(f"Wrote {fixtures_out.count} fixtures to {fixtures_path} and {odds_out.count} odds to {odds_path}")
+            print(f"Scheduler: {scheduler.summary()}")
+            if parquet_dir:
+                export_parquet(fixtures_path, odds_path, parquet_dir)
+            print(f"HTTP: {client.stats.summary()}")
+            print(f"Engine: {engine.summary()}")
+            return
 
-        all_fixtures.extend(fixtures)
+        if stream_ticks_dir is not None:
+            # Live mode: consume the odds stream and record changed prices as ticks.
+            with TickStore(stream_ticks_dir) as store:
+                recorder = TickRecorder(store)
+                consumer = OddsStreamConsumer(
+                    client, OddsBook(), tick_sink(recorder), league=fixture_filters["league"]
+                )
+                try:
+                    await consumer.run()
+                finally:
+                    print(f"Stream: {consumer.summary()}; ticks: {recorder.summary()}")
+            return
+
+        if poll_ticks_dir is not None:
+            # Snapshot/poll mode: record every price change of active fixtures as ticks.
+            async def active_fixture_ids() -> list[str]:
+                result = await engine.call(
+                    client.get_active_fixtures, sport=fixture_filters["sport"], league=fixture_filters["league"]
+                )
+                return [
+                    f["id"]
+                    for f in result.get("data", [])
+                    if (f.get("season_type") or "").startswith(fixture_filters["season_type"])
+                ]
+
+            with TickStore(poll_ticks_dir) as store:
+                recorder = TickRecorder(store)
+                await poll_ticks(client, engine, recorder, active_fixture_ids, interval=poll_interval)
+            return
+
+        if incremental:
+            with IngestionState(state_db) as state:
+                counts = await ingest_incremental(
+                    client,
+                    engine,
+                    state,
+                    Path("australian_open_fixtures.json"),
+                    Path("australian_open_odds.json"),
+                    client.season_week,
+                    **fixture_filters,
+                )
+                print(f"Incremental run: {counts}, state: {state.summary()}")
+            if parquet_dir:
+                export_parquet(Path("australian_open_fixtures.json"), Path("australian_open_odds.json"), parquet_dir)
+            print(f"HTTP: {client.stats.summary()}")
+            print(f"Engine: {engine.summary()}")
+            return
+
+        if ndjson:
+            # Streaming mode: append compact records as responses arrive; keep only ids in memory.
+            fixture_ids = []
+            with NdjsonWriter("australian_open_fixtures.ndjson") as out:
+                async for fixture in fetch_fixtures(client, engine, client.season_week, **fixture_filters):
+                    out.write(fixture)
+                    fixture_ids.append(fixture["id"])
+            print(f"Wrote {out.count} fixtures to {out.path}")
+            with NdjsonWriter("australian_open_odds.ndjson") as out:
+                async for fixture_id, odds in fetch_odds_historical(client, engine, fixture_ids):
+                    out.write_many(odds)
+            print(f"Wrote {out.count} odds to {out.path}")
+            if parquet_dir:
+                export_parquet(Path("australian_open_fixtures.ndjson"), out.path, parquet_dir)
+            print(f"HTTP: {client.stats.summary()}")
+            print(f"Engine: {engine.summary()}")
+            return
+
+        # Example 1: Get active tennis fixtures
+        print("=" * 60)
+        print("Fetching active tennis fixtures...")
+        print("=" * 60)
+        all_fixtures = [
+            fixture
+            async for fixture in fetch_fixtures(client, engine, client.season_week, **fixture_filters)
+        ]
+
+        with open("australian_open_fixtures.json", "w") as f:
+            json.dump(all_fixtures, f, indent=2)
+        print("Done!")
 
-    with open("australian_open_fixtures.json", "w") as f:
-        json.dump(all_fixtures, f, indent=2)
-    print("Done!")
+        all_odds = []
+        fixture_ids = [f["id"] for f in all_fixtures]
+        async for fixture_id, odds in fetch_odds_historical(client, engine, fixture_ids):
+            all_odds.extend(odds)
 
-    all_odds = []
-    fixture_ids = [f["id"] for f in all_fixtures]
-    for fixture_id in fixture_ids:
-        response = await client.get_odds_historical(fixture_id=fixture_id)
-        data = response.get("data", [])
-        if not data:
-            continue
-        odds = data[0].get("odds", [])
-        for o in odds:
-            o["fixture_id"] = fixture_id
-        all_odds.extend(odds)
+        with open("australian_open_odds.json", "w") as f:
+            json.dump(all_odds, f, indent=2)
+        print("Done!")
+        if parquet_dir:
+            from bigquery.parquet_dataset import write_fixtures_dataset, write_odds_dataset
 
-    with open("australian_open_odds.json", "w") as f:
-        json.dump(all_odds, f, indent=2)
-    print("Done!")
+            n_fixtures = write_fixtures_dataset(all_fixtures, parquet_dir)
+            n_odds = write_odds_dataset(all_odds, all_fixtures, parquet_dir)
+            print(f"Wrote {n_fixtures} fixtures and {n_odds} odds as Parquet under {parquet_dir}")
+        print(f"HTTP: {client.stats.summary()}")
+        print(f"Engine: {engine.summary()}")
 
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Collect Australian Open fixtures and odds from OpticOdds")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only fetch odds for new or changed fixtures; keep what is already on disk",
+    )
+    parser.add_argument(
+        "--state-db",
+        type=Path,
+        default=Path("ingestion_state.sqlite"),
+        help="SQLite state store for --incremental (default: ingestion_state.sqlite)",
+    )
+    parser.add_argument(
+        "--ndjson",
+        action="store_true",
+        help="Stream fixtures/odds to australian_open_*.ndjson as they arrive instead of one JSON dump",
+    )
+    parser.add_argument(
+        "--poll-ticks",
+        type=Path,
+        default=None,
+        metavar="DIR",
+        help="Poll active fixtures' odds forever, recording price changes as Parquet ticks in DIR",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=30.0,
+        help="Seconds between polls for --poll-ticks (default: 30)",
+    )
+    parser.add_argument(
+        "--stream-ticks",
+        type=Path,
+        default=None,
+        metavar="DIR",
+        help="Consume the live odds stream forever, recording price changes as Parquet ticks in DIR",
+    )
+    parser.add_argument(
+        "--parquet",
+        type=Path,
+        default=None,
+        metavar="DIR",
+        help="Also write fixtures/odds as partitioned Parquet datasets under DIR (tournament/season_week/market)",
+    )
+    parser.add_argument(
+        "--schedule",
+        action="store_true",
+        help="Collect every tournament in the Sportradar calendar (--from/--to/--levels) instead of the Australian Open",
+    )
+    parser.add_argument("--from", dest="date_from", type=date.fromisoformat, default=None, help="Calendar start, YYYY-MM-DD")
+    parser.add_argument("--to", dest="date_to", type=date.fromisoformat, default=None, help="Calendar end, YYYY-MM-DD")
+    parser.add_argument(
+        "--levels",
+        default="grand_slam,atp_1000,wta_1000",
+        help="Comma-separated Sportradar tournament levels for --schedule, or 'all'",
+    )
+    parser.add_argument(
+        "--budget",
+        type=int,
+        default=None,
+        help="Max API requests for --schedule; historical backfill is dropped first",
+    )
+    args = parser.parse_args()
+    if args.ndjson and args.incremental:
+        parser.error("--ndjson and --incremental cannot be combined")
+    calendar = None
+    if args.schedule:
+        levels = None if args.levels == "all" else args.levels.split(",")
+        calendar = load_calendar(levels=levels, start=args.date_from, end=args.date_to)
+        print(f"Calendar: {len(calendar)} tournaments")
+    asyncio.run(
+        main(
+            incremental=args.incremental,
+            state_db=args.state_db,
+            ndjson=args.ndjson,
+            poll_ticks_dir=args.poll_ticks,
+            poll_interval=args.interval,
+            stream_ticks_dir=args.stream_ticks,
+            parquet_dir=args.parquet,
+            calendar=calendar,
+            budget=args.budget,
+        )
+    )
\ No newline at end of file
@@ -0,0 +1,29 @@
+"""
+OpticOdds collection helpers for tennis-origination.
+
+- catalog: indexed /markets catalog (market, league and sportsbook lookups) and request pruning.
+- fetch: FetchEngine (bounded concurrency, token-bucket rate limit, retry/backoff).
+- backfill: concurrent fixture and historical-odds fan-out on top of FetchEngine.
+- records: compact slotted odds records (skipped link/depth fields, interned strings)
+  and the OddsBatch struct-of-arrays view.
+- scheduler: multi-tournament calendar (Sportradar seasons -> OpticOdds filters) collected
+  concurrently under one API budget, live and near-start fixtures first.
+- http_cache: on-disk response cache (TTL, ETag/generated_at revalidation, LRU) for reference endpoints.
+- stream: live SSE odds consumer with an in-memory latest-price book.
+- stub_server: local stub of the OpticOdds endpoints for exercising the above.
+"""
+
+from opticodds.backfill import fetch_fixtures, fetch_odds, fetch_odds_historical
+from opticodds.fetch import FetchEngine, TokenBucket
+from opticodds.records import OddsBatch, OddsRecord, decode_odds_response
+
+__all__ = [
+    "FetchEngine",
+    "OddsBatch",
+    "OddsRecord",
+    "TokenBucket",
+    "decode_odds_response",
+    "fetch_fixtures",
+    "fetch_odds",
+    "fetch_odds_historical",
+]
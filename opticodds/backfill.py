@@ -0,0 +1,129 @@
+"""
+Concurrent fixture and odds backfill on top of FetchEngine.
+
+Both helpers take an OpticOddsClient-like object (get_fixtures / get_odds_historical /
+odds_shards; get_odds_historical_body for records) and stream results as requests
+complete instead of waiting for the whole draw.
+"""
+
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable
+
+from opticodds.fetch import FetchEngine
+from opticodds.records import OddsRecord, decode_odds_response, merge_records
+from opticodds.sharding import merge_odds_responses
+
+
+async def fetch_fixtures(
+    client: Any,
+    engine: FetchEngine,
+    season_weeks: Iterable[str | None],
+    max_pages: int = 10,
+    **filters: Any,
+) -> AsyncIterator[dict]:
+    """
+    Yield fixtures for every season_week, fanning out across weeks and pages.
+    Page 1 of each week is requested up front; once it reports total_pages, the
+    remaining pages of that week are scheduled immediately. `filters` are passed
+    through to client.get_fixtures (sport, league, season_type, start_date_*, ...).
+    """
+    pending: dict[asyncio.Task, tuple[str | None, int]] = {}
+
+    def schedule(season_week: str | None, page: int) -> None:
+        task = asyncio.create_task(
+            engine.call(client.get_fixtures, page=page, season_week=season_week, **filters)
+        )
+        pending[task] = (season_week, page)
+
+    for season_week in season_weeks:
+        schedule(season_week, 1)
+    try:
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                season_week, page = pending.pop(task)
+                result = task.result()
+                if page == 1:
+                    total_pages = min(result.get("total_pages", 1), max_pages)
+                    for next_page in range(2, total_pages + 1):
+                        schedule(season_week, next_page)
+                fixtures = result.get("data", [])
+                print(f"Fetched {season_week} page {page} ({len(fixtures)} fixtures)")
+                for fixture in fixtures:
+                    yield fixture
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def _fetch_odds_sharded(
+    fetch: Callable[..., Awaitable[dict | bytes]],
+    client: Any,
+    engine: FetchEngine,
+    fixture_ids: Iterable[str],
+    records: bool = False,
+) -> AsyncIterator[tuple[str, list[dict]] | tuple[str, list[OddsRecord]]]:
+    """
+    With records=True, `fetch` returns response bytes, decoded per shard straight into
+    OddsRecords (decode_odds_response) and merged on records; otherwise parsed dicts.
+    """
+    shards = client.odds_shards()
+    if not shards:
+        # Nothing requestable (e.g. everything pruned by the catalog): no odds for any fixture.
+        for fixture_id in fixture_ids:
+            yield fixture_id, []
+        return
+    responses: dict[str, list] = {}
+
+    def fetch_shard(item: tuple[str, tuple[list[str], list[str]]]) -> Awaitable[dict | bytes]:
+        fixture_id, (sportsbooks, markets) = item
+        return fetch(fixture_id, sportsbooks=sportsbooks, markets=markets)
+
+    items = ((fixture_id, shard) for fixture_id in fixture_ids for shard in shards)
+    async for (fixture_id, _), response in engine.map(fetch_shard, items):
+        responses.setdefault(fixture_id, []).append(decode_odds_response(response) if records else response)
+        if len(responses[fixture_id]) < len(shards):
+            continue
+        if records:
+            yield fixture_id, merge_records(responses.pop(fixture_id))
+            continue
+        data = merge_odds_responses(responses.pop(fixture_id)).get("data", [])
+        odds = data[0].get("odds", []) if data else []
+        start_date = data[0].get("start_date") if data else None
+        for o in odds:
+            o["fixture_id"] = fixture_id
+            o["fixture_start_date"] = start_date
+        yield fixture_id, odds
+
+
+async def fetch_odds_historical(
+    client: Any,
+    engine: FetchEngine,
+    fixture_ids: Iterable[str],
+    records: bool = False,
+) -> AsyncIterator[tuple[str, list[dict]] | tuple[str, list[OddsRecord]]]:
+    """
+    Yield (fixture_id, odds) for every fixture as its historical odds arrive.
+    Each (fixture, sportsbook/market shard) is a separate engine call, so shards are
+    rate limited and retried individually; a fixture is yielded once all of its shards
+    are in, merged and deduped by odds id. Each odds record is stamped with fixture_id
+    and fixture_start_date (the odds table's partition column); fixtures without odds yield [].
+    With records=True the odds come as compact OddsRecords (opticodds.records) instead of
+    dicts, decoded from the response bytes (client.get_odds_historical_body) without
+    building the full dicts first.
+    """
+    fetch = client.get_odds_historical_body if records else client.get_odds_historical
+    async for item in _fetch_odds_sharded(fetch, client, engine, fixture_ids, records):
+        yield item
+
+
+async def fetch_odds(
+    client: Any,
+    engine: FetchEngine,
+    fixture_ids: Iterable[str],
+    records: bool = False,
+) -> AsyncIterator[tuple[str, list[dict]] | tuple[str, list[OddsRecord]]]:
+    """Like fetch_odds_historical, for current odds (get_odds / get_odds_body)."""
+    fetch = client.get_odds_body if records else client.get_odds
+    async for item in _fetch_odds_sharded(fetch, client, engine, fixture_ids, records):
+        yield item
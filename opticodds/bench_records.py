@@ -0,0 +1,112 @@
+"""
+Benchmark OddsRecord decoding against the json.loads + dict path.
+
+Builds /fixtures/odds response bodies from the recorded Australian Open fixtures with
+the djokovic_musetti.json odds cloned per sportsbook (as the stub server does), then
+for every body:
+1. dicts: json.loads, keep the odds dicts (stamped with fixture_id as the collector
+   does), then odds_row_to_bq per row;
+2. records: decode_odds_response into OddsRecords, through json.loads and, when
+   msgspec is installed, through msgspec; then to_bq_row per row;
+3. batch: OddsBatch.from_records over all records.
+Reports decode throughput (rows/s) and retained memory per row (tracemalloc).
+
+Run from project root:
+  uv run python -m opticodds.bench_records --books 8
+"""
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+from bigquery.schema import odds_row_to_bq
+from opticodds.records import OddsBatch, decode_odds_response, msgspec
+from opticodds.stub_server import StubOpticOddsServer
+
+BOOKS = ["DraftKings", "FanDuel", "BetMGM", "Caesars", "Pinnacle", "bet365", "Bovada", "Hard Rock", "ESPN BET", "Fanatics"]
+
+
+def response_bodies(books: int) -> list[bytes]:
+    server = StubOpticOddsServer.from_recorded(sportsbooks=BOOKS[:books])
+    return [
+        json.dumps({"data": [{**fixture, "odds": server.odds_by_fixture[fixture["id"]]}]}).encode()
+        for fixture in server.fixtures
+    ]
+
+
+def decode_dicts(bodies: list[bytes]) -> list[dict]:
+    out = []
+    for body in bodies:
+        fixture = json.loads(body)["data"][0]
+        for o in fixture["odds"]:
+            o["fixture_id"] = fixture["id"]
+            o["fixture_start_date"] = fixture.get("start_date")
+        out.extend(fixture["odds"])
+    return out
+
+
+def decode_records(bodies: list[bytes], use_msgspec: bool) -> list:
+    out = []
+    for body in bodies:
+        out.extend(decode_odds_response(body, use_msgspec=use_msgspec))
+    return out
+
+
+def measure(fn, *args) -> tuple[object, float, int]:
+    """(result, seconds, retained bytes). Timed without tracemalloc, then measured with it."""
+    gc.collect()
+    start = time.perf_counter()
+    fn(*args)
+    seconds = time.perf_counter() - start
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = fn(*args)
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return result, seconds, retained
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark OddsRecord decoding vs json.loads + dicts")
+    parser.add_argument("--books", type=int, default=8, help=f"Sportsbooks per fixture, max {len(BOOKS)} (default: 8)")
+    args = parser.parse_args()
+
+    bodies = response_bodies(min(args.books, len(BOOKS)))
+    size = sum(map(len, bodies))
+    ingested_at = datetime.now(timezone.utc).isoformat()
+    dicts, dict_s, dict_bytes = measure(decode_dicts, bodies)
+    records, record_s, record_bytes = measure(decode_records, bodies, False)
+    rows = len(records)
+    assert len(dicts) == rows
+    assert dicts and odds_row_to_bq(dicts[0], ingested_at) == records[0].to_bq_row(ingested_at)
+
+    print(f"{len(bodies)} responses, {size / 1e6:.1f} MB, {rows:,} odds rows")
+    print(f"{'path':<26} {'seconds':>9} {'rows/s':>12} {'bytes/row':>10}")
+    print(f"{'json.loads + dicts':<26} {dict_s:>9.3f} {rows / dict_s:>12,.0f} {dict_bytes / rows:>10,.0f}")
+    print(f"{'OddsRecord (json.loads)':<26} {record_s:>9.3f} {rows / record_s:>12,.0f} {record_bytes / rows:>10,.0f}")
+    if msgspec is not None:
+        fast, fast_s, fast_bytes = measure(decode_records, bodies, True)
+        assert [r.to_bq_row(ingested_at) for r in fast[:1000]] == [r.to_bq_row(ingested_at) for r in records[:1000]]
+        print(f"{'OddsRecord (msgspec)':<26} {fast_s:>9.3f} {rows / fast_s:>12,.0f} {fast_bytes / rows:>10,.0f}")
+        del fast
+    else:
+        print("(install msgspec for the direct-decode path)")
+
+    _, bq_dict_s, _ = measure(lambda: [odds_row_to_bq(o, ingested_at) for o in dicts])
+    _, bq_record_s, _ = measure(lambda: [r.to_bq_row(ingested_at) for r in records])
+    print(f"{'odds_row_to_bq (dicts)':<26} {bq_dict_s:>9.3f} {rows / bq_dict_s:>12,.0f}")
+    print(f"{'to_bq_row (records)':<26} {bq_record_s:>9.3f} {rows / bq_record_s:>12,.0f}")
+
+    del dicts
+    batch, batch_s, batch_bytes = measure(OddsBatch.from_records, records)
+    print(f"{'OddsBatch.from_records':<26} {batch_s:>9.3f} {rows / batch_s:>12,.0f} {batch_bytes / rows:>10,.0f}")
+    print(f"memory: {dict_bytes / record_bytes:.1f}x less with records")
+
+
+if __name__ == "__main__":
+    main()
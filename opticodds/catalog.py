@@ -0,0 +1,213 @@
+"""
+Indexed OpticOdds market catalog (/markets, as in markets.json).
+
+The catalog nests market -> sports -> leagues -> sportsbooks. MarketCatalog walks it
+once and builds hash indexes:
+- market(id): market by id;
+- markets(league): market ids offered in a league (catalog order);
+- sportsbooks(market, league): books offering a market in a league;
+- markets_for_book(book, league=None): the inverse, book -> market ids;
+- find("1st_set_*"): prefix queries over a sorted id list (bisect), other globs by fnmatch.
+
+prune() reduces a requested (sportsbooks, markets) set to the combinations the
+catalog says exist for a league. OpticOddsClient.load_catalog() fetches /markets
+through the on-disk response cache (opticodds.http_cache, refreshed daily) and from
+then on odds_shards() prunes every odds request before it is planned, so no request
+is spent on a market no requested book offers.
+
+    catalog = MarketCatalog.from_file("markets.json")
+    catalog.find("1st_set_*", league="atp")
+    books, markets, report = catalog.prune("atp", client.sportsbooks, client.markets)
+
+Run from project root:
+  uv run python -m opticodds.catalog --league atp --find "1st_set_*"
+  uv run python -m opticodds.catalog --league atp --book draftkings
+"""
+
+import argparse
+import bisect
+import fnmatch
+import json
+from pathlib import Path
+from typing import Iterable
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+class PruneReport:
+    """What prune() dropped from a request, and why."""
+
+    def __init__(self) -> None:
+        self.unknown_markets: list[str] = []
+        self.unknown_sportsbooks: list[str] = []
+        self.unoffered_markets: list[str] = []  # known, but no requested book offers it in the league
+        self.unused_sportsbooks: list[str] = []  # offer none of the requested markets in the league
+
+    def __bool__(self) -> bool:
+        return bool(self.unknown_markets or self.unknown_sportsbooks or self.unoffered_markets or self.unused_sportsbooks)
+
+    def summary(self) -> str:
+        if not self:
+            return "nothing pruned"
+        parts = []
+        for label, items in (
+            ("unknown markets", self.unknown_markets),
+            ("unknown sportsbooks", self.unknown_sportsbooks),
+            ("markets no requested book offers", self.unoffered_markets),
+            ("sportsbooks offering none of the markets", self.unused_sportsbooks),
+        ):
+            if items:
+                parts.append(f"{label}: {', '.join(items)}")
+        return "; ".join(parts)
+
+
+class MarketCatalog:
+    """Hash indexes over the /markets catalog; see the module docstring."""
+
+    def __init__(self, markets: Iterable[dict]) -> None:
+        self._markets: dict[str, dict] = {}
+        self._league_markets: dict[str, list[str]] = {}
+        self._books: dict[tuple[str, str], frozenset[str]] = {}
+        self._book_markets: dict[tuple[str, str], set[str]] = {}
+        self._book_names: dict[str, str] = {}
+        self._league_names: dict[str, str] = {}
+        for market in markets:
+            market_id = market["id"]
+            self._markets[market_id] = {k: v for k, v in market.items() if k != "sports"}
+            for sport in market.get("sports") or []:
+                for league in sport.get("leagues") or []:
+                    league_id = league["id"]
+                    self._league_names[league_id] = league.get("name")
+                    self._league_markets.setdefault(league_id, []).append(market_id)
+                    books = frozenset(b["id"] for b in league.get("sportsbooks") or [])
+                    self._books[(market_id, league_id)] = books
+                    for book in league.get("sportsbooks") or []:
+                        self._book_names[book["id"]] = book.get("name")
+                        self._book_markets.setdefault((book["id"], league_id), set()).add(market_id)
+        self._sorted_ids = sorted(self._markets)
+
+    @classmethod
+    def from_response(cls, response: dict) -> "MarketCatalog":
+        return cls(response.get("data", []))
+
+    @classmethod
+    def from_file(cls, path: Path | str = ROOT / "markets.json") -> "MarketCatalog":
+        with open(path) as f:
+            return cls.from_response(json.load(f))
+
+    def __len__(self) -> int:
+        return len(self._markets)
+
+    def __contains__(self, market_id: str) -> bool:
+        return market_id in self._markets
+
+    def market(self, market_id: str) -> dict | None:
+        return self._markets.get(market_id)
+
+    def leagues(self) -> dict[str, str]:
+        """League id -> name for every league in the catalog."""
+        return dict(self._league_names)
+
+    def markets(self, league: str | None = None) -> list[str]:
+        """Market ids, all or those offered in `league`."""
+        if league is None:
+            return list(self._markets)
+        return list(self._league_markets.get(league, []))
+
+    def sportsbooks(self, market_id: str | None = None, league: str | None = None) -> frozenset[str]:
+        """Books offering market_id in league; all known books when both are None."""
+        if market_id is None and league is None:
+            return frozenset(self._book_names)
+        if market_id is None or league is None:
+            raise ValueError("pass both market_id and league, or neither")
+        return self._books.get((market_id, league), frozenset())
+
+    def sportsbook_name(self, book: str) -> str | None:
+        return self._book_names.get(book)
+
+    def markets_for_book(self, book: str, league: str | None = None) -> set[str]:
+        """Market ids a book offers, in one league or across all of them."""
+        if league is not None:
+            return set(self._book_markets.get((book, league), ()))
+        return set().union(*(m for (b, _), m in self._book_markets.items() if b == book))
+
+    def offers(self, book: str, market_id: str, league: str) -> bool:
+        return book in self._books.get((market_id, league), ())
+
+    def find(self, pattern: str, league: str | None = None) -> list[str]:
+        """
+        Market ids matching a glob. A plain prefix ("1st_set_*") is a bisect range over
+        the sorted ids; other patterns fall back to fnmatch. Filtered to `league` if given.
+        """
+        prefix = pattern[:-1] if pattern.endswith("*") else None
+        if prefix is not None and not any(c in prefix for c in "*?["):
+            start = bisect.bisect_left(self._sorted_ids, prefix)
+            end = bisect.bisect_left(self._sorted_ids, prefix + "\U0010ffff")
+            found = self._sorted_ids[start:end]
+        else:
+            found = fnmatch.filter(self._sorted_ids, pattern)
+        if league is not None:
+            found = [m for m in found if (m, league) in self._books]
+        return found
+
+    def prune(
+        self, league: str, sportsbooks: Iterable[str], markets: Iterable[str]
+    ) -> tuple[list[str], list[str], PruneReport]:
+        """
+        Keep the requested markets that at least one requested book offers in league,
+        and the books that offer at least one kept market (request order, duplicates
+        dropped). Returns (sportsbooks, markets, report).
+        """
+        report = PruneReport()
+        books = list(dict.fromkeys(sportsbooks))
+        market_ids = list(dict.fromkeys(markets))
+        known_books = [b for b in books if b in self._book_names]
+        report.unknown_sportsbooks = [b for b in books if b not in self._book_names]
+        report.unknown_markets = [m for m in market_ids if m not in self._markets]
+
+        requested = set(known_books)
+        kept_markets = []
+        for m in market_ids:
+            if m not in self._markets:
+                continue
+            if self._books.get((m, league), frozenset()) & requested:
+                kept_markets.append(m)
+            else:
+                report.unoffered_markets.append(m)
+        used = set().union(*(self._books[(m, league)] for m in kept_markets)) if kept_markets else set()
+        kept_books = [b for b in known_books if b in used]
+        report.unused_sportsbooks = [b for b in known_books if b not in used]
+        return kept_books, kept_markets, report
+
+    def summary(self) -> str:
+        return (
+            f"{len(self._markets)} markets, {len(self._league_names)} leagues, "
+            f"{len(self._book_names)} sportsbooks, {len(self._books)} market/league pairs"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Query the OpticOdds market catalog")
+    parser.add_argument("--path", type=Path, default=ROOT / "markets.json", help="Catalog file (default: markets.json)")
+    parser.add_argument("--league", default=None, help="League id, e.g. atp")
+    parser.add_argument("--find", default=None, metavar="PATTERN", help='Market id glob, e.g. "1st_set_*"')
+    parser.add_argument("--book", default=None, help="List the markets a sportsbook offers")
+    parser.add_argument("--market", default=None, help="List the sportsbooks offering a market (needs --league)")
+    args = parser.parse_args()
+
+    catalog = MarketCatalog.from_file(args.path)
+    print(catalog.summary())
+    if args.find:
+        print("\n".join(catalog.find(args.find, args.league)))
+    if args.book:
+        print("\n".join(sorted(catalog.markets_for_book(args.book, args.league))))
+    if args.market:
+        if not args.league:
+            parser.error("--market needs --league")
+        print("\n".join(sorted(catalog.sportsbooks(args.market, args.league))))
+    if not (args.find or args.book or args.market):
+        print("\n".join(catalog.markets(args.league)))
+
+
+if __name__ == "__main__":
+    main()
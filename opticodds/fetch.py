@@ -0,0 +1,165 @@
+"""
+Bounded-concurrency, rate-limit-aware fetch engine for the OpticOdds API.
+
+- TokenBucket: client-side request rate limit shared by every call on an engine.
+- FetchEngine: semaphore + token bucket + retry with backoff on 429/5xx and
+  transport errors, honoring Retry-After. `map` fans a coroutine function out
+  over many inputs and yields results as they complete.
+
+The engine does not know about endpoints; it wraps any coroutine function that
+raises httpx.HTTPStatusError on a bad status (e.g. OpticOddsClient methods).
+"""
+
+import asyncio
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable
+
+import httpx
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def retry_after_seconds(response: httpx.Response) -> float | None:
+    """Parse a Retry-After header (delta-seconds or HTTP date). None if absent/invalid."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class TokenBucket:
+    """
+    Async token bucket: `rate` tokens per second, bursting up to `capacity`.
+    pause() blocks all acquirers until a deadline (used when the server returns 429).
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for `seconds` (extends, never shortens, a pause)."""
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    async def acquire(self) -> None:
+        """Wait until a token is available, then take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    await asyncio.sleep(self._blocked_until - now)
+                    continue
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class FetchEngine:
+    """
+    Runs API calls with at most `concurrency` in flight and at most `rate` started
+    per second. Retries 429/5xx responses and transport errors up to `max_retries`
+    times, waiting Retry-After when the server sends it and exponential backoff
+    with jitter otherwise. A 429 pauses the whole bucket, not just the one call.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = 8,
+        rate: float = 10.0,
+        burst: float | None = None,
+        max_retries: int = 5,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+    ) -> None:
+        self.concurrency = concurrency
+        self.bucket = TokenBucket(rate, burst)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self.calls = 0
+        self.retries = 0
+        self.throttled = 0
+
+    def _backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff for the given (0-based) retry attempt."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+
+    async def call(self, fn: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any) -> Any:
+        """Await fn(*args, **kwargs) under the concurrency and rate limits, with retries."""
+        attempt = 0
+        while True:
+            async with self._semaphore:
+                await self.bucket.acquire()
+                self.calls += 1
+                try:
+                    return await fn(*args, **kwargs)
+                except httpx.HTTPStatusError as e:
+                    status = e.response.status_code
+                    if status not in RETRY_STATUSES or attempt >= self.max_retries:
+                        raise
+                    delay = retry_after_seconds(e.response)
+                    if delay is None:
+                        delay = self._backoff(attempt)
+                    if status == 429:
+                        self.throttled += 1
+                        self.bucket.pause(delay)
+                except httpx.TransportError:
+                    if attempt >= self.max_retries:
+                        raise
+                    delay = self._backoff(attempt)
+            # Sleep outside the semaphore so other calls can use the slot meanwhile.
+            self.retries += 1
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def map(
+        self,
+        fn: Callable[[Any], Awaitable[Any]],
+        items: Iterable[Any],
+        return_exceptions: bool = False,
+    ) -> AsyncIterator[tuple[Any, Any]]:
+        """
+        Call fn(item) for every item concurrently and yield (item, result) in completion
+        order. With return_exceptions=True a failed item yields (item, exception) instead
+        of aborting the whole run; otherwise the first failure cancels the rest and raises.
+        """
+        tasks = {asyncio.create_task(self.call(fn, item)): item for item in items}
+        try:
+            async for task in asyncio.as_completed(tasks):
+                item = tasks[task]
+                try:
+                    yield item, task.result()
+                except Exception as e:
+                    if not return_exceptions:
+                        raise
+                    yield item, e
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def summary(self) -> str:
+        return f"{self.calls} calls, {self.retries} retries, {self.throttled} throttled (429)"
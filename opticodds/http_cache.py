@@ -0,0 +1,309 @@
+"""
+On-disk HTTP response cache for slow-changing reference endpoints, shared by
+OpticOddsClient and the Sportradar clients.
+
+Entries are keyed on the URL and sorted query params with API keys stripped, so
+the cache can be shared across keys and never stores a secret. Only endpoints with
+a TTL in `ttls` (matched on the URL path suffix) are cached. A fresh entry is served
+from disk with no request. A stale one is revalidated. The request carries
+If-None-Match / If-Modified-Since when the server sent an ETag / Last-Modified, and
+a 304 (or a 200 whose `generated_at` equals the cached one) just renews the entry.
+
+Bodies are stored gzip-compressed next to a SQLite index. Once the stored total
+exceeds `max_bytes`, the least recently used entries are evicted.
+
+    cache = ResponseCache(".http_cache")
+    client = SportradarClient(cache=cache)
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Mapping
+from urllib.parse import urlsplit
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_CACHE_DIR = ROOT / ".http_cache"
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+SECRET_PARAMS = frozenset({"api_key", "apikey", "key", "x-api-key"})
+
+DAY = 24 * 60 * 60
+DEFAULT_TTLS: dict[str, float] = {
+    # Sportradar reference data
+    "/competitions.json": DAY,
+    "/seasons.json": DAY,
+    "/info.json": DAY,
+    "/competitors.json": DAY,
+    # OpticOdds reference data
+    "/markets": DAY,
+    "/leagues": DAY,
+    "/sportsbooks": DAY,
+    "/sports": DAY,
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key           TEXT PRIMARY KEY,
+    etag          TEXT,
+    last_modified TEXT,
+    generated_at  TEXT,
+    stored_at     REAL NOT NULL,
+    accessed_at   REAL NOT NULL,
+    size          INTEGER NOT NULL
+)
+"""
+
+
+def cache_key(url: str, params: Mapping[str, Any] | None = None) -> str:
+    """Stable key for url + params: query from both merged, API keys dropped, sorted."""
+    parts = urlsplit(url)
+    items: list[tuple[str, str]] = []
+    if parts.query:
+        for pair in parts.query.split("&"):
+            name, _, value = pair.partition("=")
+            items.append((name, value))
+    for name, value in (params or {}).items():
+        values = value if isinstance(value, (list, tuple)) else [value]
+        items.extend((name, str(v)) for v in values)
+    items = sorted((n, v) for n, v in items if n.lower() not in SECRET_PARAMS)
+    query = "&".join(f"{n}={v}" for n, v in items)
+    return f"{parts.scheme}://{parts.netloc}{parts.path}?{query}"
+
+
+class CachedResponse:
+    """A cached body plus the validators needed to revalidate it."""
+
+    def __init__(
+        self,
+        body: bytes,
+        etag: str | None,
+        last_modified: str | None,
+        generated_at: str | None,
+        fresh: bool,
+    ) -> None:
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.generated_at = generated_at
+        self.fresh = fresh
+
+    def revalidation_headers(self) -> dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def _generated_at(body: bytes) -> str | None:
+    try:
+        data = json.loads(body)
+    except ValueError:
+        return None
+    return data.get("generated_at") if isinstance(data, dict) else None
+
+
+class ResponseCache:
+    """Size-bounded LRU cache of compressed response bodies with per-endpoint TTLs."""
+
+    def __init__(
+        self,
+        directory: Path | str = DEFAULT_CACHE_DIR,
+        ttls: Mapping[str, float] | None = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.directory / "index.sqlite", check_same_thread=False)
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def ttl(self, url: str) -> float:
+        """TTL in seconds for url's endpoint; 0 means the endpoint is not cached."""
+        path = urlsplit(url).path.rstrip("/")
+        for suffix, ttl in self.ttls.items():
+            if path.endswith(suffix.rstrip("/")):
+                return ttl
+        return 0.0
+
+    def _body_path(self, key: str) -> Path:
+        return self.directory / f"{hashlib.sha256(key.encode()).hexdigest()}.json.gz"
+
+    def get(self, url: str, params: Mapping[str, Any] | None = None) -> CachedResponse | None:
+        """
+        The cached response for url + params, or None if the endpoint is not cached or
+        nothing is stored. Check .fresh: a stale entry must be revalidated before use.
+        """
+        ttl = self.ttl(url)
+        if not ttl:
+            return None
+        key = cache_key(url, params)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified, generated_at, stored_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            try:
+                body = gzip.decompress(self._body_path(key).read_bytes())
+            except (OSError, EOFError):
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._conn.commit()
+                self.misses += 1
+                return None
+            now = time.time()
+            self._conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+        fresh = now - row[3] < ttl
+        if fresh:
+            self.hits += 1
+        return CachedResponse(body, row[0], row[1], row[2], fresh)
+
+    def store(
+        self,
+        url: str,
+        params: Mapping[str, Any] | None,
+        body: bytes,
+        headers: Mapping[str, str] | None = None,
+    ) -> None:
+        """Store a 200 response body (no-op for endpoints without a TTL)."""
+        if not self.ttl(url):
+            return
+        key = cache_key(url, params)
+        headers = headers or {}
+        compressed = gzip.compress(body, compresslevel=6)
+        path = self._body_path(key)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_bytes(compressed)
+        os.replace(tmp, path)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO entries (key, etag, last_modified, generated_at, stored_at, accessed_at, size)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    etag = excluded.etag,
+                    last_modified = excluded.last_modified,
+                    generated_at = excluded.generated_at,
+                    stored_at = excluded.stored_at,
+                    accessed_at = excluded.accessed_at,
+                    size = excluded.size
+                """,
+                (
+                    key,
+                    headers.get("etag") or headers.get("ETag"),
+                    headers.get("last-modified") or headers.get("Last-Modified"),
+                    _generated_at(body),
+                    now,
+                    now,
+                    len(compressed),
+                ),
+            )
+            self._conn.commit()
+            self._evict()
+
+    def renew(self, url: str, params: Mapping[str, Any] | None = None) -> None:
+        """Mark a stale entry fresh again after the server confirmed it is unchanged."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE entries SET stored_at = ?, accessed_at = ? WHERE key = ?",
+                (now, now, cache_key(url, params)),
+            )
+            self._conn.commit()
+        self.revalidated += 1
+
+    def update(
+        self,
+        url: str,
+        params: Mapping[str, Any] | None,
+        cached: CachedResponse | None,
+        status: int,
+        body: bytes,
+        headers: Mapping[str, str] | None = None,
+    ) -> bytes | None:
+        """
+        Fold a network response into the cache and return the body to use: the cached
+        body on 304 or an unchanged generated_at, the new body on 200, None otherwise.
+        """
+        if status == 304 and cached is not None:
+            self.renew(url, params)
+            return cached.body
+        if status != 200:
+            return None
+        if cached is not None and cached.generated_at and _generated_at(body) == cached.generated_at:
+            self.renew(url, params)
+            return cached.body
+        self.store(url, params, body, headers)
+        return body
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the total size fits max_bytes (lock held)."""
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, size in self._conn.execute("SELECT key, size FROM entries ORDER BY accessed_at").fetchall():
+            self._body_path(key).unlink(missing_ok=True)
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self.evictions += 1
+            total -= size
+            if total <= self.max_bytes:
+                break
+        self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            for (key,) in self._conn.execute("SELECT key FROM entries").fetchall():
+                self._body_path(key).unlink(missing_ok=True)
+            self._conn.execute("DELETE FROM entries")
+            self._conn.commit()
+
+    def summary(self) -> str:
+        return (
+            f"{self.hits} fresh hits, {self.revalidated} revalidated, {self.misses} misses, "
+            f"{self.evictions} evictions"
+        )
+
+
+_default_cache: ResponseCache | None = None
+
+
+def default_cache() -> ResponseCache | None:
+    """
+    Process-wide cache in HTTP_CACHE_DIR (default: .http_cache in the project root).
+    Set HTTP_CACHE_DIR=off to disable it.
+    """
+    global _default_cache
+    directory = os.environ.get("HTTP_CACHE_DIR", str(DEFAULT_CACHE_DIR))
+    if directory.lower() in ("", "0", "off", "false", "none"):
+        return None
+    if _default_cache is None or _default_cache.directory != Path(directory):
+        _default_cache = ResponseCache(directory)
+    return _default_cache
+
+
+def resolve_cache(cache: "ResponseCache | bool") -> ResponseCache | None:
+    """Client `cache=` argument: True for the shared default cache, False for none."""
+    if cache is True:
+        return default_cache()
+    if cache is False:
+        return None
+    return cache
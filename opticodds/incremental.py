@@ -0,0 +1,126 @@
+"""
+Incremental, checkpointed fixture/odds ingestion.
+
+Re-fetches the (cheap) fixture list, then fetches historical odds only for fixtures
+the IngestionState says are new or changed. Odds already on disk are kept; newly
+fetched fixtures replace their previous odds.
+
+Each fetched fixture's odds are appended as one NDJSON line to a journal next to the
+odds file (<odds file>.journal); every `checkpoint_every` fixtures the journal is
+synced to disk and only then are those fixtures marked captured in the state store,
+so a crashed run resumes where the last checkpoint left off. The odds file itself is
+rewritten once, when the journal is compacted into it at the end of the run (or at
+the start of the next one, after a crash).
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Iterable
+
+from opticodds.backfill import fetch_fixtures, fetch_odds_historical
+from opticodds.fetch import FetchEngine
+from opticodds.state import IngestionState
+
+
+def _load_json_list(path: Path) -> list[dict]:
+    if not path.exists():
+        return []
+    with open(path) as f:
+        return json.load(f)
+
+
+def _journal_path(odds_path: Path) -> Path:
+    return odds_path.with_name(odds_path.name + ".journal")
+
+
+def compact_journal(odds_path: Path) -> int:
+    """
+    Fold the journal into the odds file (a fixture's latest journal entry replaces its
+    odds), rewrite it atomically and delete the journal. Returns the fixtures folded in.
+    A torn last line from a crash is ignored; that fixture was never marked captured.
+    """
+    journal = _journal_path(odds_path)
+    if not journal.exists():
+        return 0
+    entries: dict[str, list[dict]] = {}
+    with open(journal) as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                break
+            entries[entry["fixture_id"]] = entry["odds"]
+    if entries:
+        odds_by_fixture: dict[str, list[dict]] = {}
+        for o in _load_json_list(odds_path):
+            odds_by_fixture.setdefault(o.get("fixture_id"), []).append(o)
+        odds_by_fixture.update(entries)
+        _write_json_atomic(odds_path, [o for odds in odds_by_fixture.values() for o in odds])
+    journal.unlink()
+    return len(entries)
+
+
+def _write_json_atomic(path: Path, data: Any) -> None:
+    """Write JSON to a temp file and rename over path, so readers never see a partial file."""
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp, path)
+
+
+async def ingest_incremental(
+    client: Any,
+    engine: FetchEngine,
+    state: IngestionState,
+    fixtures_path: Path,
+    odds_path: Path,
+    season_weeks: Iterable[str | None],
+    checkpoint_every: int = 25,
+    **filters: Any,
+) -> dict[str, int]:
+    """
+    Run one incremental pass and return counts (fixtures seen, odds fetched/skipped).
+    `filters` are passed to fetch_fixtures (sport, league, season_type, start_date_*, ...).
+    """
+    fixtures = [f async for f in fetch_fixtures(client, engine, season_weeks, **filters)]
+    pending = [f for f in fixtures if state.needs_odds(f)]
+    state.record_fixtures(fixtures)
+
+    fixtures_by_id = {f["id"]: f for f in _load_json_list(fixtures_path)}
+    fixtures_by_id.update({f["id"]: f for f in fixtures})
+    _write_json_atomic(fixtures_path, list(fixtures_by_id.values()))
+
+    # Odds journaled by a run that crashed before compacting.
+    compact_journal(odds_path)
+
+    # has_odds=False fixtures have nothing to fetch; record them so a later flip is detected.
+    state.mark_odds_fetched((f, 0) for f in pending if f.get("has_odds") is False)
+    to_fetch = {f["id"]: f for f in pending if f.get("has_odds") is not False}
+
+    captured: list[tuple[dict, int]] = []
+
+    with open(_journal_path(odds_path), "a") as journal:
+
+        def checkpoint() -> None:
+            if not captured:
+                return
+            journal.flush()
+            os.fsync(journal.fileno())
+            state.mark_odds_fetched(captured)
+            captured.clear()
+
+        async for fixture_id, odds in fetch_odds_historical(client, engine, list(to_fetch)):
+            journal.write(json.dumps({"fixture_id": fixture_id, "odds": odds}, separators=(",", ":")))
+            journal.write("\n")
+            captured.append((to_fetch[fixture_id], len(odds)))
+            if len(captured) >= checkpoint_every:
+                checkpoint()
+        checkpoint()
+    compact_journal(odds_path)
+
+    return {
+        "fixtures": len(fixtures),
+        "odds_fetched": len(to_fetch),
+        "odds_skipped": len(fixtures) - len(to_fetch),
+    }
@@ -0,0 +1,40 @@
+"""
+Newline-delimited JSON writer for the streaming collector.
+
+Records are written compactly, one per line, as responses arrive, so the collector
+never holds the whole tournament in memory and a reader can consume the file
+line by line (see bigquery.records.iter_json_records).
+"""
+
+import json
+from pathlib import Path
+from typing import Iterable
+
+
+class NdjsonWriter:
+    """Truncates `path` on open and appends one compact JSON record per line."""
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        self.count = 0
+        self._file = open(self.path, "w")
+
+    def __enter__(self) -> "NdjsonWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def write(self, record: dict) -> None:
+        self._file.write(json.dumps(record, separators=(",", ":")))
+        self._file.write("\n")
+        self.count += 1
+
+    def write_many(self, records: Iterable[dict]) -> None:
+        """Write a batch (e.g. one fixture's odds) and flush it to disk."""
+        for record in records:
+            self.write(record)
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
@@ -0,0 +1,327 @@
+"""
+Compact typed odds records.
+
+An OpticOdds odds entry is a ~25-key dict with nested deep_link / limits / order_book
+objects; a tournament is hundreds of thousands of them. OddsRecord keeps the fields
+the pipeline uses in a slotted dataclass (no per-instance __dict__), drops deep_link,
+limits, order_book and source_ids when a response is decoded, flattens olv/clv, and
+interns the strings that repeat across rows (sportsbook, market, market_id, names,
+grouping keys, fixture ids) so every row shares one copy.
+
+With msgspec installed (`uv add msgspec`), decode_odds_response parses response bytes
+straight into typed structs that only declare the kept fields, so skipped fields are
+never materialized; without it, the stdlib json.loads + dict path is used.
+
+OddsBatch is the struct-of-arrays view of many records: NumPy float arrays for
+prices/points/timestamps and object arrays of the interned strings, for bulk
+transforms (see analysis.pricing.odds_frame) without a dict per row.
+
+    from opticodds.records import decode_odds_response, OddsBatch
+
+    records = decode_odds_response(body)           # raw /fixtures/odds bytes
+    batch = OddsBatch.from_records(records)
+    batch["price"], batch.to_frame()
+
+Benchmark against the json.loads + dict path: uv run python -m opticodds.bench_records
+"""
+
+import json
+from dataclasses import dataclass, fields
+from datetime import datetime, timezone
+from operator import attrgetter
+from typing import Any, Iterable
+
+import numpy as np
+
+try:
+    import msgspec
+except ImportError:  # optional: decode_odds_response falls back to json.loads
+    msgspec = None
+
+# Dropped at decode time: links and book depth are never stored or priced.
+SKIPPED_FIELDS = ("deep_link", "limits", "order_book", "source_ids")
+# Interned strings: value -> the one shared copy. setdefault is a single C call per field
+# (None passes through), cheaper than sys.intern behind a type check. Reset when it
+# outgrows MAX_INTERNED so a long-running consumer cannot grow it without bound.
+MAX_INTERNED = 1_000_000
+_strings: dict = {}
+_EMPTY: dict = {}
+
+
+@dataclass(slots=True, eq=False)
+class OddsRecord:
+    """One odds entry with olv/clv flattened; string fields other than id are interned."""
+
+    id: str | None
+    fixture_id: str | None
+    fixture_start_date: str | None
+    sportsbook: str | None
+    market: str | None
+    market_id: str | None
+    name: str | None
+    is_main: bool | None
+    selection: str | None
+    normalized_selection: str | None
+    selection_line: str | None
+    player_id: str | None
+    team_id: str | None
+    grouping_key: str | None
+    price: float | None
+    points: float | None
+    timestamp: float | None
+    olv_price: float | None = None
+    olv_points: float | None = None
+    clv_price: float | None = None
+    clv_points: float | None = None
+
+    @classmethod
+    def from_dict(
+        cls, d: dict, fixture_id: str | None = None, fixture_start_date: str | None = None
+    ) -> "OddsRecord":
+        """Build from an API / collector odds dict; fixture fields fall back to the arguments."""
+        g = d.get
+        s = _strings.setdefault
+        olv = g("olv") or _EMPTY
+        clv = g("clv") or _EMPTY
+        fixture_id = g("fixture_id") or fixture_id
+        fixture_start_date = g("fixture_start_date") or fixture_start_date
+        sportsbook, market, market_id = g("sportsbook"), g("market"), g("market_id")
+        name, selection, normalized = g("name"), g("selection"), g("normalized_selection")
+        selection_line, player_id, team_id, grouping_key = (
+            g("selection_line"),
+            g("player_id"),
+            g("team_id"),
+            g("grouping_key"),
+        )
+        return cls(
+            g("id"),
+            s(fixture_id, fixture_id),
+            s(fixture_start_date, fixture_start_date),
+            s(sportsbook, sportsbook),
+            s(market, market),
+            s(market_id, market_id),
+            s(name, name),
+            g("is_main"),
+            s(selection, selection),
+            s(normalized, normalized),
+            s(selection_line, selection_line),
+            s(player_id, player_id),
+            s(team_id, team_id),
+            s(grouping_key, grouping_key),
+            g("price"),
+            g("points"),
+            g("timestamp"),
+            olv.get("price"),
+            olv.get("points"),
+            clv.get("price"),
+            clv.get("points"),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Collector-shaped dict (olv/clv nested again), e.g. for NdjsonWriter."""
+        out = {name: getattr(self, name) for name in ODDS_FIELDS if name not in LINE_FIELDS}
+        if self.olv_price is not None or self.olv_points is not None:
+            out["olv"] = {"price": self.olv_price, "points": self.olv_points}
+        if self.clv_price is not None or self.clv_points is not None:
+            out["clv"] = {"price": self.clv_price, "points": self.clv_points}
+        return out
+
+    def to_bq_row(self, ingested_at: str | None = None) -> dict[str, Any]:
+        """Same row as bigquery.schema.odds_row_to_bq(record.to_dict(), ingested_at)."""
+        return {
+            "id": self.id,
+            "sportsbook": self.sportsbook,
+            "market": self.market,
+            "over_under": self.name,
+            "is_main": self.is_main,
+            "selection": self.selection,
+            "normalized_selection": self.normalized_selection,
+            "market_id": self.market_id,
+            "selection_line": self.selection_line,
+            "player_id": self.player_id,
+            "team_id": self.team_id,
+            "fixture_id": self.fixture_id,
+            "opening_line_price": self.olv_price,
+            "opening_line_points": self.olv_points,
+            "closing_line_price": self.clv_price,
+            "closing_line_points": self.clv_points,
+            "fixture_start_date": self.fixture_start_date,
+            "ingested_at": ingested_at or datetime.now(timezone.utc).isoformat(),
+        }
+
+
+ODDS_FIELDS = tuple(f.name for f in fields(OddsRecord))
+LINE_FIELDS = ("olv_price", "olv_points", "clv_price", "clv_points")
+NUMERIC_FIELDS = ("price", "points", "timestamp", "olv_price", "olv_points", "clv_price", "clv_points")
+
+
+def records_from_dicts(
+    odds: Iterable[dict], fixture_id: str | None = None, fixture_start_date: str | None = None
+) -> list[OddsRecord]:
+    """OddsRecords from odds dicts (e.g. a collector file via bigquery.records.iter_json_records)."""
+    if len(_strings) > MAX_INTERNED:
+        _strings.clear()
+    return [OddsRecord.from_dict(o, fixture_id, fixture_start_date) for o in odds]
+
+
+def records_from_response(response: dict) -> list[OddsRecord]:
+    """OddsRecords for every fixture in a parsed /fixtures/odds(/historical) response."""
+    records = []
+    for fixture in response.get("data", []):
+        records.extend(records_from_dicts(fixture.get("odds", []), fixture.get("id"), fixture.get("start_date")))
+    return records
+
+
+def merge_records(shards: Iterable[list[OddsRecord]]) -> list[OddsRecord]:
+    """One fixture's shard records merged, deduped by odds id (first wins, as merge_odds_responses)."""
+    by_id: dict[str | None, OddsRecord] = {}
+    for records in shards:
+        for record in records:
+            by_id.setdefault(record.id, record)
+    return list(by_id.values())
+
+
+if msgspec is not None:
+
+    class _Line(msgspec.Struct, gc=False):
+        price: float | None = None
+        points: float | None = None
+
+    class _Odds(msgspec.Struct, gc=False):
+        """Only the kept fields; everything else (SKIPPED_FIELDS included) is skipped by the parser."""
+
+        id: str | None = None
+        sportsbook: str | None = None
+        market: str | None = None
+        market_id: str | None = None
+        name: str | None = None
+        is_main: bool | None = None
+        selection: str | None = None
+        normalized_selection: str | None = None
+        selection_line: str | None = None
+        player_id: str | None = None
+        team_id: str | None = None
+        grouping_key: str | None = None
+        price: float | None = None
+        points: float | None = None
+        timestamp: float | None = None
+        olv: _Line | None = None
+        clv: _Line | None = None
+
+    class _Fixture(msgspec.Struct):
+        id: str | None = None
+        start_date: str | None = None
+        odds: list[_Odds] = []
+
+    class _Response(msgspec.Struct):
+        data: list[_Fixture] = []
+
+    _decoder = msgspec.json.Decoder(_Response)
+    _NO_LINE = _Line()
+
+
+def _records_from_structs(response: Any) -> list[OddsRecord]:
+    s = _strings.setdefault
+    records = []
+    append = records.append
+    for fixture in response.data:
+        fixture_id = s(fixture.id, fixture.id)
+        start_date = s(fixture.start_date, fixture.start_date)
+        for o in fixture.odds:
+            olv = o.olv or _NO_LINE
+            clv = o.clv or _NO_LINE
+            append(
+                OddsRecord(
+                    o.id,
+                    fixture_id,
+                    start_date,
+                    s(o.sportsbook, o.sportsbook),
+                    s(o.market, o.market),
+                    s(o.market_id, o.market_id),
+                    s(o.name, o.name),
+                    o.is_main,
+                    s(o.selection, o.selection),
+                    s(o.normalized_selection, o.normalized_selection),
+                    s(o.selection_line, o.selection_line),
+                    s(o.player_id, o.player_id),
+                    s(o.team_id, o.team_id),
+                    s(o.grouping_key, o.grouping_key),
+                    o.price,
+                    o.points,
+                    o.timestamp,
+                    olv.price,
+                    olv.points,
+                    clv.price,
+                    clv.points,
+                )
+            )
+    return records
+
+
+def decode_odds_response(body: bytes | str, use_msgspec: bool = True) -> list[OddsRecord]:
+    """
+    Raw /fixtures/odds(/historical) body -> OddsRecords stamped with their fixture's id
+    and start_date, through msgspec when installed (and use_msgspec), else json.loads;
+    the intermediate objects are dropped on return.
+    """
+    if len(_strings) > MAX_INTERNED:
+        _strings.clear()
+    if use_msgspec and msgspec is not None:
+        return _records_from_structs(_decoder.decode(body))
+    return records_from_response(json.loads(body))
+
+
+class OddsBatch:
+    """
+    Struct-of-arrays view of OddsRecords: one NumPy array per field (float64 with NaN for
+    NUMERIC_FIELDS, object arrays of the interned strings otherwise).
+    """
+
+    def __init__(self, columns: dict[str, np.ndarray]) -> None:
+        self.columns = columns
+
+    @classmethod
+    def from_records(cls, records: Iterable[OddsRecord]) -> "OddsBatch":
+        rows = list(map(attrgetter(*ODDS_FIELDS), records))
+        values = zip(*rows) if rows else [()] * len(ODDS_FIELDS)
+        columns = {}
+        for name, column in zip(ODDS_FIELDS, values):
+            if name in NUMERIC_FIELDS:
+                columns[name] = np.array(column, dtype=float)  # None -> nan
+            else:
+                array = np.empty(len(column), dtype=object)
+                array[:] = column
+                columns[name] = array
+        return cls(columns)
+
+    def __len__(self) -> int:
+        return len(self.columns["id"])
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    def take(self, index: Any) -> "OddsBatch":
+        """Rows selected by a boolean mask or integer index array."""
+        return OddsBatch({name: column[index] for name, column in self.columns.items()})
+
+    def records(self) -> list[OddsRecord]:
+        numeric = [i for i, name in enumerate(ODDS_FIELDS) if name in NUMERIC_FIELDS]
+        out = []
+        for row in zip(*(self.columns[name].tolist() for name in ODDS_FIELDS)):
+            row = list(row)
+            for i in numeric:
+                if row[i] != row[i]:  # nan -> None
+                    row[i] = None
+            out.append(OddsRecord(*row))
+        return out
+
+    def to_frame(self, columns: Iterable[str] | None = None, categorical: bool = False) -> Any:
+        """pandas DataFrame of the batch; categorical=True stores string columns as categories."""
+        import pandas as pd
+
+        names = list(columns) if columns is not None else list(ODDS_FIELDS)
+        data = {}
+        for name in names:
+            column = self.columns[name]
+            data[name] = pd.Categorical(column) if categorical and name not in NUMERIC_FIELDS else column
+        return pd.DataFrame(data)
@@ -0,0 +1,471 @@
+"""
+Multi-tournament collection scheduler.
+
+Builds a tournament calendar from Sportradar competitions/seasons (sr_competitions.json
+and sr_seasons.json, or the cached API), mapped onto OpticOdds leagues (leagues.json),
+and collects fixtures and odds for every tournament in it concurrently under one
+global API budget:
+
+- Tournament: one calendar entry, with the OpticOdds fixture filters (league,
+  season_type, a date window padded for qualifying) that replace the hard-coded
+  Australian Open settings on OpticOddsClient.
+- TournamentScheduler: a priority queue of API calls drained by `engine.concurrency`
+  workers through one shared FetchEngine (so its rate limit and retries apply
+  across all tournaments), with an optional hard cap on requests (max_requests; a
+  worker reserves its request before running a job, retries are not counted).
+  Fixture pages are listed per tournament; every fixture found becomes one odds job
+  per sportsbook/market shard (planned once per league, pruned by the client's
+  market catalog for that league), prioritized by how fresh its prices are:
+
+      LIVE        live fixtures (and listing tournaments in progress)
+      NEAR        unplayed fixtures starting within `near` (default 3h)
+      UPCOMING    unplayed fixtures further out (current odds)
+      HISTORICAL  completed fixtures (historical odds backfill)
+
+  Workers always take the most urgent job next, so live and near-start prices are
+  never queued behind archival work, and when the budget runs out it is the
+  backfill that is left undone (reported in summary()). A fixture with a shard
+  that failed or was not run is reported as incomplete and not passed to on_odds.
+- round_windows: the collection window (first/last start, fixture count) of every
+  (tournament, round), from the fixtures found.
+
+    calendar = load_calendar(start=date(2026, 1, 1), end=date(2026, 3, 31))
+    scheduler = TournamentScheduler(client, FetchEngine(concurrency=8, rate=10.0), calendar,
+                                    on_fixture=..., on_odds=...)
+    await scheduler.run()
+    print(scheduler.summary())
+
+Run from project root (main.py --schedule writes the results as NDJSON):
+  uv run python -m opticodds.scheduler --from 2026-01-01 --to 2026-03-31
+  uv run python main.py --schedule --from 2026-03-01 --to 2026-03-31 --budget 5000
+"""
+
+import argparse
+import asyncio
+import heapq
+import itertools
+import json
+import re
+from collections import Counter, defaultdict
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from opticodds.fetch import FetchEngine
+from opticodds.sharding import merge_odds_responses
+from sportradar.season_summaries import ReferenceIndex
+
+ROOT = Path(__file__).resolve().parent.parent
+
+LIVE, NEAR, UPCOMING, HISTORICAL = range(4)
+PRIORITY_NAMES = {LIVE: "live", NEAR: "near", UPCOMING: "upcoming", HISTORICAL: "historical"}
+
+# Sportradar category -> OpticOdds league id (leagues.json).
+LEAGUE_BY_CATEGORY = {
+    "sr:category:3": "atp",
+    "sr:category:6": "wta",
+    "sr:category:72": "atp_challenger",
+    "sr:category:785": "itf_men",
+    "sr:category:213": "itf_women",
+    "sr:category:76": "davis_cup",
+    "sr:category:2414": "united_cup",
+    "sr:category:2516": "utr_men",
+    "sr:category:2517": "utr_women",
+}
+DEFAULT_LEVELS = ("grand_slam", "atp_1000", "wta_1000")
+# Qualifying is played in the week before the main draw Sportradar dates.
+QUALIFYING_DAYS = 7
+SKIPPED_STATUSES = frozenset({"cancelled", "postponed"})
+
+
+class Tournament:
+    """One calendar entry: an OpticOdds league + season_type over a date range."""
+
+    __slots__ = ("key", "name", "league", "season_type", "start", "end", "level", "sr_season_id")
+
+    def __init__(
+        self,
+        name: str,
+        league: str,
+        season_type: str,
+        start: date,
+        end: date,
+        level: str | None = None,
+        sr_season_id: str | None = None,
+    ) -> None:
+        self.name = name
+        self.league = league
+        self.season_type = season_type
+        self.start = start
+        self.end = end
+        self.level = level
+        self.sr_season_id = sr_season_id
+        slug = re.sub(r"[^a-z0-9]+", "_", season_type.split(",")[0].lower()).strip("_")
+        self.key = f"{league}_{slug}_{start.year}"
+
+    def __repr__(self) -> str:
+        return f"Tournament({self.key!r}, {self.start}..{self.end})"
+
+    def fixture_filters(self, qualifying_days: int = QUALIFYING_DAYS) -> dict[str, str]:
+        """Filters for OpticOddsClient.get_fixtures covering qualifying and the main draw."""
+        after = self.start - timedelta(days=qualifying_days)
+        before = self.end + timedelta(days=1)
+        return dict(
+            sport="tennis",
+            league=self.league,
+            season_type=self.season_type,
+            start_date_after=f"{after.isoformat()}T00:00:00Z",
+            start_date_before=f"{before.isoformat()}T00:00:00Z",
+        )
+
+    def priority(self, now: datetime, near: timedelta, qualifying_days: int = QUALIFYING_DAYS) -> int:
+        """Priority for listing this tournament's fixtures at `now`."""
+        today = now.date()
+        if self.start - timedelta(days=qualifying_days) <= today <= self.end:
+            return LIVE
+        if today < self.start:
+            starts_in = datetime.combine(self.start, datetime.min.time(), timezone.utc) - now
+            return NEAR if starts_in <= near else UPCOMING
+        return HISTORICAL
+
+
+def season_type_for(competition_name: str) -> str:
+    """OpticOdds season_type filter for a Sportradar competition name.
+
+    "ATP Indian Wells, USA Men Singles" -> "Indian Wells, USA";
+    "Australian Open Men Singles" -> "Australian Open".
+    """
+    name = re.sub(r"^(ATP|WTA)\s+", "", competition_name)
+    return re.sub(r"\s+(Men|Women)\s+Singles$", "", name).strip()
+
+
+def tournament_calendar(
+    competitions: Iterable[dict],
+    seasons: Iterable[dict],
+    leagues: Iterable[str] | None = None,
+    levels: Iterable[str] | None = DEFAULT_LEVELS,
+    start: date | None = None,
+    end: date | None = None,
+) -> list[Tournament]:
+    """
+    Singles tournaments of the mapped categories at the given levels (None: any level)
+    whose dates overlap [start, end], sorted by start date. Leagues not in `leagues`
+    (OpticOdds league ids, e.g. from leagues.json) are dropped.
+    """
+    index = ReferenceIndex(competitions, seasons)
+    allowed = set(leagues) if leagues is not None else None
+    levels = set(levels) if levels is not None else None
+    calendar = []
+    for season in index.seasons(category_ids=LEAGUE_BY_CATEGORY):
+        competition = index.competitions.get(season.get("competition_id")) or {}
+        league = LEAGUE_BY_CATEGORY.get((competition.get("category") or {}).get("id"))
+        if competition.get("type") != "singles" or (allowed is not None and league not in allowed):
+            continue
+        if levels is not None and competition.get("level") not in levels:
+            continue
+        if not season.get("start_date") or not season.get("end_date"):
+            continue
+        season_start = date.fromisoformat(season["start_date"])
+        season_end = date.fromisoformat(season["end_date"])
+        if (start is not None and season_end < start) or (end is not None and season_start > end):
+            continue
+        calendar.append(
+            Tournament(
+                name=season.get("name") or competition["name"],
+                league=league,
+                season_type=season_type_for(competition["name"]),
+                start=season_start,
+                end=season_end,
+                level=competition.get("level"),
+                sr_season_id=season["id"],
+            )
+        )
+    return sorted(calendar, key=lambda t: (t.start, t.key))
+
+
+def load_calendar(
+    competitions_path: Path | str = ROOT / "sr_competitions.json",
+    seasons_path: Path | str = ROOT / "sr_seasons.json",
+    leagues_path: Path | str | None = ROOT / "leagues.json",
+    **kwargs: Any,
+) -> list[Tournament]:
+    """tournament_calendar from the checked-in Sportradar and OpticOdds reference files."""
+    with open(competitions_path) as f:
+        competitions = json.load(f)["competitions"]
+    with open(seasons_path) as f:
+        seasons = json.load(f)["seasons"]
+    leagues = None
+    if leagues_path is not None:
+        with open(leagues_path) as f:
+            leagues = [league["id"] for league in json.load(f)["data"]]
+    return tournament_calendar(competitions, seasons, leagues, **kwargs)
+
+
+async def fetch_calendar(sportradar_client: Any, client: Any, **kwargs: Any) -> list[Tournament]:
+    """tournament_calendar from the APIs (both clients serve these from the response cache)."""
+    competitions, seasons, leagues = await asyncio.gather(
+        sportradar_client.get_competitions(),
+        sportradar_client.get_seasons(),
+        client.get_leagues(sport="tennis"),
+    )
+    return tournament_calendar(
+        competitions["competitions"],
+        seasons["seasons"],
+        [league["id"] for league in leagues.get("data", [])],
+        **kwargs,
+    )
+
+
+def fixture_priority(fixture: dict, now: datetime, near: timedelta) -> int | None:
+    """Odds priority of a fixture at `now`; None for cancelled/postponed fixtures."""
+    status = fixture.get("status")
+    if status in SKIPPED_STATUSES:
+        return None
+    if fixture.get("is_live") or status == "live":
+        return LIVE
+    if status == "completed":
+        return HISTORICAL
+    start = fixture.get("start_date")
+    if start and datetime.fromisoformat(start.replace("Z", "+00:00")) - now <= near:
+        return NEAR
+    return UPCOMING
+
+
+def round_windows(fixtures: Iterable[dict]) -> dict[tuple[str, str | None], dict[str, Any]]:
+    """(season_type, season_week) -> first/last fixture start and fixture count."""
+    windows: dict[tuple[str, str | None], dict[str, Any]] = {}
+    for fixture in fixtures:
+        key = (fixture.get("season_type"), fixture.get("season_week"))
+        start = fixture.get("start_date")
+        window = windows.setdefault(key, {"first_start": start, "last_start": start, "fixtures": 0})
+        window["fixtures"] += 1
+        if start:
+            window["first_start"] = min(filter(None, (window["first_start"], start)))
+            window["last_start"] = max(filter(None, (window["last_start"], start)))
+    return windows
+
+
+class TournamentScheduler:
+    """
+    Collects every tournament in a calendar through one shared FetchEngine, most urgent
+    job first; see the module docstring. on_fixture(tournament, fixture) is called for
+    each fixture found and on_odds(tournament, fixture, odds) once per fixture when all
+    of its odds shards are in (odds stamped with fixture_id / fixture_start_date, as
+    in opticodds.backfill); fixtures missing a shard end up in `incomplete` instead.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        engine: FetchEngine,
+        calendar: Iterable[Tournament],
+        on_fixture: Callable[[Tournament, dict], Any] | None = None,
+        on_odds: Callable[[Tournament, dict, list[dict]], Any] | None = None,
+        max_requests: int | None = None,
+        near: timedelta = timedelta(hours=3),
+        max_pages: int = 10,
+        now: datetime | None = None,
+    ) -> None:
+        self.client = client
+        self.engine = engine
+        self.calendar = list(calendar)
+        self.on_fixture = on_fixture
+        self.on_odds = on_odds
+        self.max_requests = max_requests
+        self.near = near
+        self.max_pages = max_pages
+        self.now = now
+        self.fixtures: dict[str, dict[str, dict]] = defaultdict(dict)  # tournament key -> id -> fixture
+        self.requests: Counter = Counter()  # priority -> requests issued
+        self.skipped: Counter = Counter()  # priority -> jobs dropped by the budget
+        self.failed: Counter = Counter()
+        self.odds_rows: Counter = Counter()  # tournament key -> odds written
+        self.incomplete: dict[str, set[str]] = defaultdict(set)  # tournament key -> fixture ids
+        self._queue: list[tuple[int, int, Callable[[], Any]]] = []
+        self._seq = itertools.count()
+        self._pending: dict[str, list[dict]] = {}
+        self._shards: dict[str, list[tuple[list[str], list[str]]]] = {}  # league -> shard plan
+        self._issued = 0
+        self._active = 0
+        self._changed: asyncio.Condition | None = None
+
+    def _now(self) -> datetime:
+        return self.now or datetime.now(timezone.utc)
+
+    def submit(self, priority: int, job: Callable[[], Any]) -> None:
+        """
+        Queue a coroutine function making one API request; lower priority runs first.
+        A job that returns False made no request and gives its budget back.
+        """
+        heapq.heappush(self._queue, (priority, next(self._seq), job))
+
+    def _reserve(self) -> bool:
+        """Take one request from the budget; called with the condition lock held."""
+        if self.max_requests is not None and self._issued >= self.max_requests:
+            return False
+        self._issued += 1
+        return True
+
+    async def _worker(self) -> None:
+        changed = self._changed
+        while True:
+            async with changed:
+                while not self._queue and self._active:
+                    await changed.wait()
+                if not self._queue:
+                    changed.notify_all()
+                    return
+                priority, _, job = heapq.heappop(self._queue)
+                self._active += 1
+                reserved = self._reserve()
+            try:
+                if not reserved:
+                    self.skipped[priority] += 1
+                    continue
+                try:
+                    issued = await job()
+                except Exception as e:
+                    self.requests[priority] += 1
+                    self.failed[type(e).__name__] += 1
+                    print(f"Scheduler job failed ({PRIORITY_NAMES[priority]}): {e}")
+                    continue
+                if issued is False:
+                    async with changed:
+                        self._issued -= 1
+                else:
+                    self.requests[priority] += 1
+            finally:
+                async with changed:
+                    self._active -= 1
+                    changed.notify_all()
+
+    def _list_fixtures(self, tournament: Tournament, priority: int, page: int) -> None:
+        async def job() -> None:
+            result = await self.engine.call(self.client.get_fixtures, page=page, **tournament.fixture_filters())
+            if page == 1:
+                for next_page in range(2, min(result.get("total_pages", 1), self.max_pages) + 1):
+                    self._list_fixtures(tournament, priority, next_page)
+            for fixture in result.get("data", []):
+                self._add_fixture(tournament, fixture)
+
+        self.submit(priority, job)
+
+    def _add_fixture(self, tournament: Tournament, fixture: dict) -> None:
+        if fixture["id"] in self.fixtures[tournament.key]:
+            return
+        self.fixtures[tournament.key][fixture["id"]] = fixture
+        if self.on_fixture is not None:
+            self.on_fixture(tournament, fixture)
+        priority = fixture_priority(fixture, self._now(), self.near)
+        if priority is None or not fixture.get("has_odds", True):
+            return
+        fetch = self.client.get_odds_historical if priority == HISTORICAL else self.client.get_odds
+        shards = self._shards.get(tournament.league)
+        if shards is None:
+            shards = self._shards[tournament.league] = self.client.odds_shards(league=tournament.league)
+        for sportsbooks, markets in shards:
+            self._fetch_odds(tournament, fixture, fetch, sportsbooks, markets, len(shards), priority)
+
+    def _fetch_odds(
+        self,
+        tournament: Tournament,
+        fixture: dict,
+        fetch: Callable[..., Any],
+        sportsbooks: list[str],
+        markets: list[str],
+        n_shards: int,
+        priority: int,
+    ) -> None:
+        incomplete = self.incomplete[tournament.key]
+
+        async def job() -> bool | None:
+            if fixture["id"] in incomplete:
+                return False  # another shard already failed; don't spend a request on this one
+            try:
+                response = await self.engine.call(fetch, fixture["id"], sportsbooks=sportsbooks, markets=markets)
+            except Exception:
+                self._pending.pop(fixture["id"], None)
+                incomplete.add(fixture["id"])
+                raise
+            if fixture["id"] in incomplete:
+                return None
+            responses = self._pending.setdefault(fixture["id"], [])
+            responses.append(response)
+            if len(responses) < n_shards:
+                return
+            data = merge_odds_responses(self._pending.pop(fixture["id"])).get("data", [])
+            odds = data[0].get("odds", []) if data else []
+            for o in odds:
+                o["fixture_id"] = fixture["id"]
+                o["fixture_start_date"] = fixture.get("start_date")
+            self.odds_rows[tournament.key] += len(odds)
+            if self.on_odds is not None:
+                self.on_odds(tournament, fixture, odds)
+
+        self.submit(priority, job)
+
+    async def run(self) -> None:
+        """List every tournament's fixtures and fetch their odds until the queue (or budget) is exhausted."""
+        self._changed = asyncio.Condition()
+        self._issued = 0
+        now = self._now()
+        for tournament in self.calendar:
+            self._list_fixtures(tournament, tournament.priority(now, self.near), 1)
+        await asyncio.gather(*(self._worker() for _ in range(self.engine.concurrency)))
+        # Shards left waiting for a sibling that was over budget never complete.
+        for tournament in self.calendar:
+            for fixture_id in self.fixtures.get(tournament.key, {}):
+                if self._pending.pop(fixture_id, None) is not None:
+                    self.incomplete[tournament.key].add(fixture_id)
+
+    def rounds(self) -> dict[str, dict[tuple[str, str | None], dict[str, Any]]]:
+        """round_windows per tournament key, from the fixtures found so far."""
+        return {key: round_windows(fixtures.values()) for key, fixtures in self.fixtures.items()}
+
+    def summary(self) -> str:
+        done = ", ".join(f"{PRIORITY_NAMES[p]} {n}" for p, n in sorted(self.requests.items())) or "none"
+        lines = [f"{len(self.calendar)} tournaments; requests: {done}"]
+        if self.skipped:
+            lines.append(
+                "over budget, not run: "
+                + ", ".join(f"{PRIORITY_NAMES[p]} {n}" for p, n in sorted(self.skipped.items()))
+            )
+        if self.failed:
+            lines.append(f"failed: {dict(self.failed)}")
+        for tournament in self.calendar:
+            fixtures = self.fixtures.get(tournament.key, {})
+            incomplete = len(self.incomplete.get(tournament.key, ()))
+            lines.append(
+                f"  {tournament.key}: {len(fixtures)} fixtures, {self.odds_rows[tournament.key]} odds, "
+                f"{len(round_windows(fixtures.values()))} rounds"
+                + (f", {incomplete} fixtures with incomplete odds" if incomplete else "")
+            )
+        return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Print the tournament calendar the scheduler would collect")
+    parser.add_argument("--from", dest="start", type=date.fromisoformat, default=None, help="YYYY-MM-DD")
+    parser.add_argument("--to", dest="end", type=date.fromisoformat, default=None, help="YYYY-MM-DD")
+    parser.add_argument(
+        "--levels",
+        default=",".join(DEFAULT_LEVELS),
+        help=f"Comma-separated Sportradar levels, or 'all' (default: {','.join(DEFAULT_LEVELS)})",
+    )
+    args = parser.parse_args()
+
+    levels = None if args.levels == "all" else args.levels.split(",")
+    now = datetime.now(timezone.utc)
+    calendar = load_calendar(levels=levels, start=args.start, end=args.end)
+    for tournament in calendar:
+        priority = PRIORITY_NAMES[tournament.priority(now, timedelta(hours=3))]
+        filters = tournament.fixture_filters()
+        print(
+            f"{tournament.start} {tournament.end}  {tournament.key:<40} {priority:<10} "
+            f"league={filters['league']} season_type={filters['season_type']!r}"
+        )
+    print(f"{len(calendar)} tournaments")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Split an odds request's sportsbook x market space into API-legal shards and merge
+the shard responses back into one per-fixture payload.
+
+The odds endpoints accept at most 5 sportsbooks per request; the number of markets
+per request can optionally be capped as well. plan_shards returns the fewest shards
+that respect both caps, with books and markets spread evenly across them.
+"""
+
+import math
+from typing import Iterable
+
+MAX_SPORTSBOOKS_PER_REQUEST = 5
+
+
+def _chunk_evenly(items: list[str], max_size: int | None) -> list[list[str]]:
+    """Split items into the fewest chunks of at most max_size, sizes differing by at most one."""
+    if not items:
+        return [[]]
+    if max_size is None or len(items) <= max_size:
+        return [items]
+    n_chunks = math.ceil(len(items) / max_size)
+    size, extra = divmod(len(items), n_chunks)
+    chunks, start = [], 0
+    for i in range(n_chunks):
+        end = start + size + (1 if i < extra else 0)
+        chunks.append(items[start:end])
+        start = end
+    return chunks
+
+
+def plan_shards(
+    sportsbooks: Iterable[str],
+    markets: Iterable[str],
+    max_sportsbooks: int = MAX_SPORTSBOOKS_PER_REQUEST,
+    max_markets: int | None = None,
+) -> list[tuple[list[str], list[str]]]:
+    """
+    Return (sportsbooks, markets) pairs covering every requested combination.
+    Duplicates are dropped (order kept), so a repeated market is only requested once.
+    """
+    books = list(dict.fromkeys(sportsbooks))
+    market_list = list(dict.fromkeys(markets))
+    return [
+        (book_chunk, market_chunk)
+        for book_chunk in _chunk_evenly(books, max_sportsbooks)
+        for market_chunk in _chunk_evenly(market_list, max_markets)
+    ]
+
+
+def merge_odds_responses(responses: Iterable[dict]) -> dict:
+    """
+    Merge shard responses for one fixture into a single {"data": [fixture]} payload.
+    The fixture fields come from the first non-empty shard; odds are deduped by id.
+    """
+    fixture: dict | None = None
+    odds_by_id: dict[str, dict] = {}
+    for response in responses:
+        data = response.get("data", [])
+        if not data:
+            continue
+        if fixture is None:
+            fixture = {k: v for k, v in data[0].items() if k != "odds"}
+        for o in data[0].get("odds", []):
+            odds_by_id.setdefault(o.get("id"), o)
+    if fixture is None:
+        return {"data": []}
+    return {"data": [{**fixture, "odds": list(odds_by_id.values())}]}
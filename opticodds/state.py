@@ -0,0 +1,111 @@
+"""
+Local SQLite state store for incremental fixture/odds ingestion.
+
+One row per fixture: the latest status/has_odds seen on the fixtures endpoint, and
+the status/has_odds it had when its odds were last captured. A fixture needs its
+odds (re)fetched when it is new, or when status or has_odds changed since capture;
+completed fixtures whose odds are captured are skipped.
+"""
+
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS fixtures (
+    id              TEXT PRIMARY KEY,
+    status          TEXT,
+    has_odds        INTEGER,
+    start_date      TEXT,
+    first_seen_at   TEXT NOT NULL,
+    last_seen_at    TEXT NOT NULL,
+    odds_status     TEXT,
+    odds_has_odds   INTEGER,
+    odds_count      INTEGER,
+    odds_fetched_at TEXT
+)
+"""
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+class IngestionState:
+    """SQLite-backed record of which fixtures' odds have been captured, and in what state."""
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+    def __enter__(self) -> "IngestionState":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def record_fixtures(self, fixtures: Iterable[dict]) -> None:
+        """Upsert the latest status/has_odds for each fixture from the fixtures endpoint."""
+        now = _now()
+        self._conn.executemany(
+            """
+            INSERT INTO fixtures (id, status, has_odds, start_date, first_seen_at, last_seen_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+                status = excluded.status,
+                has_odds = excluded.has_odds,
+                start_date = excluded.start_date,
+                last_seen_at = excluded.last_seen_at
+            """,
+            [
+                (f["id"], f.get("status"), f.get("has_odds"), f.get("start_date"), now, now)
+                for f in fixtures
+            ],
+        )
+        self._conn.commit()
+
+    def needs_odds(self, fixture: dict) -> bool:
+        """True if the fixture is new, or its status/has_odds changed since odds were captured."""
+        row = self._conn.execute(
+            "SELECT odds_status, odds_has_odds, odds_fetched_at FROM fixtures WHERE id = ?",
+            (fixture["id"],),
+        ).fetchone()
+        if row is None or row[2] is None:
+            return True
+        odds_status, odds_has_odds, _ = row
+        has_odds = fixture.get("has_odds")
+        return odds_status != fixture.get("status") or odds_has_odds != (
+            None if has_odds is None else int(has_odds)
+        )
+
+    def mark_odds_fetched(self, captured: Iterable[tuple[dict, int]]) -> None:
+        """
+        Record (fixture, odds_count) pairs as captured, in one transaction.
+        Call only after the odds are safely on disk, so a crash never marks unsaved work.
+        """
+        now = _now()
+        with self._conn:
+            self._conn.executemany(
+                """
+                UPDATE fixtures
+                SET odds_status = ?, odds_has_odds = ?, odds_count = ?, odds_fetched_at = ?
+                WHERE id = ?
+                """,
+                [
+                    (f.get("status"), f.get("has_odds"), count, now, f["id"])
+                    for f, count in captured
+                ],
+            )
+
+    def summary(self) -> dict[str, int]:
+        """Counts of known fixtures and fixtures with captured odds."""
+        total, captured = self._conn.execute(
+            "SELECT COUNT(*), COUNT(odds_fetched_at) FROM fixtures"
+        ).fetchone()
+        return {"fixtures": total, "odds_captured": captured}
@@ -0,0 +1,253 @@
+"""
+Long-running consumer of the OpticOdds server-sent-events odds stream.
+
+GET {BASE_URL}/stream/odds/{sport} emits `odds` and `locked-odds` events whose data is
+{"entry_id": ..., "data": [odds, ...]}, plus `connected` / `ping` keep-alives. The
+consumer opens one stream per sportsbook shard (the same 5-book cap as the odds
+endpoints, see opticodds.sharding), applies every event to an in-memory OddsBook
+keyed by (fixture, market, sportsbook, selection, points) and publishes only the
+entries that changed to a downstream sink in micro-batches.
+
+Each shard remembers the last entry_id it saw and reconnects with last_entry_id, so
+the provider replays anything missed while disconnected.
+
+    book = OddsBook()
+    consumer = OddsStreamConsumer(client, book, sink=tick_sink(recorder), league="atp")
+    await consumer.run()
+"""
+
+import asyncio
+import json
+import random
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+import httpx
+
+from opticodds.fetch import RETRY_STATUSES, retry_after_seconds
+
+BookKey = tuple[str, str, str, str, Any]
+Sink = Callable[[list[dict]], Awaitable[None] | None]
+
+
+class SseEvent:
+    """One server-sent event."""
+
+    def __init__(self, event: str, data: str, id: str | None = None) -> None:
+        self.event = event
+        self.data = data
+        self.id = id
+
+
+async def parse_sse(lines: AsyncIterator[str]) -> AsyncIterator[SseEvent]:
+    """Group SSE lines into events (event/data/id fields, blank line terminates)."""
+    event, data, event_id = "message", [], None
+    async for line in lines:
+        if not line:
+            if data:
+                yield SseEvent(event, "\n".join(data), event_id)
+            event, data, event_id = "message", [], None
+            continue
+        if line.startswith(":"):
+            continue
+        field, _, value = line.partition(":")
+        value = value.removeprefix(" ")
+        if field == "event":
+            event = value
+        elif field == "data":
+            data.append(value)
+        elif field == "id":
+            event_id = value
+
+
+def book_key(odds: dict) -> BookKey:
+    """(fixture, market, sportsbook, selection, points) key of an odds record."""
+    return (
+        odds.get("fixture_id"),
+        odds.get("market_id"),
+        odds.get("sportsbook"),
+        odds.get("normalized_selection") or odds.get("selection") or odds.get("name"),
+        odds.get("points"),
+    )
+
+
+class OddsBook:
+    """Latest price per book key. apply() returns only the records that changed."""
+
+    def __init__(self) -> None:
+        self._book: dict[BookKey, dict] = {}
+        self.updates = 0
+        self.changes = 0
+
+    def __len__(self) -> int:
+        return len(self._book)
+
+    def get(self, key: BookKey) -> dict | None:
+        return self._book.get(key)
+
+    def fixture(self, fixture_id: str) -> list[dict]:
+        """All live entries for one fixture."""
+        return [o for key, o in self._book.items() if key[0] == fixture_id]
+
+    def apply(self, odds: list[dict], locked: bool = False) -> list[dict]:
+        """
+        Apply an odds (or locked-odds) event. Locked entries are removed from the book
+        and published with is_locked=True; other entries are published when new or
+        when their price moved.
+        """
+        changed = []
+        for o in odds:
+            self.updates += 1
+            key = book_key(o)
+            if locked:
+                if self._book.pop(key, None) is not None:
+                    changed.append({**o, "is_locked": True})
+                continue
+            previous = self._book.get(key)
+            if previous is not None and previous.get("price") == o.get("price"):
+                continue
+            self._book[key] = o
+            changed.append(o)
+        self.changes += len(changed)
+        return changed
+
+
+class OddsStreamConsumer:
+    """
+    Consume the odds stream for every sportsbook shard of `client`, keep `book`
+    current and send changed entries to `sink` every `batch_size` changes or
+    `flush_interval` seconds, whichever comes first.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        book: OddsBook,
+        sink: Sink,
+        league: str | None = None,
+        fixture_ids: list[str] | None = None,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        reconnect_base: float = 1.0,
+        reconnect_max: float = 30.0,
+    ) -> None:
+        self.client = client
+        self.book = book
+        self.sink = sink
+        self.league = league
+        self.fixture_ids = fixture_ids
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.reconnect_base = reconnect_base
+        self.reconnect_max = reconnect_max
+        self.last_entry_ids: dict[int, str] = {}
+        self.reconnects = 0
+        self.events = 0
+        self._queue: asyncio.Queue[dict] = asyncio.Queue()
+
+    def _params(self, shard: int, sportsbooks: list[str], markets: list[str]) -> dict:
+        params: dict[str, Any] = {"sportsbook": sportsbooks, "market": markets, "is_main": True}
+        if self.league:
+            params["league"] = self.league
+        if self.fixture_ids:
+            params["fixture_id"] = self.fixture_ids
+        if shard in self.last_entry_ids:
+            params["last_entry_id"] = self.last_entry_ids[shard]
+        return params
+
+    async def _consume_shard(self, shard: int, sportsbooks: list[str], markets: list[str]) -> None:
+        """
+        Stream one shard forever, reconnecting from the last entry_id on transport errors,
+        bad payloads and 429/5xx (after Retry-After, if sent). Other statuses (401, 403,
+        404, ...) will not fix themselves and are raised.
+        """
+        attempt = 0
+        path = f"/stream/odds/{self.client.sport}"
+        while True:
+            retry_after = None
+            try:
+                async with self.client.session.stream(
+                    "GET",
+                    path,
+                    params=self._params(shard, sportsbooks, markets),
+                    timeout=httpx.Timeout(self.client.timeout, read=None),
+                ) as response:
+                    if response.status_code != 200:
+                        await response.aread()  # _raise_for_status reads the error body
+                        self.client._raise_for_status(response)
+                    async for event in parse_sse(response.aiter_lines()):
+                        if event.event not in ("odds", "locked-odds"):
+                            continue
+                        attempt = 0
+                        payload = json.loads(event.data)
+                        self.events += 1
+                        changed = self.book.apply(payload.get("data", []), locked=event.event == "locked-odds")
+                        for o in changed:
+                            self._queue.put_nowait(o)
+                        if payload.get("entry_id") is not None:
+                            self.last_entry_ids[shard] = payload["entry_id"]
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code not in RETRY_STATUSES:
+                    raise
+                print(f"Odds stream shard {shard} refused ({e.response.status_code}), reconnecting")
+                retry_after = retry_after_seconds(e.response)
+            except (httpx.HTTPError, json.JSONDecodeError) as e:
+                print(f"Odds stream shard {shard} disconnected: {e!r}")
+            self.reconnects += 1
+            delay = random.uniform(0, min(self.reconnect_max, self.reconnect_base * 2**attempt))
+            if retry_after is not None:
+                delay = max(delay, retry_after)
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def _publish(self) -> None:
+        """Drain the change queue into micro-batches for the sink."""
+        while True:
+            batch = [await self._queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except TimeoutError:
+                    break
+            result = self.sink(batch)
+            if asyncio.iscoroutine(result):
+                await result
+
+    async def run(self) -> None:
+        """Run until cancelled."""
+        tasks = [asyncio.create_task(self._publish())]
+        for shard, (sportsbooks, markets) in enumerate(self.client.odds_shards()):
+            tasks.append(asyncio.create_task(self._consume_shard(shard, sportsbooks, markets)))
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def summary(self) -> str:
+        return (
+            f"{self.events} events, {self.book.updates} updates, {self.book.changes} changes, "
+            f"{len(self.book)} live entries, {self.reconnects} reconnects"
+        )
+
+
+def tick_sink(recorder: Any) -> Sink:
+    """
+    Sink that records changed entries as ticks (opticodds.ticks.TickRecorder). Part files
+    are written on the TickStore's own size/interval policy, not per micro-batch; close
+    the store (it is a context manager) to flush the rest on shutdown.
+    """
+
+    def sink(changes: list[dict]) -> None:
+        by_fixture: dict[str, list[dict]] = {}
+        for o in changes:
+            if not o.get("is_locked"):
+                by_fixture.setdefault(o.get("fixture_id"), []).append(o)
+        for fixture_id, odds in by_fixture.items():
+            recorder.observe(fixture_id, odds)
+
+    return sink
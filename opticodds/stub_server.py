@@ -0,0 +1,303 @@
+"""
+Local stub of the OpticOdds fixtures/odds endpoints for exercising the fetch engine.
+
+Serves recorded payloads with configurable latency, a server-side rate limit
+(429 + Retry-After once exceeded) and a random 5xx error rate. /stream/odds/{sport}
+serves a deterministic server-sent-events feed of price moves over the same odds
+(entry i is always the same event, so last_entry_id resumes are checkable), and
+can drop connections every `stream_drop_after` events. Runs in a background thread:
+
+    with StubOpticOddsServer.from_recorded(latency=0.05, rate_limit=20) as server:
+        client = OpticOddsClient("test")
+        client.BASE_URL = server.base_url
+        ...
+
+Or standalone from project root:
+  uv run python -m opticodds.stub_server --port 8765 --latency 0.05 --rate-limit 20
+"""
+
+import argparse
+import json
+import math
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+from opticodds.sharding import MAX_SPORTSBOOKS_PER_REQUEST
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _book_id(name: str) -> str:
+    """Sportsbook display name to API id, e.g. 'Hard Rock' -> 'hard_rock'."""
+    return name.lower().replace(" ", "_")
+
+
+class StubOpticOddsServer:
+    """
+    Threaded HTTP server answering /fixtures, /fixtures/active, /fixtures/odds,
+    /fixtures/odds/historical and /stream/odds/{sport} from in-memory fixtures and
+    per-fixture odds lists.
+    """
+
+    def __init__(
+        self,
+        fixtures: list[dict],
+        odds_by_fixture: dict[str, list[dict]],
+        latency: float = 0.0,
+        rate_limit: float | None = None,
+        error_rate: float = 0.0,
+        page_size: int = 50,
+        stream_events: int = 1000,
+        stream_interval: float = 0.01,
+        stream_drop_after: int | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.fixtures = fixtures
+        self.odds_by_fixture = odds_by_fixture
+        self.latency = latency
+        self.rate_limit = rate_limit
+        self.error_rate = error_rate
+        self.page_size = page_size
+        self.stream_events = stream_events
+        self.stream_interval = stream_interval
+        self.stream_drop_after = stream_drop_after
+        self._stream_odds = [
+            {**o, "fixture_id": fixture_id} for fixture_id, odds in odds_by_fixture.items() for o in odds
+        ]
+        self.stream_connections = 0
+        self.requests = 0
+        self.throttled = 0
+        self.errors = 0
+        self._lock = threading.Lock()
+        self._window_start = time.monotonic()
+        self._window_count = 0
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @classmethod
+    def from_recorded(cls, sportsbooks: list[str] | None = None, **kwargs) -> "StubOpticOddsServer":
+        """
+        Build a stub from the checked-in australian_open_fixtures.json, giving every
+        fixture a copy of the djokovic_musetti.json odds (ids re-keyed per fixture,
+        olv/clv filled from the live price so historical responses look real).
+        Pass sportsbook display names to clone the odds once per book.
+        """
+        with open(ROOT / "australian_open_fixtures.json") as f:
+            fixtures = json.load(f)
+        with open(ROOT / "djokovic_musetti.json") as f:
+            template = json.load(f)["data"][0]["odds"]
+        odds_by_fixture = {}
+        for fixture in fixtures:
+            odds = []
+            for book in sportsbooks or [None]:
+                for o in template:
+                    line = {"price": o.get("price"), "points": o.get("points")}
+                    record = {**o, "id": f"{fixture['id']}:{o['id']}", "olv": line, "clv": line}
+                    if book is not None:
+                        record["sportsbook"] = book
+                        record["id"] = f"{fixture['id']}:{_book_id(book)}:{o['id']}"
+                    odds.append(record)
+            odds_by_fixture[fixture["id"]] = odds
+        return cls(fixtures, odds_by_fixture, **kwargs)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubOpticOddsServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "StubOpticOddsServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _admit(self) -> float | None:
+        """Fixed one-second window limiter. Returns Retry-After seconds when over the limit."""
+        with self._lock:
+            self.requests += 1
+            if self.rate_limit is None:
+                return None
+            now = time.monotonic()
+            if now - self._window_start >= 1.0:
+                self._window_start = now
+                self._window_count = 0
+            self._window_count += 1
+            if self._window_count > self.rate_limit:
+                self.throttled += 1
+                return 1.0 - (now - self._window_start)
+            return None
+
+    def _route(self, path: str, params: dict[str, list[str]]) -> tuple[int, dict]:
+        if path.endswith("/fixtures/odds") or path.endswith("/fixtures/odds/historical"):
+            fixture_id = (params.get("fixture_id") or [""])[0]
+            books = set(params.get("sportsbook", []))
+            markets = set(params.get("market", []))
+            if len(books) > MAX_SPORTSBOOKS_PER_REQUEST:
+                return 400, {"message": f"Max {MAX_SPORTSBOOKS_PER_REQUEST} sportsbooks per request"}
+            fixture = next((f for f in self.fixtures if f["id"] == fixture_id), None)
+            if fixture is None:
+                return 200, {"data": []}
+            odds = [
+                o
+                for o in self.odds_by_fixture.get(fixture_id, [])
+                if (not books or _book_id(o.get("sportsbook", "")) in books)
+                and (not markets or o.get("market_id") in markets)
+            ]
+            return 200, {"data": [{**fixture, "odds": odds}]}
+        if path.endswith("/fixtures") or path.endswith("/fixtures/active"):
+            fixtures = self.fixtures
+            for key in ("season_week", "status"):
+                if key in params:
+                    fixtures = [f for f in fixtures if f.get(key) == params[key][0]]
+            page = int((params.get("page") or ["1"])[0])
+            total_pages = max(1, math.ceil(len(fixtures) / self.page_size))
+            start = (page - 1) * self.page_size
+            return 200, {
+                "data": fixtures[start : start + self.page_size],
+                "page": page,
+                "total_pages": total_pages,
+            }
+        return 404, {"message": f"Unknown path {path}"}
+
+    def stream_entry(self, index: int) -> tuple[str, list[dict]]:
+        """
+        Event `index` of the odds stream: (event name, odds). Every 25th entry locks
+        one line; the rest move the price of a few lines by a deterministic amount.
+        """
+        rng = random.Random(index)
+        picks = rng.sample(self._stream_odds, min(3, len(self._stream_odds)))
+        if index % 25 == 24:
+            return "locked-odds", picks[:1]
+        moved = []
+        for o in picks:
+            price = o.get("price") or 100
+            moved.append({**o, "price": price + rng.choice((-10, -5, 5, 10)) * (1 + index // 100)})
+        return "odds", moved
+
+    def _stream_matches(self, o: dict, params: dict[str, list[str]]) -> bool:
+        books = params.get("sportsbook")
+        markets = params.get("market")
+        fixture_ids = params.get("fixture_id")
+        return (
+            (not books or _book_id(o.get("sportsbook", "")) in books)
+            and (not markets or o.get("market_id") in markets)
+            and (not fixture_ids or o.get("fixture_id") in fixture_ids)
+        )
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:
+                if server.latency:
+                    time.sleep(server.latency)
+                retry_after = server._admit()
+                if retry_after is not None:
+                    self._send(429, {"message": "Too Many Requests"}, {"Retry-After": f"{retry_after:.3f}"})
+                    return
+                if server.error_rate and random.random() < server.error_rate:
+                    with server._lock:
+                        server.errors += 1
+                    self._send(503, {"message": "Service Unavailable"})
+                    return
+                url = urlparse(self.path)
+                if "/stream/odds/" in url.path:
+                    self._stream(parse_qs(url.query))
+                    return
+                status, body = server._route(url.path, parse_qs(url.query))
+                self._send(status, body)
+
+            def _send(self, status: int, body: dict, headers: dict | None = None) -> None:
+                payload = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def _stream(self, params: dict[str, list[str]]) -> None:
+                """Serve the SSE feed from last_entry_id + 1, closing after stream_drop_after events."""
+                books = params.get("sportsbook", [])
+                if len(books) > MAX_SPORTSBOOKS_PER_REQUEST:
+                    self._send(400, {"message": f"Max {MAX_SPORTSBOOKS_PER_REQUEST} sportsbooks per request"})
+                    return
+                with server._lock:
+                    server.stream_connections += 1
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Cache-Control", "no-cache")
+                self.send_header("Connection", "close")
+                self.end_headers()
+                self.close_connection = True
+                start = int((params.get("last_entry_id") or ["-1"])[0]) + 1
+                sent = 0
+                try:
+                    self.wfile.write(b'event: connected\ndata: {"message": "connected"}\n\n')
+                    for index in range(start, server.stream_events):
+                        if server.stream_drop_after is not None and sent >= server.stream_drop_after:
+                            return
+                        event, odds = server.stream_entry(index)
+                        odds = [o for o in odds if server._stream_matches(o, params)]
+                        payload = json.dumps({"entry_id": str(index), "type": event, "data": odds})
+                        self.wfile.write(f"event: {event}\ndata: {payload}\n\n".encode())
+                        self.wfile.flush()
+                        sent += 1
+                        if server.stream_interval:
+                            time.sleep(server.stream_interval)
+                    while True:
+                        self.wfile.write(b'event: ping\ndata: {}\n\n')
+                        self.wfile.flush()
+                        time.sleep(1.0)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+
+            def log_message(self, format: str, *args) -> None:
+                pass
+
+        return Handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run a local OpticOdds stub server")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds added to every response")
+    parser.add_argument("--rate-limit", type=float, default=None, help="Requests per second before 429")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered 503")
+    args = parser.parse_args()
+
+    server = StubOpticOddsServer.from_recorded(
+        latency=args.latency,
+        rate_limit=args.rate_limit,
+        error_rate=args.error_rate,
+        port=args.port,
+    )
+    print(f"Serving OpticOdds stub at {server.base_url} (Ctrl+C to stop)")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
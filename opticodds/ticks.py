@@ -0,0 +1,244 @@
+"""
+Odds time-series capture: every price/points change per odds id as an append-only tick.
+
+odds_row_to_bq keeps only the opening and closing line. In poll mode the collector
+feeds each get_odds response to a TickRecorder, which emits a tick only when an odds
+id's (price, points) differ from the last tick recorded for it. Ticks are buffered
+column-wise and flushed by TickStore as Parquet part files (every flush_rows ticks or,
+at the next append, once flush_interval seconds have passed), with the repetitive
+string columns (sportsbook, market, selection, ...) dictionary-encoded, so a
+tournament of ticks is a small fraction of the raw JSON. Load them with
+`python -m bigquery.load_odds_ticks`, which moves loaded part files to <dir>/loaded/;
+they stay part of the store (read(), and the recorder's seed) after that.
+
+Requires pyarrow.
+"""
+
+import asyncio
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Iterable
+
+from opticodds.backfill import fetch_odds
+
+TICK_COLUMNS = (
+    "odds_id",
+    "fixture_id",
+    "sportsbook",
+    "market_id",
+    "name",
+    "selection",
+    "normalized_selection",
+    "grouping_key",
+    "is_main",
+    "price",
+    "points",
+    "timestamp",
+    "observed_at",
+)
+DICTIONARY_COLUMNS = [
+    "fixture_id",
+    "sportsbook",
+    "market_id",
+    "name",
+    "selection",
+    "normalized_selection",
+    "grouping_key",
+]
+# Subdirectory bigquery.load_odds_ticks moves part files into once they are loaded.
+LOADED_DIR = "loaded"
+
+
+def _pyarrow() -> tuple[Any, Any]:
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Odds tick storage requires pyarrow (uv add pyarrow).") from e
+    return pa, pq
+
+
+def tick_schema() -> Any:
+    pa, _ = _pyarrow()
+    ts = pa.timestamp("us", tz="UTC")
+    return pa.schema(
+        [
+            ("odds_id", pa.string()),
+            ("fixture_id", pa.string()),
+            ("sportsbook", pa.string()),
+            ("market_id", pa.string()),
+            ("name", pa.string()),
+            ("selection", pa.string()),
+            ("normalized_selection", pa.string()),
+            ("grouping_key", pa.string()),
+            ("is_main", pa.bool_()),
+            ("price", pa.float64()),
+            ("points", pa.float64()),
+            ("timestamp", ts),
+            ("observed_at", ts),
+        ]
+    )
+
+
+class TickStore:
+    """
+    Directory of Parquet part files holding ticks. append() buffers column-wise and
+    flushes once flush_rows ticks are buffered or flush_interval seconds have passed
+    since the last flush (None: size only), so part files stay large however often
+    append() is called; closing the store flushes the rest. flush() writes the buffer
+    as one closed part file, so a crash loses at most the unflushed buffer and never
+    leaves a half-written file behind.
+    """
+
+    def __init__(
+        self, directory: Path | str, flush_rows: int = 50_000, flush_interval: float | None = 60.0
+    ) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.flush_rows = flush_rows
+        self.flush_interval = flush_interval
+        self._columns: dict[str, list] = {c: [] for c in TICK_COLUMNS}
+        self._flushed_at = time.monotonic()
+        self.rows_written = 0
+
+    def __enter__(self) -> "TickStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.flush()
+
+    def __len__(self) -> int:
+        return len(self._columns["odds_id"])
+
+    def append(self, ticks: Iterable[dict]) -> None:
+        for tick in ticks:
+            for column in TICK_COLUMNS:
+                self._columns[column].append(tick.get(column))
+        if len(self) >= self.flush_rows or (
+            self.flush_interval is not None and time.monotonic() - self._flushed_at >= self.flush_interval
+        ):
+            self.flush()
+
+    def flush(self) -> Path | None:
+        """Write buffered ticks to a new part file; returns its path (None if empty)."""
+        self._flushed_at = time.monotonic()
+        if not len(self):
+            return None
+        pa, pq = _pyarrow()
+        schema = tick_schema()
+        table = pa.Table.from_pydict(self._columns, schema=schema)
+        path = self.directory / f"ticks-{datetime.now(timezone.utc):%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:8]}.parquet"
+        tmp = path.with_name(path.name + ".tmp")
+        pq.write_table(table, tmp, compression="zstd", use_dictionary=DICTIONARY_COLUMNS)
+        tmp.rename(path)
+        self.rows_written += table.num_rows
+        self._columns = {c: [] for c in TICK_COLUMNS}
+        return path
+
+    def part_files(self, include_loaded: bool = True) -> list[Path]:
+        """Part files, including those already moved to LOADED_DIR by the BigQuery loader."""
+        files = sorted(self.directory.glob("ticks-*.parquet"))
+        if include_loaded:
+            files += sorted((self.directory / LOADED_DIR).glob("ticks-*.parquet"))
+        return files
+
+    def read(self, columns: list[str] | None = None, filters: Any = None) -> Any:
+        """Read all flushed ticks as a pyarrow Table, repeated strings kept dictionary-encoded."""
+        _, pq = _pyarrow()
+        files = self.part_files()
+        if not files:
+            return tick_schema().empty_table()
+        return pq.read_table(
+            [str(f) for f in files],
+            columns=columns,
+            filters=filters,
+            read_dictionary=[c for c in DICTIONARY_COLUMNS if columns is None or c in columns],
+        )
+
+    def latest_lines(self) -> dict[str, tuple[Any, Any]]:
+        """Last recorded (price, points) per odds id (loaded part files included), used to seed a TickRecorder."""
+        table = self.read(columns=["odds_id", "price", "points", "observed_at"])
+        if not table.num_rows:
+            return {}
+        table = table.sort_by("observed_at")
+        return {
+            odds_id: (price, points)
+            for odds_id, price, points in zip(
+                table["odds_id"].to_pylist(), table["price"].to_pylist(), table["points"].to_pylist()
+            )
+        }
+
+
+class TickRecorder:
+    """
+    Turns successive odds snapshots into ticks, dropping updates whose (price, points)
+    did not move since the last tick for that odds id.
+    """
+
+    def __init__(self, store: TickStore, seed: bool = True) -> None:
+        self.store = store
+        self._last: dict[str, tuple[Any, Any]] = store.latest_lines() if seed else {}
+        self.observed = 0
+        self.recorded = 0
+
+    def observe(self, fixture_id: str, odds: Iterable[dict], observed_at: float | None = None) -> int:
+        """Record ticks for one fixture's odds snapshot; returns how many moved."""
+        observed = datetime.fromtimestamp(observed_at or time.time(), timezone.utc)
+        ticks = []
+        for o in odds:
+            self.observed += 1
+            line = (o.get("price"), o.get("points"))
+            if self._last.get(o["id"]) == line:
+                continue
+            self._last[o["id"]] = line
+            ts = o.get("timestamp")
+            ticks.append(
+                {
+                    "odds_id": o["id"],
+                    "fixture_id": fixture_id,
+                    "sportsbook": o.get("sportsbook"),
+                    "market_id": o.get("market_id"),
+                    "name": o.get("name"),
+                    "selection": o.get("selection"),
+                    "normalized_selection": o.get("normalized_selection"),
+                    "grouping_key": o.get("grouping_key"),
+                    "is_main": o.get("is_main"),
+                    "price": line[0],
+                    "points": line[1],
+                    "timestamp": datetime.fromtimestamp(ts, timezone.utc) if ts else None,
+                    "observed_at": observed,
+                }
+            )
+        self.store.append(ticks)
+        self.recorded += len(ticks)
+        return len(ticks)
+
+    def summary(self) -> str:
+        return f"{self.observed} odds observed, {self.recorded} ticks recorded ({self.store.rows_written} flushed)"
+
+
+async def poll_ticks(
+    client: Any,
+    engine: Any,
+    recorder: TickRecorder,
+    list_fixture_ids: Callable[[], Awaitable[list[str]]],
+    interval: float = 30.0,
+    rounds: int | None = None,
+) -> None:
+    """
+    Every `interval` seconds, list the fixtures to watch, fetch their current odds
+    through the engine and record the ticks; the store flushes on its own size/interval
+    policy (and when closed). Runs forever unless `rounds` is given.
+    """
+    done = 0
+    while rounds is None or done < rounds:
+        started = time.monotonic()
+        fixture_ids = await list_fixture_ids()
+        async for fixture_id, odds in fetch_odds(client, engine, fixture_ids):
+            recorder.observe(fixture_id, odds)
+        done += 1
+        print(f"Tick round {done}: {len(fixture_ids)} fixtures, {recorder.summary()}")
+        if rounds is None or done < rounds:
+            await asyncio.sleep(max(0.0, interval - (time.monotonic() - started)))
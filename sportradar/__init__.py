@@ -1,11 +1,14 @@
 """
 Sportradar API client and reference schemas for tennis data.
 
-- client: fetch data from Sportradar Tennis API (SPORTRADAR_API_KEY in .env).
+- client: fetch data from Sportradar Tennis API (SPORTRADAR_API_KEY in .env); sync and async clients.
+- season_summaries: category-filtered, checkpointed season-summary fan-out to per-player match stats.
+- matching: blocked OpticOdds <-> Sportradar fixture/competitor matching with a persisted mapping.
+- stub_server: local stub of competitions/seasons/season summaries replaying sr_season_summaries.json.
 - reference_schema: BigQuery table schemas for competitions and seasons (reference for data engineer).
 """
 
-from sportradar.client import SportradarClient
+from sportradar.client import AsyncSportradarClient, SportradarClient
 from sportradar.reference_schema import (
     get_competitions_table_schema,
     get_seasons_table_schema,
@@ -14,6 +17,7 @@ from sportradar.reference_schema import (
 )
 
 __all__ = [
+    "AsyncSportradarClient",
     "SportradarClient",
     "get_competitions_table_schema",
     "get_seasons_table_schema",
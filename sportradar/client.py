@@ -1,15 +1,35 @@
 """
 Minimal Sportradar Tennis API client.
 
-Uses SPORTRADAR_API_KEY from .env. Optional: SPORTRADAR_BASE_URL (defaults to trial v3).
+Uses SPORTRADAR_API_KEY from .env. Optional: SPORTRADAR_BASE_URL (defaults to trial v3),
+SPORTRADAR_QPS (requests per second; defaults to the trial or production limit).
+
+- SportradarClient: blocking, one request at a time.
+- AsyncSportradarClient: pooled httpx session, concurrent requests under a QPS limit,
+  retries with jitter, and concurrent start/limit pagination for bulk pulls.
+
+Both serve reference endpoints (competitions, seasons, ...) from the shared on-disk
+response cache (opticodds.http_cache); pass cache=False to always hit the API.
 """
 
+import asyncio
 import os
 from pathlib import Path
+from typing import Iterable
 from urllib.request import Request, urlopen
 from urllib.error import HTTPError, URLError
 import json
 
+import httpx
+
+from opticodds.fetch import FetchEngine
+from opticodds.http_cache import CachedResponse, ResponseCache, resolve_cache
+
+# Sportradar trial keys allow 1 request per second; production keys allow more.
+TRIAL_QPS = 1.0
+PRODUCTION_QPS = 10.0
+SUMMARIES_PAGE_LIMIT = 200
+
 # Load .env from project root when this module is used
 def _load_dotenv() -> None:
     try:
@@ -40,6 +60,15 @@ def get_base_url() -> str:
     ).rstrip("/")
 
 
+def get_qps(base_url: str) -> float:
+    """Requests per second for base_url: SPORTRADAR_QPS if set, else the trial/production limit."""
+    _load_dotenv()
+    value = os.environ.get("SPORTRADAR_QPS")
+    if value:
+        return float(value)
+    return TRIAL_QPS if "/trial/" in base_url else PRODUCTION_QPS
+
+
 class SportradarClient:
     """
     Client for Sportradar Tennis API.
@@ -50,9 +79,11 @@ class SportradarClient:
         self,
         api_key: str | None = None,
         base_url: str | None = None,
+        cache: ResponseCache | bool = True,
     ) -> None:
         self._api_key = (api_key or get_api_key()).strip()
         self._base_url = (base_url or get_base_url()).rstrip("/")
+        self.cache = resolve_cache(cache)
 
     def _url(self, path: str) -> str:
         path = path.lstrip("/")
@@ -65,11 +96,23 @@ class SportradarClient:
         Path is relative to base_url; api_key is appended.
         """
         url = self._url(path)
-        req = Request(url, headers={"Accept": "application/json"})
+        cached = self.cache.get(url) if self.cache is not None else None
+        if cached is not None and cached.fresh:
+            return json.loads(cached.body)
+        headers = {"Accept": "application/json"}
+        if cached is not None:
+            headers.update(cached.revalidation_headers())
+        req = Request(url, headers=headers)
         try:
             with urlopen(req, timeout=60) as resp:
-                return json.loads(resp.read().decode())
+                body = resp.read()
+                if self.cache is not None:
+                    # None for a 2xx other than 200: not cached, use the body as received.
+                    body = self.cache.update(url, None, cached, resp.status, body, resp.headers) or body
+                return json.loads(body.decode())
         except HTTPError as e:
+            if e.code == 304 and cached is not None:
+                return json.loads(self.cache.update(url, None, cached, 304, b""))
             raise RuntimeError(f"Sportradar API HTTP error: {e.code} {e.reason}") from e
         except URLError as e:
             raise RuntimeError(f"Sportradar API request failed: {e.reason}") from e
@@ -81,3 +124,150 @@ class SportradarClient:
     def get_seasons(self) -> dict:
         """Fetch all seasons (full payload)."""
         return self.get("seasons.json")
+
+
+class AsyncSportradarClient:
+    """
+    Async client for Sportradar Tennis API sharing one pooled session.
+
+    Every request goes through a FetchEngine: at most `concurrency` in flight, at most
+    `qps` started per second, 429/5xx and transport errors retried with jittered
+    backoff (Retry-After honoured). Errors that survive the retries are raised as
+    RuntimeError, like SportradarClient.
+
+        async with AsyncSportradarClient() as client:
+            competitions, seasons = await asyncio.gather(client.get_competitions(), client.get_seasons())
+            summaries = await client.get_season_summaries_many(season_ids)
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        base_url: str | None = None,
+        qps: float | None = None,
+        concurrency: int = 4,
+        max_retries: int = 5,
+        timeout: float = 60.0,
+        cache: ResponseCache | bool = True,
+    ) -> None:
+        self._api_key = (api_key or get_api_key()).strip()
+        self._base_url = (base_url or get_base_url()).rstrip("/")
+        self.cache = resolve_cache(cache)
+        self.qps = qps or get_qps(self._base_url)
+        self.engine = FetchEngine(concurrency=concurrency, rate=self.qps, max_retries=max_retries)
+        self.timeout = timeout
+        self._session: httpx.AsyncClient | None = None
+
+    async def __aenter__(self) -> "AsyncSportradarClient":
+        self.session
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    @property
+    def session(self) -> httpx.AsyncClient:
+        """The shared pooled session, created on first use."""
+        if self._session is None or self._session.is_closed:
+            self._session = httpx.AsyncClient(
+                base_url=self._base_url + "/",
+                headers={"Accept": "application/json"},
+                limits=httpx.Limits(max_connections=self.engine.concurrency),
+                timeout=self.timeout,
+            )
+        return self._session
+
+    async def aclose(self) -> None:
+        """Close the pooled session and its connections."""
+        if self._session is not None:
+            await self._session.aclose()
+            self._session = None
+
+    async def _get_once(self, path: str, params: dict | None, cached: CachedResponse | None) -> dict:
+        """One network request for path, revalidating `cached` (a stale cache entry) if given."""
+        url = f"{self._base_url}/{path.lstrip('/')}"
+        response = await self.session.get(
+            path.lstrip("/"),
+            params={**(params or {}), "api_key": self._api_key},
+            headers=cached.revalidation_headers() if cached is not None else None,
+        )
+        if self.cache is not None:
+            body = self.cache.update(url, params, cached, response.status_code, response.content, response.headers)
+            if body is not None:
+                return json.loads(body)
+        if response.status_code != 200:
+            raise httpx.HTTPStatusError(
+                f"Sportradar API HTTP error: {response.status_code} {response.reason_phrase}",
+                request=response.request,
+                response=response,
+            )
+        return response.json()
+
+    async def get(self, path: str, params: dict | None = None) -> dict:
+        """
+        GET a path (e.g. 'competitions.json') and return parsed JSON.
+        Path is relative to base_url; api_key is added to the query. Fresh cache hits
+        are answered here, without a rate-limit token; only misses and revalidations
+        go through the engine.
+        """
+        cached = None
+        if self.cache is not None:
+            cached = self.cache.get(f"{self._base_url}/{path.lstrip('/')}", params)
+            if cached is not None and cached.fresh:
+                return json.loads(cached.body)
+        try:
+            return await self.engine.call(self._get_once, path, params, cached)
+        except httpx.HTTPStatusError as e:
+            raise RuntimeError(str(e)) from e
+        except httpx.HTTPError as e:
+            raise RuntimeError(f"Sportradar API request failed: {e!r}") from e
+
+    async def get_paginated(
+        self,
+        path: str,
+        key: str,
+        limit: int = SUMMARIES_PAGE_LIMIT,
+        window: int | None = None,
+    ) -> dict:
+        """
+        Fetch every page of a start/limit endpoint and return the first page with the
+        `key` list extended by all pages. Pages are requested `window` at a time
+        (default: the engine's concurrency) until one comes back short.
+        """
+        window = window or self.engine.concurrency
+        first = await self.get(path, {"start": 0, "limit": limit})
+        items = list(first.get(key, []))
+        start = limit
+        done = len(items) < limit
+        while not done:
+            starts = [start + i * limit for i in range(window)]
+            pages = await asyncio.gather(*(self.get(path, {"start": s, "limit": limit}) for s in starts))
+            for page in pages:
+                page_items = page.get(key, [])
+                items.extend(page_items)
+                if len(page_items) < limit:
+                    done = True
+                    break
+            start = starts[-1] + limit
+        return {**first, key: items}
+
+    async def get_competitions(self) -> dict:
+        """Fetch all competitions (full payload)."""
+        return await self.get("competitions.json")
+
+    async def get_seasons(self) -> dict:
+        """Fetch all seasons (full payload)."""
+        return await self.get("seasons.json")
+
+    async def get_season_summaries(self, season_id: str, limit: int = SUMMARIES_PAGE_LIMIT) -> dict:
+        """All sport event summaries of one season, every page merged."""
+        return await self.get_paginated(f"seasons/{season_id}/summaries.json", "summaries", limit=limit)
+
+    async def get_season_summaries_many(self, season_ids: Iterable[str]) -> dict[str, dict]:
+        """Season summaries for many seasons concurrently, keyed by season id."""
+        season_ids = list(season_ids)
+        results = await asyncio.gather(*(self.get_season_summaries(s) for s in season_ids))
+        return dict(zip(season_ids, results))
+
+    def summary(self) -> str:
+        return f"{self.qps:g} qps limit, {self.engine.summary()}"
@@ -3,40 +3,61 @@ Sample script: fetch competitions and seasons from Sportradar API.
 
 Run from project root:
   uv run python -m sportradar.fetch_sample
+  uv run python -m sportradar.fetch_sample --season-summaries sr:season:133048 sr:season:133050 --write
 
-Uses SPORTRADAR_API_KEY from .env. Writes sample JSON to sportradar/output/ if --write is passed.
+Uses SPORTRADAR_API_KEY from .env. Requests run concurrently through AsyncSportradarClient
+(within the SPORTRADAR_QPS limit). Writes sample JSON to sportradar/output/ if --write is passed.
 """
 
 import argparse
+import asyncio
 import json
+import time
 from pathlib import Path
 
-from sportradar.client import SportradarClient
+from sportradar.client import AsyncSportradarClient
 
 
-def main() -> None:
-    parser = argparse.ArgumentParser(description="Fetch Sportradar competitions and seasons")
-    parser.add_argument("--write", action="store_true", help="Write JSON to sportradar/output/")
-    args = parser.parse_args()
-
-    client = SportradarClient()
-    print("Fetching competitions...")
-    competitions = client.get_competitions()
-    print(f"  Got {len(competitions.get('competitions', []))} competitions, generated_at={competitions.get('generated_at')}")
+async def fetch(season_ids: list[str], write: bool) -> None:
+    start = time.perf_counter()
+    async with AsyncSportradarClient() as client:
+        print("Fetching competitions and seasons...")
+        competitions, seasons = await asyncio.gather(client.get_competitions(), client.get_seasons())
+        print(f"  Got {len(competitions.get('competitions', []))} competitions, generated_at={competitions.get('generated_at')}")
+        print(f"  Got {len(seasons.get('seasons', []))} seasons, generated_at={seasons.get('generated_at')}")
+        outputs = [("competitions", competitions), ("seasons", seasons)]
 
-    print("Fetching seasons...")
-    seasons = client.get_seasons()
-    print(f"  Got {len(seasons.get('seasons', []))} seasons, generated_at={seasons.get('generated_at')}")
+        if season_ids:
+            print(f"Fetching season summaries for {len(season_ids)} seasons...")
+            summaries = await client.get_season_summaries_many(season_ids)
+            for season_id, data in summaries.items():
+                print(f"  {season_id}: {len(data.get('summaries', []))} summaries")
+                outputs.append((f"season_summaries_{season_id.replace(':', '_')}", data))
+        print(f"Done in {time.perf_counter() - start:.1f}s ({client.summary()})")
 
-    if args.write:
+    if write:
         out_dir = Path(__file__).resolve().parent / "output"
         out_dir.mkdir(exist_ok=True)
-        for name, data in [("competitions", competitions), ("seasons", seasons)]:
+        for name, data in outputs:
             path = out_dir / f"sr_{name}.json"
             with open(path, "w") as f:
                 json.dump(data, f, indent=2)
             print(f"  Wrote {path}")
 
 
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Fetch Sportradar competitions and seasons")
+    parser.add_argument("--write", action="store_true", help="Write JSON to sportradar/output/")
+    parser.add_argument(
+        "--season-summaries",
+        nargs="*",
+        default=[],
+        metavar="SEASON_ID",
+        help="Also fetch every page of these seasons' summaries, concurrently",
+    )
+    args = parser.parse_args()
+    asyncio.run(fetch(args.season_summaries, args.write))
+
+
 if __name__ == "__main__":
     main()
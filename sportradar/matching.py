@@ -0,0 +1,396 @@
+"""
+Cross-provider matching of OpticOdds fixtures/competitors to Sportradar sport events
+and sr:competitor ids.
+
+Names are normalized to accent-free lowercase tokens ("Damm Jr, Martin" and "Martin
+Damm" both become {"martin", "damm"}; "novak_djokovic" becomes {"novak", "djokovic"}).
+Sportradar events are indexed by name token and by start-date bucket, so candidates
+for an OpticOdds fixture are only the events within a day of it that share a name
+token with one of its players (blocking). Candidates are then scored by player-name
+similarity and start-time distance, and the best one is accepted if its confidence
+clears `min_confidence` and no other candidate comes within `ambiguity_margin`.
+
+Accepted fixture matches, and the competitor mappings they imply, are persisted in
+SQLite (MatchStore). A later run only matches fixtures that are not mapped yet.
+
+Run from project root:
+  uv run python -m sportradar.matching --fixtures australian_open_fixtures.json --summaries sr_season_summaries.json
+"""
+
+import argparse
+import json
+import re
+import sqlite3
+import time
+import unicodedata
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+from difflib import SequenceMatcher
+from pathlib import Path
+from typing import Iterable
+
+NAME_SUFFIXES = frozenset({"jr", "sr", "ii", "iii", "iv"})
+DEFAULT_MIN_CONFIDENCE = 0.8
+DEFAULT_AMBIGUITY_MARGIN = 0.05
+MAX_START_DIFF = timedelta(days=1)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS fixture_map (
+    opticodds_fixture_id TEXT PRIMARY KEY,
+    sr_sport_event_id    TEXT NOT NULL,
+    confidence           REAL NOT NULL,
+    start_diff_minutes   REAL,
+    matched_at           TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS competitor_map (
+    opticodds_competitor_id TEXT PRIMARY KEY,
+    opticodds_name          TEXT,
+    sr_competitor_id        TEXT NOT NULL,
+    sr_name                 TEXT,
+    confidence              REAL NOT NULL,
+    fixtures                INTEGER NOT NULL,
+    updated_at              TEXT NOT NULL,
+    name_key                TEXT
+);
+"""
+# name_key (normalize_name(opticodds_name)) is indexed so odds selections resolve
+# without scanning competitor_map; stores created before it existed get it on open.
+_NAME_KEY_INDEX = "CREATE INDEX IF NOT EXISTS competitor_map_name_key ON competitor_map (name_key, confidence)"
+
+
+def name_tokens(name: str | None) -> tuple[str, ...]:
+    """Accent-free lowercase name tokens; "Last, First" is reordered, suffixes dropped."""
+    if not name:
+        return ()
+    if "," in name:
+        last, _, first = name.partition(",")
+        name = f"{first} {last}"
+    text = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode().lower()
+    return tuple(t for t in re.split(r"[^a-z0-9]+", text) if t and t not in NAME_SUFFIXES)
+
+
+def normalize_name(name: str | None) -> str:
+    """Canonical key for a player name, e.g. "Djokovic, Novak" -> "djokovic novak"."""
+    return " ".join(sorted(name_tokens(name)))
+
+
+def name_similarity(a: tuple[str, ...], b: tuple[str, ...]) -> float:
+    """Similarity of two token tuples in [0, 1]: token overlap, or character similarity for typos."""
+    if not a or not b:
+        return 0.0
+    sa, sb = set(a), set(b)
+    if sa == sb:
+        return 1.0
+    overlap = len(sa & sb) / max(len(sa), len(sb))
+    chars = SequenceMatcher(None, " ".join(sorted(sa)), " ".join(sorted(sb))).ratio()
+    return max(overlap, chars)
+
+
+def _parse_time(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+class SportEvent:
+    """A Sportradar sport event reduced to what matching needs."""
+
+    __slots__ = ("id", "start", "competitors")
+
+    def __init__(self, id: str, start: datetime | None, competitors: list[tuple[str, str, tuple[str, ...]]]) -> None:
+        self.id = id
+        self.start = start
+        self.competitors = competitors  # (sr:competitor id, name, tokens)
+
+    @classmethod
+    def from_summary(cls, summary: dict) -> "SportEvent":
+        event = summary.get("sport_event") or summary
+        return cls(
+            event["id"],
+            _parse_time(event.get("start_time")),
+            [(c["id"], c.get("name"), name_tokens(c.get("name"))) for c in event.get("competitors", [])],
+        )
+
+
+class FixtureMatch:
+    """Best candidate for one OpticOdds fixture."""
+
+    def __init__(
+        self,
+        fixture_id: str,
+        event: SportEvent | None,
+        confidence: float,
+        runner_up: float,
+        start_diff: timedelta | None,
+        pairs: list[tuple[dict, tuple[str, str, tuple[str, ...]], float]],
+    ) -> None:
+        self.fixture_id = fixture_id
+        self.event = event
+        self.confidence = confidence
+        self.runner_up = runner_up
+        self.start_diff = start_diff
+        self.pairs = pairs  # (OpticOdds competitor, Sportradar competitor, name similarity)
+
+
+class MatchReport:
+    """Counts and confidence distribution for one match run."""
+
+    def __init__(self) -> None:
+        self.fixtures = 0
+        self.skipped = 0
+        self.matched = 0
+        self.ambiguous = 0
+        self.unmatched = 0
+        self.candidates = 0
+        self.confidences: list[float] = []
+        self.seconds = 0.0
+
+    def summary(self) -> str:
+        mean = sum(self.confidences) / len(self.confidences) if self.confidences else 0.0
+        low = min(self.confidences, default=0.0)
+        return (
+            f"{self.fixtures} fixtures ({self.skipped} already mapped): {self.matched} matched, "
+            f"{self.ambiguous} ambiguous, {self.unmatched} unmatched; {self.candidates} candidates scored; "
+            f"confidence mean {mean:.3f}, min {low:.3f}; {self.seconds * 1000:.1f} ms"
+        )
+
+
+class MatchIndex:
+    """Sportradar events indexed by name token and start-date bucket."""
+
+    def __init__(self, events: Iterable[SportEvent] = ()) -> None:
+        self.events: dict[str, SportEvent] = {}
+        self._by_token: dict[str, set[str]] = defaultdict(set)
+        self._by_day: dict[date | None, set[str]] = defaultdict(set)
+        self.add_events(events)
+
+    @classmethod
+    def from_summaries(cls, summaries: Iterable[dict]) -> "MatchIndex":
+        return cls(SportEvent.from_summary(s) for s in summaries)
+
+    def add_events(self, events: Iterable[SportEvent]) -> None:
+        for event in events:
+            self.events[event.id] = event
+            for _, _, tokens in event.competitors:
+                for token in tokens:
+                    self._by_token[token].add(event.id)
+            self._by_day[event.start.date() if event.start else None].add(event.id)
+
+    def candidates(self, start: datetime | None, tokens: Iterable[str]) -> set[str]:
+        """Events within a day of `start` sharing at least one name token."""
+        by_name = set().union(*(self._by_token.get(t, set()) for t in tokens))
+        if start is None:
+            return by_name
+        day = start.date()
+        by_day = self._by_day.get(day - timedelta(days=1), set()) | self._by_day.get(day, set())
+        by_day |= self._by_day.get(day + timedelta(days=1), set())
+        return by_name & by_day
+
+    @staticmethod
+    def _score_pairs(
+        home: list[dict], away: list[dict], event: SportEvent
+    ) -> tuple[float, list[tuple[dict, tuple[str, str, tuple[str, ...]], float]]]:
+        """Best player-name similarity over straight and swapped home/away orientation."""
+        if len(event.competitors) != 2:
+            return 0.0, []
+        sides = [(home, event.competitors[0]), (away, event.competitors[1])]
+        swapped = [(home, event.competitors[1]), (away, event.competitors[0])]
+        best = (0.0, [])
+        for orientation in (sides, swapped):
+            pairs = []
+            for competitors, sr in orientation:
+                oo = competitors[0] if competitors else {}
+                tokens = name_tokens(" ".join(c.get("name", "") for c in competitors))
+                pairs.append((oo, sr, name_similarity(tokens, sr[2])))
+            score = sum(p[2] for p in pairs) / len(pairs)
+            if score > best[0]:
+                best = (score, pairs)
+        return best
+
+    def match_fixture(self, fixture: dict) -> tuple[FixtureMatch, int]:
+        """Score every blocked candidate for an OpticOdds fixture; returns (best, candidates scored)."""
+        start = _parse_time(fixture.get("start_date"))
+        home = fixture.get("home_competitors") or []
+        away = fixture.get("away_competitors") or []
+        tokens = {t for c in home + away for t in name_tokens(c.get("name"))}
+        scored = []
+        for event_id in self.candidates(start, tokens):
+            event = self.events[event_id]
+            names, pairs = self._score_pairs(home, away, event)
+            diff = abs(event.start - start) if event.start and start else None
+            if diff is not None and diff > MAX_START_DIFF:
+                continue
+            # 1.0 within 3 hours (delays, order of play), down to 0.8 a day apart.
+            hours = diff.total_seconds() / 3600 if diff is not None else 24.0
+            time_factor = 1.0 if hours <= 3 else 1.0 - 0.2 * (hours - 3) / 21
+            scored.append((names * time_factor, event, diff, pairs))
+        scored.sort(key=lambda s: s[0], reverse=True)
+        if not scored:
+            return FixtureMatch(fixture["id"], None, 0.0, 0.0, None, []), 0
+        confidence, event, diff, pairs = scored[0]
+        runner_up = scored[1][0] if len(scored) > 1 else 0.0
+        return FixtureMatch(fixture["id"], event, confidence, runner_up, diff, pairs), len(scored)
+
+
+class MatchStore:
+    """SQLite mapping tables: OpticOdds fixture -> sport event, competitor -> sr:competitor."""
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.executescript(_SCHEMA)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(competitor_map)")}
+        if "name_key" not in columns:
+            self._conn.execute("ALTER TABLE competitor_map ADD COLUMN name_key TEXT")
+            self._conn.executemany(
+                "UPDATE competitor_map SET name_key = ? WHERE opticodds_competitor_id = ?",
+                [
+                    (normalize_name(name), competitor_id)
+                    for competitor_id, name in self._conn.execute(
+                        "SELECT opticodds_competitor_id, opticodds_name FROM competitor_map"
+                    ).fetchall()
+                ],
+            )
+        self._conn.execute(_NAME_KEY_INDEX)
+        self._conn.commit()
+
+    def __enter__(self) -> "MatchStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def mapped_fixture_ids(self) -> set[str]:
+        return {row[0] for row in self._conn.execute("SELECT opticodds_fixture_id FROM fixture_map")}
+
+    def mapped_event_ids(self) -> set[str]:
+        return {row[0] for row in self._conn.execute("SELECT sr_sport_event_id FROM fixture_map")}
+
+    def save(self, matches: Iterable[FixtureMatch]) -> None:
+        """Persist accepted fixture matches and fold their competitor pairs into competitor_map."""
+        now = datetime.now(timezone.utc).isoformat()
+        for m in matches:
+            diff = m.start_diff.total_seconds() / 60 if m.start_diff is not None else None
+            self._conn.execute(
+                "INSERT OR REPLACE INTO fixture_map VALUES (?, ?, ?, ?, ?)",
+                (m.fixture_id, m.event.id, m.confidence, diff, now),
+            )
+            for oo, (sr_id, sr_name, _), similarity in m.pairs:
+                if not oo.get("id"):
+                    continue
+                # Confidence of a competitor mapping is the best evidence seen for it.
+                self._conn.execute(
+                    """
+                    INSERT INTO competitor_map VALUES (?, ?, ?, ?, ?, 1, ?, ?)
+                    ON CONFLICT(opticodds_competitor_id) DO UPDATE SET
+                        sr_competitor_id = CASE WHEN excluded.confidence >= competitor_map.confidence
+                            THEN excluded.sr_competitor_id ELSE competitor_map.sr_competitor_id END,
+                        sr_name = CASE WHEN excluded.confidence >= competitor_map.confidence
+                            THEN excluded.sr_name ELSE competitor_map.sr_name END,
+                        confidence = MAX(competitor_map.confidence, excluded.confidence),
+                        fixtures = competitor_map.fixtures + 1,
+                        updated_at = excluded.updated_at
+                    """,
+                    (
+                        oo["id"],
+                        oo.get("name"),
+                        sr_id,
+                        sr_name,
+                        min(m.confidence, similarity),
+                        now,
+                        normalize_name(oo.get("name")),
+                    ),
+                )
+        self._conn.commit()
+
+    def competitor_for_selection(self, normalized_selection: str) -> tuple[str, float] | None:
+        """sr:competitor id and confidence for an odds normalized_selection like "novak_djokovic"."""
+        row = self._conn.execute(
+            "SELECT sr_competitor_id, confidence FROM competitor_map WHERE name_key = ? "
+            "ORDER BY confidence DESC LIMIT 1",
+            (normalize_name(normalized_selection),),
+        ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def summary(self) -> dict[str, int]:
+        fixtures = self._conn.execute("SELECT COUNT(*) FROM fixture_map").fetchone()[0]
+        competitors = self._conn.execute("SELECT COUNT(*) FROM competitor_map").fetchone()[0]
+        return {"fixtures": fixtures, "competitors": competitors}
+
+
+def match_fixtures(
+    index: MatchIndex,
+    store: MatchStore,
+    fixtures: Iterable[dict],
+    min_confidence: float = DEFAULT_MIN_CONFIDENCE,
+    ambiguity_margin: float = DEFAULT_AMBIGUITY_MARGIN,
+) -> tuple[list[FixtureMatch], MatchReport]:
+    """
+    Match fixtures not yet in the store, one-to-one (each sport event is used by at
+    most one fixture, best confidence first), and persist the accepted matches.
+    Returns every scored FixtureMatch and the run report.
+    """
+    start = time.perf_counter()
+    report = MatchReport()
+    mapped = store.mapped_fixture_ids()
+    results = []
+    for fixture in fixtures:
+        report.fixtures += 1
+        if fixture["id"] in mapped:
+            report.skipped += 1
+            continue
+        match, candidates = index.match_fixture(fixture)
+        report.candidates += candidates
+        results.append(match)
+
+    taken = store.mapped_event_ids()
+    accepted = []
+    for match in sorted(results, key=lambda m: m.confidence, reverse=True):
+        if match.event is None or match.confidence < min_confidence or match.event.id in taken:
+            report.unmatched += 1
+        elif match.confidence - match.runner_up < ambiguity_margin:
+            report.ambiguous += 1
+        else:
+            accepted.append(match)
+            taken.add(match.event.id)
+            report.matched += 1
+            report.confidences.append(match.confidence)
+    store.save(accepted)
+    report.seconds = time.perf_counter() - start
+    return results, report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Match OpticOdds fixtures to Sportradar sport events")
+    parser.add_argument("--fixtures", type=Path, default=Path("australian_open_fixtures.json"))
+    parser.add_argument(
+        "--summaries",
+        type=Path,
+        nargs="+",
+        default=[Path("sr_season_summaries.json")],
+        help="Sportradar season/live summaries files",
+    )
+    parser.add_argument("--db", type=Path, default=Path("provider_mapping.sqlite"))
+    parser.add_argument("--min-confidence", type=float, default=DEFAULT_MIN_CONFIDENCE)
+    args = parser.parse_args()
+
+    with open(args.fixtures) as f:
+        fixtures = json.load(f)
+    summaries = []
+    for path in args.summaries:
+        with open(path) as f:
+            summaries.extend(json.load(f).get("summaries", []))
+
+    index = MatchIndex.from_summaries(summaries)
+    with MatchStore(args.db) as store:
+        _, report = match_fixtures(index, store, fixtures, min_confidence=args.min_confidence)
+        print(f"{len(index.events)} Sportradar events indexed")
+        print(report.summary())
+        print(f"Mapping: {store.summary()}")
+
+
+if __name__ == "__main__":
+    main()
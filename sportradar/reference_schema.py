@@ -75,3 +75,100 @@ def seasons_row_to_bq(season: dict, generated_at: str | None = None) -> dict:
         "competition_id": season.get("competition_id"),
         "generated_at": generated_at,
     }
+
+
+# --- Per-player-per-match statistics (from season summaries) ----------------------
+
+MATCH_STAT_FIELDS = [
+    "aces",
+    "double_faults",
+    "breakpoints_won",
+    "total_breakpoints",
+    "games_won",
+    "service_games_won",
+    "points_won",
+    "service_points_won",
+    "service_points_lost",
+    "first_serve_successful",
+    "first_serve_points_won",
+    "second_serve_successful",
+    "second_serve_points_won",
+    "tiebreaks_won",
+    "max_games_in_a_row",
+    "max_points_in_a_row",
+]
+PLAYER_STATS_PARTITION_FIELD = "start_time"
+PLAYER_STATS_CLUSTERING_FIELDS = ["competition_id", "competitor_id"]
+
+
+def get_match_player_stats_table_schema() -> list[bigquery.SchemaField]:
+    """
+    Schema for the per-player-per-match stats table. One row per competitor per
+    sport event, flattened from statistics.totals.competitors of a season summary.
+    id is "<sport_event_id>:<competitor_id>".
+    """
+    return [
+        bigquery.SchemaField("id", "STRING", mode="REQUIRED"),
+        bigquery.SchemaField("sport_event_id", "STRING", mode="REQUIRED"),
+        bigquery.SchemaField("start_time", "TIMESTAMP", mode="NULLABLE"),
+        bigquery.SchemaField("category_id", "STRING", mode="NULLABLE"),
+        bigquery.SchemaField("competition_id", "STRING", mode="NULLABLE"),
+        bigquery.SchemaField("competition_name", "STRING", mode="NULLABLE"),
+        bigquery.SchemaField("season_id", "STRING", mode="NULLABLE"),
+        bigquery.SchemaField("stage_phase", "STRING", mode="NULLABLE"),
+        bigquery.SchemaField("round_name", "STRING", mode="NULLABLE"),
+        bigquery.SchemaField("status", "STRING", mode="NULLABLE"),
+        bigquery.SchemaField("match_status", "STRING", mode="NULLABLE"),
+        bigquery.SchemaField("competitor_id", "STRING", mode="REQUIRED"),
+        bigquery.SchemaField("competitor_name", "STRING", mode="NULLABLE"),
+        bigquery.SchemaField("qualifier", "STRING", mode="NULLABLE"),
+        bigquery.SchemaField("opponent_id", "STRING", mode="NULLABLE"),
+        bigquery.SchemaField("opponent_name", "STRING", mode="NULLABLE"),
+        bigquery.SchemaField("is_winner", "BOOLEAN", mode="NULLABLE"),
+        bigquery.SchemaField("sets_won", "INTEGER", mode="NULLABLE"),
+        *[bigquery.SchemaField(name, "INTEGER", mode="NULLABLE") for name in MATCH_STAT_FIELDS],
+        bigquery.SchemaField("generated_at", "TIMESTAMP", mode="NULLABLE"),
+    ]
+
+
+def match_player_stats_rows(summary: dict, generated_at: str | None = None) -> list[dict]:
+    """
+    Flatten one season summary into a row per competitor. Summaries without
+    statistics (not started, cancelled, walkovers) yield no rows.
+    """
+    competitors = ((summary.get("statistics") or {}).get("totals") or {}).get("competitors") or []
+    if not competitors:
+        return []
+    event = summary.get("sport_event") or {}
+    context = event.get("sport_event_context") or {}
+    status = summary.get("sport_event_status") or {}
+    score = {"home": status.get("home_score"), "away": status.get("away_score")}
+    rows = []
+    for competitor in competitors:
+        opponent = next((c for c in competitors if c.get("id") != competitor.get("id")), {})
+        stats = competitor.get("statistics") or {}
+        row = {
+            "id": f"{event.get('id')}:{competitor.get('id')}",
+            "sport_event_id": event.get("id"),
+            "start_time": event.get("start_time"),
+            "category_id": (context.get("category") or {}).get("id"),
+            "competition_id": (context.get("competition") or {}).get("id"),
+            "competition_name": (context.get("competition") or {}).get("name"),
+            "season_id": (context.get("season") or {}).get("id"),
+            "stage_phase": (context.get("stage") or {}).get("phase"),
+            "round_name": (context.get("round") or {}).get("name"),
+            "status": status.get("status"),
+            "match_status": status.get("match_status"),
+            "competitor_id": competitor.get("id"),
+            "competitor_name": competitor.get("name"),
+            "qualifier": competitor.get("qualifier"),
+            "opponent_id": opponent.get("id"),
+            "opponent_name": opponent.get("name"),
+            "is_winner": competitor.get("id") == status.get("winner_id") if status.get("winner_id") else None,
+            "sets_won": score.get(competitor.get("qualifier")),
+            "generated_at": generated_at,
+        }
+        for name in MATCH_STAT_FIELDS:
+            row[name] = stats.get(name)
+        rows.append(row)
+    return rows
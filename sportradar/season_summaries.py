@@ -0,0 +1,200 @@
+"""
+Bulk Sportradar season-summary ingestion: competitions -> filtered seasons -> per-player
+match stats.
+
+- ReferenceIndex: competitions and seasons indexed by category and competition id, so
+  the category filter in bigquery/category_filter_guide.md is a few dict lookups.
+- SeasonCheckpoint: SQLite record of which seasons are finished and which sport events
+  have been written. A season whose end_date has passed is fetched once; ongoing or
+  failed seasons are fetched again on the next run, and only their newly closed
+  matches are written.
+- ingest_season_stats: fans out over the pending seasons through an
+  AsyncSportradarClient (QPS-limited), flattens statistics.totals.competitors with
+  match_player_stats_rows and hands each season's rows to a writer.
+"""
+
+import asyncio
+import sqlite3
+from collections import defaultdict
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from sportradar.reference_schema import match_player_stats_rows
+
+# ATP, WTA, Davis Cup, Billie Jean King Cup (see bigquery/category_filter_guide.md).
+TARGET_CATEGORY_IDS = ("sr:category:3", "sr:category:6", "sr:category:76", "sr:category:74")
+CLOSED_STATUSES = frozenset({"closed", "ended"})
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS seasons (
+    id          TEXT PRIMARY KEY,
+    end_date    TEXT,
+    final       INTEGER NOT NULL,
+    summaries   INTEGER NOT NULL,
+    rows        INTEGER NOT NULL,
+    fetched_at  TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS matches (
+    sport_event_id TEXT PRIMARY KEY,
+    season_id      TEXT NOT NULL,
+    written_at     TEXT NOT NULL
+);
+"""
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+class ReferenceIndex:
+    """Competitions and seasons indexed for category -> competitions -> seasons lookups."""
+
+    def __init__(self, competitions: Iterable[dict], seasons: Iterable[dict]) -> None:
+        self.competitions: dict[str, dict] = {}
+        self.competitions_by_category: dict[str, set[str]] = defaultdict(set)
+        for competition in competitions:
+            self.competitions[competition["id"]] = competition
+            category_id = (competition.get("category") or {}).get("id")
+            self.competitions_by_category[category_id].add(competition["id"])
+        self.seasons_by_competition: dict[str, list[dict]] = defaultdict(list)
+        for season in seasons:
+            self.seasons_by_competition[season.get("competition_id")].append(season)
+
+    def competition_ids(self, category_ids: Iterable[str] = TARGET_CATEGORY_IDS) -> set[str]:
+        return set().union(*(self.competitions_by_category.get(c, set()) for c in category_ids))
+
+    def seasons(
+        self,
+        category_ids: Iterable[str] = TARGET_CATEGORY_IDS,
+        min_year: int | None = None,
+    ) -> list[dict]:
+        """Seasons of competitions in the given categories, optionally from min_year on."""
+        seasons = [
+            season
+            for competition_id in sorted(self.competition_ids(category_ids))
+            for season in self.seasons_by_competition.get(competition_id, [])
+        ]
+        if min_year is not None:
+            seasons = [s for s in seasons if s.get("year") and int(s["year"][:4]) >= min_year]
+        return seasons
+
+
+class SeasonCheckpoint:
+    """SQLite-backed record of finished seasons and written sport events."""
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def __enter__(self) -> "SeasonCheckpoint":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def pending(self, seasons: Iterable[dict]) -> list[dict]:
+        """Seasons that are new, failed, or were still in progress when last fetched."""
+        final = {row[0] for row in self._conn.execute("SELECT id FROM seasons WHERE final = 1")}
+        return [s for s in seasons if s["id"] not in final]
+
+    def written_matches(self, season_id: str) -> set[str]:
+        return {
+            row[0]
+            for row in self._conn.execute("SELECT sport_event_id FROM matches WHERE season_id = ?", (season_id,))
+        }
+
+    def mark_season(
+        self,
+        season: dict,
+        summaries: int,
+        rows: int,
+        match_ids: Iterable[str],
+        today: date | None = None,
+    ) -> bool:
+        """Record a fetched season and its written matches; returns whether it is final."""
+        today = today or datetime.now(timezone.utc).date()
+        end_date = season.get("end_date")
+        final = bool(end_date) and date.fromisoformat(end_date) < today
+        now = _now()
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO matches (sport_event_id, season_id, written_at) VALUES (?, ?, ?)",
+            [(match_id, season["id"], now) for match_id in match_ids],
+        )
+        self._conn.execute(
+            """
+            INSERT INTO seasons (id, end_date, final, summaries, rows, fetched_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+                end_date = excluded.end_date,
+                final = excluded.final,
+                summaries = excluded.summaries,
+                rows = seasons.rows + excluded.rows,
+                fetched_at = excluded.fetched_at
+            """,
+            (season["id"], end_date, int(final), summaries, rows, now),
+        )
+        self._conn.commit()
+        return final
+
+    def summary(self) -> dict[str, int]:
+        seasons, final, rows = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(final), 0), COALESCE(SUM(rows), 0) FROM seasons"
+        ).fetchone()
+        matches = self._conn.execute("SELECT COUNT(*) FROM matches").fetchone()[0]
+        return {"seasons": seasons, "final": final, "matches": matches, "rows": rows}
+
+
+async def ingest_season_stats(
+    client: Any,
+    checkpoint: SeasonCheckpoint,
+    seasons: Iterable[dict],
+    write: Callable[[list[dict]], Any],
+) -> dict[str, int]:
+    """
+    Fetch summaries for every pending season concurrently and write per-player rows
+    for closed matches not written before. `write` is a blocking callable (e.g. a
+    ParallelWriter's write) and runs in a worker thread while other fetches continue.
+    A season is checkpointed only after its rows were written; a failed season is
+    reported and left pending.
+    """
+    pending = checkpoint.pending(seasons)
+    counts = {"seasons": len(pending), "fetched": 0, "failed": 0, "matches": 0, "rows": 0}
+    tasks = {asyncio.create_task(client.get_season_summaries(s["id"])): s for s in pending}
+    try:
+        async for task in asyncio.as_completed(tasks):
+            season = tasks[task]
+            try:
+                payload = task.result()
+            except RuntimeError as e:
+                counts["failed"] += 1
+                print(f"  {season['id']}: failed ({e})")
+                continue
+            written = checkpoint.written_matches(season["id"])
+            rows, match_ids = [], []
+            for summary in payload.get("summaries", []):
+                event_id = (summary.get("sport_event") or {}).get("id")
+                status = (summary.get("sport_event_status") or {}).get("status")
+                if event_id in written or status not in CLOSED_STATUSES:
+                    continue
+                rows.extend(match_player_stats_rows(summary, payload.get("generated_at")))
+                match_ids.append(event_id)
+            if rows:
+                await asyncio.to_thread(write, rows)
+            final = checkpoint.mark_season(season, len(payload.get("summaries", [])), len(rows), match_ids)
+            counts["fetched"] += 1
+            counts["matches"] += len(match_ids)
+            counts["rows"] += len(rows)
+            print(
+                f"  {season['id']} ({season.get('name')}): {len(match_ids)} new matches, "
+                f"{len(rows)} rows{'' if final else ' (in progress)'}"
+            )
+    finally:
+        for task in tasks:
+            task.cancel()
+    return counts
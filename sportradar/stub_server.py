@@ -0,0 +1,117 @@
+"""
+Local stub of the Sportradar Tennis endpoints, for exercising AsyncSportradarClient and
+the season-summary ingestion without an API key or quota.
+
+Serves competitions.json, seasons.json and seasons/{id}/summaries.json (start/limit
+paging) from the checked-in sr_season_summaries.json: the recorded season is cloned
+`seasons` times under new season and sport event ids, so a bulk pull can be made as
+large as needed. Latency, the server-side rate limit (429 + Retry-After) and the random
+503 rate work as in opticodds.stub_server, which this reuses:
+
+    with StubSportradarServer.from_recorded(seasons=20, latency=0.05) as server:
+        async with AsyncSportradarClient(api_key="test", base_url=server.base_url, cache=False) as client:
+            ...
+
+Or standalone from project root:
+  uv run python -m sportradar.stub_server --port 8766 --seasons 20 --latency 0.05
+"""
+
+import argparse
+import copy
+import json
+import re
+from pathlib import Path
+
+from opticodds.stub_server import StubOpticOddsServer
+
+ROOT = Path(__file__).resolve().parent.parent
+SEASON_ID_BASE = 900_000
+
+
+class StubSportradarServer(StubOpticOddsServer):
+    """StubOpticOddsServer serving Sportradar reference and season-summary endpoints instead."""
+
+    def __init__(
+        self,
+        competitions: list[dict],
+        seasons: list[dict],
+        summaries_by_season: dict[str, list[dict]],
+        generated_at: str | None = None,
+        **kwargs,
+    ) -> None:
+        super().__init__([], {}, **kwargs)
+        self.competitions = competitions
+        self.seasons = seasons
+        self.summaries_by_season = summaries_by_season
+        self.generated_at = generated_at
+
+    @classmethod
+    def from_recorded(cls, seasons: int = 10, **kwargs) -> "StubSportradarServer":
+        """
+        Build a stub from sr_season_summaries.json with `seasons` copies of the recorded
+        season; sport event ids are re-keyed per copy so every match is distinct.
+        """
+        with open(ROOT / "sr_season_summaries.json") as f:
+            recorded = json.load(f)
+        template = recorded["summaries"]
+        context = template[0]["sport_event"]["sport_event_context"]
+        base_season = context["season"]
+        competitions = [context["competition"]]
+        season_list, summaries_by_season = [], {}
+        for i in range(seasons):
+            season_id = f"sr:season:{SEASON_ID_BASE + i}"
+            season = {**base_season, "id": season_id}
+            season_list.append(season)
+            summaries = []
+            for summary in template:
+                summary = copy.deepcopy(summary)
+                event = summary["sport_event"]
+                event["id"] = f"{event['id']}:{i}"
+                event["sport_event_context"]["season"] = season
+                summaries.append(summary)
+            summaries_by_season[season_id] = summaries
+        return cls(competitions, season_list, summaries_by_season, recorded.get("generated_at"), **kwargs)
+
+    def _route(self, path: str, params: dict[str, list[str]]) -> tuple[int, dict]:
+        if path.endswith("/competitions.json"):
+            return 200, {"generated_at": self.generated_at, "competitions": self.competitions}
+        if path.endswith("/seasons.json"):
+            return 200, {"generated_at": self.generated_at, "seasons": self.seasons}
+        match = re.search(r"/seasons/([^/]+)/summaries\.json$", path)
+        if match:
+            summaries = self.summaries_by_season.get(match.group(1))
+            if summaries is None:
+                return 404, {"message": f"Unknown season {match.group(1)}"}
+            start = int((params.get("start") or ["0"])[0])
+            limit = int((params.get("limit") or ["200"])[0])
+            return 200, {"generated_at": self.generated_at, "summaries": summaries[start : start + limit]}
+        return 404, {"message": f"Unknown path {path}"}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run a local Sportradar stub server")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--seasons", type=int, default=10, help="Copies of the recorded season to serve")
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds added to every response")
+    parser.add_argument("--rate-limit", type=float, default=None, help="Requests per second before 429")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered 503")
+    args = parser.parse_args()
+
+    server = StubSportradarServer.from_recorded(
+        seasons=args.seasons,
+        latency=args.latency,
+        rate_limit=args.rate_limit,
+        error_rate=args.error_rate,
+        port=args.port,
+    )
+    print(f"Serving Sportradar stub at {server.base_url} (Ctrl+C to stop)")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+bigquery.load_job.load_rows and bigquery.client.write_rows against
+benchmarks.fake_bigquery.FakeBigQueryClient, which decodes the staged NDJSON / Parquet
+file the way a load job would. write_rows goes through get_client(), so those tests
+install the fake as the process-wide client.
+
+Run from project root:
+  uv run --with pytest python -m pytest tests
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+from google.cloud import bigquery
+
+from benchmarks.fake_bigquery import FakeBigQueryClient, install
+from bigquery.client import write_rows
+from bigquery.load_job import load_rows
+
+TABLE_ID = "project.dataset.odds"
+SCHEMA = [
+    bigquery.SchemaField("id", "STRING"),
+    bigquery.SchemaField("price", "FLOAT64"),
+    bigquery.SchemaField("points", "FLOAT64"),
+    bigquery.SchemaField("is_main", "BOOLEAN"),
+    bigquery.SchemaField("observed_at", "TIMESTAMP"),
+]
+ROWS = [
+    {"id": "a", "price": -110.0, "points": 2.5, "is_main": True, "observed_at": "2026-01-18T01:00:00+00:00"},
+    {"id": "b", "price": 150.0, "points": None, "is_main": False, "observed_at": "2026-01-18T01:05:30+00:00"},
+    {"id": "c", "price": None, "points": -1.5, "is_main": None, "observed_at": None},
+]
+
+
+class RecordingClient(FakeBigQueryClient):
+    """FakeBigQueryClient that also keeps the job_config of every load job."""
+
+    def __init__(self, schemas: dict[str, list] | None = None) -> None:
+        super().__init__(keep_rows=True, schemas=schemas)
+        self.job_configs: list[bigquery.LoadJobConfig] = []
+
+    def load_table_from_file(self, file_obj, destination, job_config=None, **kwargs):
+        self.job_configs.append(job_config)
+        return super().load_table_from_file(file_obj, destination, job_config=job_config, **kwargs)
+
+
+def test_ndjson_rows_round_trip():
+    client = RecordingClient()
+    stats = load_rows(client, iter(ROWS), TABLE_ID)
+    assert stats.rows == len(ROWS)
+    assert stats.job_id
+    assert stats.input_file_bytes == stats.staged_bytes
+    assert client.rows[TABLE_ID] == len(ROWS)
+    assert client.data[TABLE_ID] == ROWS
+    assert client.job_configs[0].source_format == bigquery.SourceFormat.NEWLINE_DELIMITED_JSON
+
+
+def test_parquet_rows_round_trip():
+    client = RecordingClient()
+    stats = load_rows(client, iter(ROWS), TABLE_ID, source_format="parquet", schema=SCHEMA)
+    assert stats.rows == len(ROWS)
+    assert client.rows[TABLE_ID] == len(ROWS)
+    assert client.data[TABLE_ID] == [
+        {**row, "observed_at": datetime.fromisoformat(row["observed_at"]) if row["observed_at"] else None}
+        for row in ROWS
+    ]
+    assert client.data[TABLE_ID][0]["observed_at"].tzinfo is not None
+    assert client.job_configs[0].source_format == bigquery.SourceFormat.PARQUET
+    assert [f.name for f in client.job_configs[0].schema] == [f.name for f in SCHEMA]
+
+
+def test_parquet_reads_schema_from_table():
+    client = RecordingClient(schemas={TABLE_ID: SCHEMA})
+    stats = load_rows(client, ROWS, TABLE_ID, source_format="parquet")
+    assert stats.rows == len(ROWS)
+    assert client.requests["get_table"] == 1
+    assert [row["id"] for row in client.data[TABLE_ID]] == ["a", "b", "c"]
+
+
+@pytest.mark.parametrize("source_format", ["ndjson", "parquet"])
+def test_empty_input_runs_no_job(source_format):
+    client = RecordingClient()
+    stats = load_rows(client, [], TABLE_ID, source_format=source_format, write_disposition="WRITE_TRUNCATE", schema=SCHEMA)
+    assert stats.job_id == ""
+    assert stats.rows == 0
+    assert client.requests["load_table_from_file"] == 0
+    assert client.job_configs == []
+
+
+@pytest.mark.parametrize("source_format", ["ndjson", "parquet"])
+def test_write_disposition_passed_through(source_format):
+    client = RecordingClient()
+    load_rows(client, ROWS, TABLE_ID, source_format=source_format, write_disposition="WRITE_TRUNCATE", schema=SCHEMA)
+    assert client.job_configs[0].write_disposition == "WRITE_TRUNCATE"
+
+
+def test_rejects_unknown_options():
+    client = RecordingClient()
+    with pytest.raises(ValueError):
+        load_rows(client, ROWS, TABLE_ID, source_format="csv")
+    with pytest.raises(ValueError):
+        load_rows(client, ROWS, TABLE_ID, write_disposition="WRITE_IF_EMPTY")
+    assert client.requests["load_table_from_file"] == 0
+
+
+class FailingInsertClient(FakeBigQueryClient):
+    """FakeBigQueryClient whose streaming inserts report a row error."""
+
+    def insert_rows_json(self, table, json_rows, row_ids=None, **kwargs):
+        super().insert_rows_json(table, json_rows, row_ids, **kwargs)
+        return [{"index": 0, "errors": [{"reason": "invalid", "message": "no such field: bogus"}]}]
+
+
+def test_write_rows_stream_inserts():
+    with install(FakeBigQueryClient(keep_rows=True)) as client:
+        written = write_rows(iter(ROWS), TABLE_ID)
+    assert written == len(ROWS)
+    assert client.requests["insert_rows_json"] == 1
+    assert client.requests["load_table_from_file"] == 0
+    assert client.data[TABLE_ID] == ROWS
+
+
+def test_write_rows_stream_raises_on_insert_errors():
+    with install(FailingInsertClient()):
+        with pytest.raises(RuntimeError, match="no such field"):
+            write_rows(ROWS, TABLE_ID)
+
+
+@pytest.mark.parametrize("source_format", ["ndjson", "parquet"])
+def test_write_rows_batch_runs_one_load_job(source_format):
+    with install(RecordingClient(schemas={TABLE_ID: SCHEMA})) as client:
+        written = write_rows(
+            iter(ROWS), TABLE_ID, mode="batch", source_format=source_format, write_disposition="WRITE_TRUNCATE"
+        )
+    assert written == len(ROWS)
+    assert client.requests["load_table_from_file"] == 1
+    assert client.requests["insert_rows_json"] == 0
+    assert [row["id"] for row in client.data[TABLE_ID]] == ["a", "b", "c"]
+    assert client.job_configs[0].write_disposition == "WRITE_TRUNCATE"
+
+
+def test_write_rows_rejects_unknown_mode():
+    with install(FakeBigQueryClient()) as client:
+        with pytest.raises(ValueError):
+            write_rows(ROWS, TABLE_ID, mode="merge")
+    assert not client.requests